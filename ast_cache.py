@@ -0,0 +1,181 @@
+import hashlib
+import marshal
+import os
+import sys
+import lexer
+import parser
+import pratt
+import semantic_analyzer
+import syntax_tree
+from syntax_tree import Node
+from lexer import Token
+
+# Formato de las entradas; cambia si cambia encode_ast
+FORMAT_VERSION = 2
+
+# Tamaño máximo del directorio de la caché
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+DEFAULT_CACHE_DIR = os.environ.get('JS_AST_CACHE_DIR',
+                                   os.path.join(os.path.expanduser('~'), '.cache', 'compilador-js', 'ast'))
+
+# Atributos del nodo que calcula el intérprete al ejecutar: no se guardan
+RUNTIME_ATTRIBUTES = ('children', 'operator', 'cache')
+NODE_ATTRIBUTES = [name for name in Node.__slots__ if name not in RUNTIME_ATTRIBUTES + ('__weakref__',)]
+
+def module_version(*modules):
+    # Hash del código de los módulos: cualquier cambio en la gramática, en la
+    # construcción de los nodos o en el análisis invalida las entradas
+    digest = hashlib.sha256()
+    for module in modules:
+        with open(module.__file__, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+GRAMMAR_VERSION = module_version(lexer, parser, pratt, syntax_tree)
+ANALYZER_VERSION = module_version(semantic_analyzer)
+
+def encode_children(item, ids):
+    # Los nodos se guardan como su índice en la tabla de nodos. Los hijos no
+    # contienen números sueltos, así un int siempre es un nodo
+    if isinstance(item, Node):
+        return ids[id(item)]
+    if isinstance(item, list):
+        return [encode_children(child, ids) for child in item]
+    if isinstance(item, tuple):
+        return tuple(encode_children(child, ids) for child in item)
+    if item is None or isinstance(item, str):
+        return item
+    raise TypeError(f"Hijo no serializable: {item!r}")
+
+def decode_children(item, nodes):
+    if isinstance(item, int):
+        return nodes[item]
+    if isinstance(item, list):
+        return [decode_children(child, nodes) for child in item]
+    if isinstance(item, tuple):
+        return tuple(decode_children(child, nodes) for child in item)
+    return item
+
+def encode_ast(ast):
+    # Tabla plana de (atributos, hijos), con la raíz en el índice 0. Se recorre
+    # con una pila explícita: un árbol muy profundo no agota la pila de Python
+    order = []
+    ids = {}
+    pending = [ast]
+    while pending:
+        item = pending.pop()
+        if isinstance(item, (list, tuple)):
+            pending.extend(item)
+        elif isinstance(item, Node) and id(item) not in ids:
+            ids[id(item)] = len(order)
+            order.append(item)
+            pending.extend(item.children)
+    records = []
+    for node in order:
+        attributes = {name: getattr(node, name) for name in NODE_ATTRIBUTES}
+        records.append((attributes, encode_children(node.children, ids)))
+    return records
+
+def decode_ast(records):
+    nodes = []
+    for attributes, _ in records:
+        node = Node.__new__(Node)
+        for name, value in attributes.items():
+            setattr(node, name, value)
+        node.operator = None
+        node.cache = None
+        nodes.append(node)
+    for node, (_, children) in zip(nodes, records):
+        node.children = decode_children(children, nodes)
+    return nodes[0]
+
+# Caché en disco de programas ya analizados. La clave es el hash del código,
+# de la versión de la gramática y de la del analizador semántico; la entrada
+# guarda los tokens y el AST validado, antes de optimizar. Un acierto evita
+# el análisis léxico, el sintáctico y el semántico. Solo se guardan programas
+# sin errores. Al pasar de max_bytes se borran las entradas usadas hace más
+# tiempo (la fecha de modificación se actualiza en cada acierto).
+class ASTCache:
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, source):
+        digest = hashlib.sha256()
+        for part in (str(FORMAT_VERSION), GRAMMAR_VERSION, ANALYZER_VERSION, sys.implementation.cache_tag):
+            digest.update(part.encode('utf-8') + b'\0')
+        digest.update(source.encode('utf-8'))
+        return digest.hexdigest()
+
+    def path(self, source):
+        return os.path.join(self.directory, self.key(source) + '.ast')
+
+    def load(self, source):
+        # Devuelve (tokens, ast) o None si el programa no está en la caché
+        path = self.path(source)
+        try:
+            with open(path, 'rb') as f:
+                tokens, records = marshal.loads(f.read())
+            ast = decode_ast(records)
+            os.utime(path)
+        except (OSError, EOFError, ValueError, TypeError, IndexError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return [Token(*token) for token in tokens], ast
+
+    def store(self, source, tokens, ast):
+        try:
+            data = marshal.dumps(([(token.type, token.value, token.lineno, token.lexpos, token.column)
+                                   for token in tokens], encode_ast(ast)))
+        except (TypeError, ValueError):
+            # Un valor que marshal no admite: el programa simplemente no se guarda
+            return False
+        path = self.path(source)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temporary, 'wb') as f:
+                f.write(data)
+            # El reemplazo atómico evita que otro proceso lea una entrada a medias
+            os.replace(temporary, path)
+        except OSError:
+            return False
+        self.evict()
+        return True
+
+    def evict(self):
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self.directory) as scan:
+                for entry in scan:
+                    if entry.name.endswith('.ast'):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+                        total += stat.st_size
+        except OSError:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.evictions += 1
+
+    def clear(self):
+        try:
+            with os.scandir(self.directory) as scan:
+                for entry in scan:
+                    if entry.name.endswith('.ast'):
+                        os.remove(entry.path)
+        except OSError:
+            pass
@@ -0,0 +1,21 @@
+from interpreter import Interpreter
+from closure_compiler import ClosureInterpreter
+from bytecode_vm import BytecodeInterpreter
+from python_codegen import PythonInterpreter
+from tiered import TieredInterpreter
+
+# Backends de ejecución disponibles, seleccionables por nombre
+BACKENDS = {
+    'tree': Interpreter,
+    'closure': ClosureInterpreter,
+    'bytecode': BytecodeInterpreter,
+    'python': PythonInterpreter,
+    'tiered': TieredInterpreter,
+}
+
+DEFAULT_BACKEND = 'tree'
+
+def create_interpreter(name=DEFAULT_BACKEND):
+    if name not in BACKENDS:
+        raise ValueError(f"Backend '{name}' desconocido. Opciones: {', '.join(BACKENDS)}")
+    return BACKENDS[name]()
@@ -0,0 +1,215 @@
+import argparse
+import contextlib
+import gc
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from parser import parser, lalr_parser, pratt_parser
+from interpreter import resolve_program, MemoCache
+from backends import BACKENDS
+from optimizer import Optimizer
+from fusion import Fuser
+from purity import PurityAnalyzer
+from profiler import format_table
+from lexer import tokenize, ply_lexer, Scanner
+
+# Programa por defecto: ciclos anidados con aritmética y llamadas a funciones
+DEFAULT_PROGRAM = '''
+function suma(a, b) {
+    let r = a + b;
+}
+let total = 0;
+for (let i = 0; i < 300; i = i + 1) {
+    for (let j = 0; j < 100; j = j + 1) {
+        total = total + i * j - j / 2;
+    }
+    suma(total, i);
+}
+'''
+
+def run_backend(name, ast, memoize=False):
+    interpreter = BACKENDS[name]()
+    if memoize:
+        interpreter.memo = MemoCache()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        interpreter.interpret(ast)
+    return time.perf_counter() - start
+
+def benchmark(code, backends, repeat, optimize=True, memoize=False):
+    ast = parser.parse(code)
+    if ast is None:
+        raise SyntaxError("No se pudo generar el AST")
+    if optimize:
+        resolve_program(ast)
+        ast = Optimizer().optimize(ast)
+        ast = Fuser().fuse(ast)
+    if memoize:
+        resolve_program(ast)
+        PurityAnalyzer().analyze(ast)
+    results = {}
+    for name in backends:
+        results[name] = min(run_backend(name, ast, memoize) for _ in range(repeat))
+    return results
+
+# Proceso que importa el front end. Además del tiempo total mide la
+# importación de lexer.py y parser.py con lo que importan ellos, sin la de PLY
+STARTUP_SCRIPT = """
+import time
+import ply.lex, ply.yacc, re, zlib
+start = time.perf_counter()
+import parser
+print(time.perf_counter() - start)
+"""
+
+# El arranque de antes de las tablas congeladas: lex.lex() y yacc.yacc() con
+# los valores de siempre, que revisan la gramática, escriben parsetab.py y
+# vuelcan parser.out. build_parser() hace esa llamada sin escribir nada; acá
+# se le devuelven debug y write_tables
+ORIGINAL_STARTUP_SCRIPT = """
+import sys
+import ply.yacc
+yacc = ply.yacc.yacc
+def original_yacc(**options):
+    return yacc(module=sys.modules['parser'], **dict(options, debug=True, write_tables=True))
+ply.yacc.yacc = original_yacc
+""" + STARTUP_SCRIPT
+
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+GENERATED_TABLES = ('lextab.py', 'parsetab.py')
+
+def copy_sources(directory):
+    # Las fuentes sin las tablas generadas: PLY no tiene un parsetab.py que reusar
+    for name in os.listdir(SOURCE_DIR):
+        if name.endswith('.py') and name not in GENERATED_TABLES:
+            shutil.copy(os.path.join(SOURCE_DIR, name), directory)
+
+def run_startup(script, env, cwd):
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-c', script], env=env, check=True,
+                            capture_output=True, text=True, cwd=cwd)
+    return time.perf_counter() - start, float(result.stdout)
+
+def startup_time(frozen, repeat):
+    # Tablas congeladas, o el arranque original en un directorio temporal
+    # limpio en cada repetición, como la primera vez que se importaba
+    env = dict(os.environ, JS_LEXER='ply', JS_PARSER='ply', JS_FROZEN_TABLES='1' if frozen else '0')
+    results = []
+    for _ in range(repeat):
+        if frozen:
+            results.append(run_startup(STARTUP_SCRIPT, env, SOURCE_DIR))
+            continue
+        with tempfile.TemporaryDirectory() as directory:
+            copy_sources(directory)
+            results.append(run_startup(ORIGINAL_STARTUP_SCRIPT, env, directory))
+    return min(total for total, _ in results), min(build for _, build in results)
+
+def benchmark_startup(repeat):
+    rows = []
+    baseline = None
+    for name, frozen in (('PLY original', False), ('congeladas', True)):
+        total, build = startup_time(frozen, repeat)
+        baseline = baseline or build
+        rows.append([name, f"{total * 1000:.2f} ms", f"{build * 1000:.2f} ms", f"{baseline / build:.2f}x"])
+    print(format_table("Arranque del front end", ['tablas', 'proceso', 'lexer y parser', 'speedup'], rows))
+
+# Tamaño del código para medir los lexers: el programa se repite hasta llegar
+LEX_BENCH_BYTES = 2 * 1024 * 1024
+
+def benchmark_lexers(code, repeat):
+    source = code * max(1, LEX_BENCH_BYTES // len(code))
+    megabytes = len(source.encode('utf-8')) / (1024 * 1024)
+    rows = []
+    baseline = None
+    for name, lexer in (('ply', ply_lexer()), ('scanner', Scanner())):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            count = len(tokenize(source, lexer))
+            times.append(time.perf_counter() - start)
+        elapsed = min(times)
+        baseline = baseline or elapsed
+        rows.append([name, count, f"{elapsed * 1000:.2f} ms", f"{megabytes / elapsed:.2f} MB/s",
+                     f"{baseline / elapsed:.2f}x"])
+    print(format_table(f"Análisis léxico de {megabytes:.2f} MB", ['lexer', 'tokens', 'tiempo', 'velocidad', 'speedup'],
+                       rows))
+
+PARSE_BENCH_BYTES = 512 * 1024
+
+def timed(function, repeat):
+    times = []
+    for _ in range(repeat):
+        # Como timeit, sin el recolector: con árboles de millones de nodos el
+        # tiempo depende de cuándo cae una recolección completa
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            function()
+            times.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return min(times)
+
+def benchmark_parsers(code, repeat):
+    source = code * max(1, PARSE_BENCH_BYTES // len(code))
+    kilobytes = len(source.encode('utf-8')) / 1024
+    lexing = timed(lambda: tokenize(source, Scanner()), repeat)
+    rows = []
+    baseline = None
+    for name, candidate in (('ply', lalr_parser), ('pratt', pratt_parser)):
+        elapsed = timed(lambda: candidate.parse(source, lexer=Scanner()), repeat)
+        baseline = baseline or elapsed
+        rows.append([name, f"{elapsed * 1000:.2f} ms", f"{(elapsed - lexing) * 1000:.2f} ms",
+                     f"{kilobytes / elapsed:.0f} KB/s", f"{baseline / elapsed:.2f}x"])
+    print(format_table(f"Análisis sintáctico de {kilobytes:.0f} KB (el Scanner solo: {lexing * 1000:.2f} ms)",
+                       ['parser', 'tiempo', 'sin el lexer', 'velocidad', 'speedup'], rows))
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Compara el tiempo de ejecución de los backends")
+    arg_parser.add_argument('file', nargs='?', help="Archivo JavaScript a ejecutar")
+    arg_parser.add_argument('--backend', action='append', choices=list(BACKENDS),
+                            help="Backend a medir (puede repetirse, por defecto todos)")
+    arg_parser.add_argument('--repeat', type=int, default=5, help="Número de repeticiones")
+    arg_parser.add_argument('--no-optimize', action='store_true', help="Medir el AST sin optimizar")
+    arg_parser.add_argument('--memoize', action='store_true', help="Guardar los resultados de las funciones puras")
+    arg_parser.add_argument('--startup', action='store_true',
+                            help="Medir el arranque del lexer y el parser en lugar de la ejecución")
+    arg_parser.add_argument('--lex', action='store_true',
+                            help="Comparar el lexer de PLY con Scanner sobre el programa repetido hasta 2 MB")
+    arg_parser.add_argument('--parse', action='store_true',
+                            help="Comparar el tiempo del parser LALR y el descendente")
+    args = arg_parser.parse_args()
+
+    if args.startup:
+        benchmark_startup(args.repeat)
+        return
+
+    if args.file:
+        with open(args.file, encoding='utf-8') as f:
+            code = f.read()
+    else:
+        code = DEFAULT_PROGRAM
+
+    if args.lex:
+        benchmark_lexers(code, args.repeat)
+        return
+
+    if args.parse:
+        benchmark_parsers(code, args.repeat)
+        return
+
+    results = benchmark(code, args.backend or list(BACKENDS), args.repeat, not args.no_optimize, args.memoize)
+    baseline = results.get('tree')
+    for name, elapsed in results.items():
+        line = f"{name:<10} {elapsed * 1000:10.2f} ms"
+        if baseline:
+            line += f"  ({baseline / elapsed:.2f}x)"
+        print(line)
+
+if __name__ == "__main__":
+    main()
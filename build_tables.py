@@ -0,0 +1,40 @@
+import os
+import re
+import sys
+import ply.yacc as yacc
+import lexer
+import parser
+from lexer import TABLES_DIR, LEXER_HASH
+from parser import GRAMMAR_HASH
+
+# Regenera lextab.py, parsetab.py y parser.out y les guarda el hash de las
+# fuentes que los generaron. Es el único paso que escribe las tablas: al
+# importar lexer.py y parser.py una tabla desactualizada se reemplaza por una
+# construcción en memoria. Se ejecuta después de cambiar lexer.py o parser.py.
+
+def stamp_table(module_name, digest):
+    # Guarda el hash de las fuentes al final de una tabla generada por PLY
+    path = os.path.join(TABLES_DIR, module_name + '.py')
+    with open(path, encoding='utf-8') as f:
+        text = re.sub(r"(?m)^_source_hash = .*\n", '', f.read())
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text + f"_source_hash = {digest!r}\n")
+
+def build_tables():
+    lexer.build_lexer().writetab('lextab', TABLES_DIR)
+    stamp_table('lextab', LEXER_HASH)
+    # Sin tabla previa, ni en disco ni ya importada, yacc.yacc() no puede
+    # reusarla y genera todo aunque la firma de la gramática no haya cambiado
+    path = os.path.join(TABLES_DIR, 'parsetab.py')
+    if os.path.exists(path):
+        os.remove(path)
+    sys.modules.pop('parsetab', None)
+    yacc.yacc(module=parser, outputdir=TABLES_DIR, tabmodule='parsetab')
+    stamp_table('parsetab', GRAMMAR_HASH)
+
+def main():
+    build_tables()
+    print(f"lextab.py ({LEXER_HASH}) y parsetab.py ({GRAMMAR_HASH}) regenerados en {TABLES_DIR}")
+
+if __name__ == "__main__":
+    main()
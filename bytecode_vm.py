@@ -0,0 +1,760 @@
+import weakref
+from interpreter import (Interpreter, Environment, Function, JSArray, JSObject, InlineCache, UNINITIALIZED,
+                         BINARY_OPERATORS, LOGICAL_OPERATORS, resolve_program, shape_for, get_element, load_property,
+                         load_method, call_method, INTEGER_OPERATORS, MIN_SAFE_INTEGER, MAX_SAFE_INTEGER,
+                         normalize_result, memo_key, format_output, switch_table, FUSED_NODES,
+                         STACK_OVERFLOW_MESSAGE, error_message)
+
+# Códigos de operación del bytecode
+OPCODES = [
+    'LOAD_CONST',         # arg: constante                     -> push
+    'LOAD_FAST',          # arg: slot del frame actual         -> push
+    'STORE_FAST',         # arg: slot del frame actual         pop
+    'UPDATE_FAST',        # arg: (slot, operador, constante)   x = x op k sin usar la pila
+    'LOAD_DEREF',         # arg: (profundidad, slot)           -> push
+    'STORE_DEREF',        # arg: (profundidad, slot)           pop
+    'LOAD_UNRESOLVED',    # arg: nombre sin dirección          error
+    'BINARY_OP',          # arg: función del operador          pop 2, push
+    'INTEGER_OP',         # arg: operador de C (+, -, *)       pop 2, push
+    'NOT',                #                                    pop, push
+    'POP_JUMP_IF_FALSE',  # arg: destino                       pop
+    'JUMP_IF_FALSE_OR_POP',  # arg: destino, deja el valor si salta
+    'JUMP_IF_TRUE_OR_POP',   # arg: destino, deja el valor si salta
+    'JUMP',               # arg: destino
+    'JUMP_BACKWARD',      # arg: inicio del ciclo, descuenta un paso del presupuesto
+    'JUMP_TABLE',         # arg: (valor -> destino, destino por defecto)  pop
+    'POP_TOP',            #                                    pop
+    'DUP_TOP',            #                                    push
+    'LOAD_INDEX',         # arg: nombre del array              pop 2, push
+    'LOAD_PROPERTY',      # arg: caché en línea de la propiedad  pop, push
+    'LOAD_FUNCTION',      # arg: nodo Identifier de la función -> push
+    'CALL_FUNCTION',      # arg: n. de argumentos              pop n + 1, push
+    'TAIL_CALL',          # arg: n. de argumentos              pop n + 1
+    'CALL_METHOD',        # arg: (caché del método, n. de argumentos)  pop n + 1, push
+    'CONSOLE_LOG',        # arg: n. de argumentos              pop n, push
+    'BUILD_LIST',         # arg: n. de elementos               pop n, push
+    'BUILD_OBJECT',       # arg: forma del objeto              pop n, push
+    'MAKE_FUNCTION',      # arg: (nombre, nodo, parámetros, cuerpo, código)  -> push
+    'REGISTER_FUNCTION',  # arg: nombre de la función          pop
+    'SETUP_TRY',          # arg: inicio del bloque catch
+    'POP_BLOCK',
+    'THROW',              #                                    pop
+    'INTERPRET',          # arg: nodo delegado al intérprete de árbol  push
+    'RETURN_VALUE',       #                                    pop
+]
+
+for _code, _name in enumerate(OPCODES):
+    globals()[_name] = _code
+
+OPERATOR_SYMBOLS = {func: symbol for symbol, func in BINARY_OPERATORS.items()}
+OPERATOR_SYMBOLS.update((func, symbol) for symbol, func in INTEGER_OPERATORS.items())
+
+# Nodos que, en posición de sentencia, no dejan valores en la pila
+STATEMENT_NODES = {
+    'Program', 'Statements', 'Statement', 'Declaration', 'Assignment',
+    'FunctionDeclaration', 'IfStatement', 'WhileStatement', 'ForStatement',
+    'Break', 'Continue', 'Return', 'SwitchStatement', 'TryCatch', 'Throw',
+}
+
+# Cómo traducir un nodo pedido por un método del compilador: como sentencia
+# (descarta su valor), como expresión (deja su valor en la pila) o como
+# resultado de la función (lo devuelve)
+STATEMENT = 'statement'
+EXPRESSION = 'expression'
+RESULT = 'result'
+
+# Máximo de llamadas anidadas, equivalente al RangeError de JavaScript
+MAX_CALL_DEPTH = 100000
+
+class CodeObject:
+    __slots__ = ('name', 'instructions', 'local_names')
+
+    def __init__(self, name, instructions, local_names):
+        self.name = name
+        self.instructions = instructions
+        self.local_names = local_names  # slot -> nombre, para los mensajes de error
+
+    def __str__(self):
+        return disassemble(self)
+
+def disassemble(code):
+    lines = [f"Código de {code.name}:"]
+    nested = []
+    for pc, (op, arg) in enumerate(code.instructions):
+        name = OPCODES[op]
+        if op == BINARY_OP or op == INTEGER_OP:
+            text = OPERATOR_SYMBOLS.get(arg, repr(arg))
+        elif op == MAKE_FUNCTION:
+            func_name, _, params, _, function_code = arg
+            text = f"{func_name}({', '.join(param.value for param in params.children)})"
+            nested.append(function_code)
+        elif op in (LOAD_FAST, STORE_FAST):
+            text = f"{arg} ({code.local_names.get(arg)})"
+        elif op == UPDATE_FAST:
+            text = f"{arg[0]} ({code.local_names.get(arg[0])}) {OPERATOR_SYMBOLS[arg[1]]} {arg[2]!r}"
+        elif op == LOAD_FUNCTION:
+            text = repr(arg.value)
+        elif op == LOAD_PROPERTY:
+            text = repr(arg.name)
+        elif op == CALL_METHOD:
+            text = f"{arg[0].name!r}, {arg[1]}"
+        elif op == INTERPRET:
+            text = f"<{arg.type}>"
+        elif op == JUMP_TABLE:
+            targets, default = arg
+            text = ", ".join(f"{value!r}: {target}" for value, target in targets.items())
+            text = f"{{{text}}} default {default}"
+        elif arg is None and op != LOAD_CONST:
+            text = ''
+        else:
+            text = repr(arg)
+        lines.append(f"{pc:>6} {name:<18} {text}".rstrip())
+    for function_code in nested:
+        lines.append('')
+        lines.append(disassemble(function_code))
+    return "\n".join(lines)
+
+# Estado de una función en ejecución dentro de la VM
+class Frame:
+    __slots__ = ('code', 'env', 'stack', 'blocks', 'pc', 'memo_key')
+
+    def __init__(self, code, env):
+        self.code = code
+        self.env = env
+        self.stack = []
+        self.blocks = []
+        self.pc = 0
+        self.memo_key = None  # Clave en la MemoCache si la función es pura
+
+
+# Traduce un árbol de Node a una secuencia lineal de instrucciones (op, arg)
+class BytecodeCompiler:
+    def __init__(self):
+        self.instructions = []
+        self.local_names = {}
+        self.try_depth = 0  # Bloques try abiertos en tiempo de compilación
+        self.loops = []     # Por cada ciclo: (bloques try abiertos, saltos de break, saltos de continue);
+                            # un switch solo tiene saltos de break
+
+    def compile(self, node, name='<programa>', expression=False):
+        # El cuerpo de una función flecha es una expresión que se devuelve
+        if expression:
+            self.run(RESULT, node)
+        else:
+            self.run(STATEMENT, node)
+            self.emit(LOAD_CONST, None)
+            self.emit(RETURN_VALUE)
+        return CodeObject(name, self.instructions, self.local_names)
+
+    def run(self, mode, node):
+        # Los métodos de traducción son generadores que ceden (modo, nodo) por
+        # cada hijo que necesitan: la pila de trabajo es explícita y el
+        # anidamiento del código fuente no consume la pila de Python
+        pending = []
+        work = self.translate(mode, node)
+        while True:
+            if work is not None:
+                pending.append(work)
+            if not pending:
+                return
+            try:
+                mode, node = next(pending[-1])
+            except StopIteration:
+                pending.pop()
+                work = None
+                continue
+            work = self.translate(mode, node)
+
+    def translate(self, mode, node):
+        # Devuelve un generador si el nodo tiene hijos por traducir, o None si
+        # ya emitió todo su código
+        if node is not None and node.type in FUSED_NODES:
+            # Los nodos fusionados se traducen a partir del original, salvo
+            # x = x op k como sentencia, que tiene su superinstrucción
+            if mode is STATEMENT and node.type == 'LocalUpdate' and not node.value[0]:
+                _, slot, name, op, step = node.value
+                self.local_names[slot] = name
+                self.emit(UPDATE_FAST, (slot, op, step))
+                return None
+            node = node.children[0]
+        if mode is RESULT:
+            return self.emit_return(node)
+        if mode is EXPRESSION:
+            if node is None:
+                self.emit(LOAD_CONST, None)
+                return None
+            method = getattr(self, f'expression_{node.type}', None)
+            if method is None:
+                # Nodos sin traducción propia se delegan en el intérprete de árbol
+                self.emit(INTERPRET, node)
+                return None
+            return method(node)
+        if node is None:
+            return None
+        if node.type in STATEMENT_NODES:
+            return getattr(self, f'statement_{node.type}')(node)
+        return self.expression_statement(node)
+
+    def expression_statement(self, node):
+        yield EXPRESSION, node
+        self.emit(POP_TOP)
+
+    def emit_return(self, node):
+        # Una llamada en posición de cola reutiliza el frame actual. Dentro de
+        # un try no, porque el catch debe seguir activo durante la llamada.
+        if node is not None and node.type == 'FunctionCall' and not self.try_depth:
+            args = yield from self.emit_call_arguments(node)
+            self.emit(TAIL_CALL, len(args))
+        elif node is not None and node.type == 'TernaryOp':
+            # Las dos ramas de un ternario también están en posición de cola
+            yield EXPRESSION, node.children[0]
+            jump_else = self.emit(POP_JUMP_IF_FALSE)
+            yield RESULT, node.children[1]
+            self.patch(jump_else, self.here())
+            yield RESULT, node.children[2]
+        else:
+            yield EXPRESSION, node
+            self.emit(RETURN_VALUE)
+
+    def emit(self, op, arg=None):
+        self.instructions.append((op, arg))
+        return len(self.instructions) - 1
+
+    def patch(self, index, target):
+        op, _ = self.instructions[index]
+        self.instructions[index] = (op, target)
+
+    def here(self):
+        return len(self.instructions)
+
+    def emit_load(self, node):
+        if node.address is None:
+            self.emit(LOAD_UNRESOLVED, node.value)
+            return
+        depth, slot = node.address
+        if depth == 0:
+            self.local_names[slot] = node.value
+            self.emit(LOAD_FAST, slot)
+        else:
+            self.emit(LOAD_DEREF, (depth, slot, node.value))
+
+    def emit_store(self, address, name):
+        depth, slot = address
+        if depth == 0:
+            self.local_names[slot] = name
+            self.emit(STORE_FAST, slot)
+        else:
+            self.emit(STORE_DEREF, (depth, slot))
+
+    def emit_function(self, name, node, params, body, expression=False):
+        code = BytecodeCompiler().compile(body, name, expression)
+        self.emit(MAKE_FUNCTION, (name, node, params, body, code))
+
+    # --- Sentencias ---
+
+    def statement_Program(self, node):
+        for child in node.children:
+            yield STATEMENT, child
+
+    statement_Statements = statement_Program
+    statement_Statement = statement_Program
+
+    def statement_Declaration(self, node):
+        if len(node.children) > 1:
+            yield EXPRESSION, node.children[1]
+        else:
+            self.emit(LOAD_CONST, None)
+        self.emit_store(node.address, node.children[0].value)
+
+    def statement_Assignment(self, node):
+        yield EXPRESSION, node.children[1]
+        self.emit_store(node.address, node.children[0].value)
+
+    def statement_FunctionDeclaration(self, node):
+        func_name = node.children[0].value
+        self.emit_function(func_name, node, node.children[1], node.children[2])
+        self.emit(DUP_TOP)
+        self.emit_store(node.address, func_name)
+        self.emit(REGISTER_FUNCTION, func_name)
+
+    def statement_IfStatement(self, node):
+        yield EXPRESSION, node.children[0]
+        jump_else = self.emit(POP_JUMP_IF_FALSE)
+        yield STATEMENT, node.children[1]
+        if len(node.children) > 2:
+            jump_end = self.emit(JUMP)
+            self.patch(jump_else, self.here())
+            yield STATEMENT, node.children[2]
+            self.patch(jump_end, self.here())
+        else:
+            self.patch(jump_else, self.here())
+
+    def compile_loop(self, condition, body, update=None):
+        # break y continue son saltos: el ciclo no necesita un bloque en la VM
+        breaks = []
+        continues = []
+        self.loops.append((self.try_depth, breaks, continues))
+
+        start = self.here()
+        jump_exit = None
+        if condition is not None:
+            yield EXPRESSION, condition
+            jump_exit = self.emit(POP_JUMP_IF_FALSE)
+        yield STATEMENT, body
+        continue_target = self.here()
+        yield STATEMENT, update
+        self.emit(JUMP_BACKWARD, start)
+
+        exit_target = self.here()
+        self.loops.pop()
+
+        if jump_exit is not None:
+            self.patch(jump_exit, exit_target)
+        for jump in breaks:
+            self.patch(jump, exit_target)
+        for jump in continues:
+            self.patch(jump, continue_target)
+
+    def statement_WhileStatement(self, node):
+        return self.compile_loop(node.children[0], node.children[1])
+
+    def statement_ForStatement(self, node):
+        yield STATEMENT, node.children[0]
+        yield from self.compile_loop(node.children[1], node.children[3], node.children[2])
+
+    def emit_loop_exit(self, jumps_index):
+        # break sale del ciclo o switch más cercano; continue, del ciclo más cercano
+        loop = next((loop for loop in reversed(self.loops) if loop[jumps_index] is not None), None)
+        if loop is None:
+            # Fuera de un ciclo termina la función, como en el intérprete de árbol
+            self.emit(LOAD_CONST, None)
+            self.emit(RETURN_VALUE)
+            return
+        # Cerrar los bloques try abiertos dentro del ciclo
+        for _ in range(self.try_depth - loop[0]):
+            self.emit(POP_BLOCK)
+        loop[jumps_index].append(self.emit(JUMP))
+
+    def statement_Break(self, node):
+        self.emit_loop_exit(1)
+
+    def statement_Continue(self, node):
+        self.emit_loop_exit(2)
+
+    def statement_Return(self, node):
+        return self.emit_return(node.children[0])
+
+    def statement_SwitchStatement(self, node):
+        # Los bloques de los casos quedan seguidos, así un caso sin break sigue
+        # en el siguiente como en JavaScript. Con etiquetas literales se salta
+        # directo al caso con JUMP_TABLE; si no, se comparan en orden
+        cases = node.children[1]
+        table = switch_table(cases)
+        yield EXPRESSION, node.children[0]
+        if table is not None:
+            dispatch = self.emit(JUMP_TABLE)
+        else:
+            case_jumps = []
+            for case_expr, _ in cases:
+                self.emit(DUP_TOP)
+                yield EXPRESSION, case_expr
+                self.emit(BINARY_OP, BINARY_OPERATORS['=='])
+                next_case = self.emit(POP_JUMP_IF_FALSE)
+                self.emit(POP_TOP)
+                case_jumps.append(self.emit(JUMP))
+                self.patch(next_case, self.here())
+            self.emit(POP_TOP)
+            default_jump = self.emit(JUMP)
+
+        breaks = []
+        self.loops.append((self.try_depth, breaks, None))
+        targets = []
+        for _, case_stmts in cases:
+            targets.append(self.here())
+            yield STATEMENT, case_stmts
+        default_target = self.here()
+        yield STATEMENT, node.children[2]
+        self.loops.pop()
+
+        for jump in breaks:
+            self.patch(jump, self.here())
+        if table is not None:
+            self.patch(dispatch, ({value: targets[index] for value, index in table.items()}, default_target))
+        else:
+            for jump, target in zip(case_jumps, targets):
+                self.patch(jump, target)
+            self.patch(default_jump, default_target)
+
+    def statement_TryCatch(self, node):
+        setup = self.emit(SETUP_TRY)
+        self.try_depth += 1
+        yield STATEMENT, node.children[0]
+        self.try_depth -= 1
+        self.emit(POP_BLOCK)
+        jump_end = self.emit(JUMP)
+
+        # La VM deja el mensaje del error en la pila al saltar al catch
+        self.patch(setup, self.here())
+        self.emit_store(node.address, node.children[1])
+        yield STATEMENT, node.children[2]
+        self.patch(jump_end, self.here())
+
+    def statement_Throw(self, node):
+        yield EXPRESSION, node.children[0]
+        self.emit(THROW)
+
+    # --- Expresiones ---
+
+    def expression_Number(self, node):
+        self.emit(LOAD_CONST, node.value)
+
+    expression_String = expression_Number
+    expression_Boolean = expression_Number
+
+    def expression_Identifier(self, node):
+        self.emit_load(node)
+
+    def expression_Assignment(self, node):
+        yield EXPRESSION, node.children[1]
+        self.emit(DUP_TOP)
+        self.emit_store(node.address, node.children[0].value)
+
+    def expression_BinaryOp(self, node):
+        yield EXPRESSION, node.children[0]
+        if node.value in LOGICAL_OPERATORS:
+            # Cortocircuito: el operando derecho solo se evalúa si hace falta
+            jump = self.emit(JUMP_IF_FALSE_OR_POP if node.value == '&&' else JUMP_IF_TRUE_OR_POP)
+            yield EXPRESSION, node.children[1]
+            self.patch(jump, self.here())
+            return
+        yield EXPRESSION, node.children[1]
+        if node.value in INTEGER_OPERATORS:
+            self.emit(INTEGER_OP, INTEGER_OPERATORS[node.value])
+        else:
+            self.emit(BINARY_OP, BINARY_OPERATORS[node.value])
+
+    expression_Condition = expression_BinaryOp
+
+    def expression_UnaryOp(self, node):
+        yield EXPRESSION, node.children[0]
+        if node.value == '!':
+            self.emit(NOT)
+        else:
+            self.emit(POP_TOP)
+            self.emit(LOAD_CONST, None)
+
+    def expression_TernaryOp(self, node):
+        yield EXPRESSION, node.children[0]
+        jump_else = self.emit(POP_JUMP_IF_FALSE)
+        yield EXPRESSION, node.children[1]
+        jump_end = self.emit(JUMP)
+        self.patch(jump_else, self.here())
+        yield EXPRESSION, node.children[2]
+        self.patch(jump_end, self.here())
+
+    def expression_ConsoleLog(self, node):
+        args = node.children[0].children
+        for arg in args:
+            yield EXPRESSION, arg
+        self.emit(CONSOLE_LOG, len(args))
+
+    def emit_call_arguments(self, node):
+        self.emit(LOAD_FUNCTION, node.children[0])
+        args = node.children[1].children
+        for arg in args:
+            yield EXPRESSION, arg
+        return args
+
+    def expression_FunctionCall(self, node):
+        args = yield from self.emit_call_arguments(node)
+        self.emit(CALL_FUNCTION, len(args))
+
+    def expression_ArrowFunction(self, node):
+        self.emit_function('=>', node, node.children[0], node.children[1], expression=True)
+
+    def expression_AnonymousFunction(self, node):
+        self.emit_function('anónima', node, node.children[0], node.children[1])
+
+    def expression_ArrayLiteral(self, node):
+        elements = node.children[0].children
+        for element in elements:
+            yield EXPRESSION, element
+        self.emit(BUILD_LIST, len(elements))
+
+    def expression_ArrayAccess(self, node):
+        yield EXPRESSION, node.children[1]
+        self.emit_load(node.children[0])
+        self.emit(LOAD_INDEX, node.children[0].value)
+
+    def expression_PropertyAccess(self, node):
+        yield EXPRESSION, node.children[0]
+        self.emit(LOAD_PROPERTY, InlineCache(node.children[1].value))
+
+    def expression_ObjectLiteral(self, node):
+        keys = []
+        for key, value_node in node.children[0]:
+            keys.append(key)
+            yield EXPRESSION, value_node
+        self.emit(BUILD_OBJECT, shape_for(keys))
+
+    def expression_MethodCall(self, node):
+        yield EXPRESSION, node.children[0]
+        args = node.children[2].children
+        for arg in args:
+            yield EXPRESSION, arg
+        self.emit(CALL_METHOD, (InlineCache(node.children[1].value), len(args)))
+
+# Programas ya compilados, indexados por la raíz de su AST
+_program_cache = weakref.WeakKeyDictionary()
+
+def compile_program(node):
+    code = _program_cache.get(node)
+    if code is None:
+        code = _program_cache[node] = BytecodeCompiler().compile(node)
+    return code
+
+# Máquina virtual de pila que ejecuta el bytecode generado por BytecodeCompiler.
+# Los nodos sin traducción propia se ejecutan con el intérprete de árbol
+# (instrucción INTERPRET), por eso la VM comparte su estado.
+class BytecodeInterpreter(Interpreter):
+
+    def __init__(self):
+        super().__init__()
+        self.compiled_bodies = weakref.WeakKeyDictionary()
+
+    def interpret_Program(self, node):
+        resolve_program(node)
+        with self.metered():
+            code = compile_program(node)
+            self.environment = Environment(node.frame_size)
+            self.execute(code, self.environment)
+
+    def function_code(self, func):
+        code = func.code
+        if code is None:
+            # Función creada por el intérprete de árbol
+            code = self.compiled_bodies.get(func.body)
+            if code is None:
+                code = BytecodeCompiler().compile(func.body, func.name, func.body.type not in STATEMENT_NODES)
+                self.compiled_bodies[func.body] = code
+            func.code = code
+        return code
+
+    def run_function(self, func, env):
+        return self.execute(self.function_code(func), env)
+
+    def make_frame(self, func, args):
+        return Frame(self.function_code(func), self.bind_arguments(func, args))
+
+    def execute(self, code, env):
+        # Las llamadas entre funciones de bytecode no anidan llamadas de Python:
+        # el frame de quien llama se guarda en frames y se retoma en RETURN_VALUE
+        frame = Frame(code, env)
+        frames = []
+        budget = self.budget
+        output = self.output
+
+        while True:
+            code = frame.code
+            instructions = code.instructions
+            env = frame.env
+            values = env.values
+            stack = frame.stack
+            push = stack.append
+            pop = stack.pop
+            blocks = frame.blocks
+            pc = frame.pc
+            self.environment = env
+            try:
+                while True:
+                    op, arg = instructions[pc]
+                    pc += 1
+                    if op == LOAD_FAST:
+                        value = values[arg]
+                        if value is UNINITIALIZED:
+                            raise Exception(f"Variable '{code.local_names[arg]}' no definida")
+                        push(value)
+                    elif op == LOAD_CONST:
+                        push(arg)
+                    elif op == STORE_FAST:
+                        values[arg] = pop()
+                    elif op == UPDATE_FAST:
+                        slot, operator, step = arg
+                        value = values[slot]
+                        if value is UNINITIALIZED:
+                            raise Exception(f"Variable '{code.local_names[slot]}' no definida")
+                        value = operator(value, step)
+                        if value.__class__ is int and MIN_SAFE_INTEGER <= value <= MAX_SAFE_INTEGER or value.__class__ is float:
+                            values[slot] = value
+                        else:
+                            values[slot] = normalize_result(value)
+                    elif op == INTEGER_OP:
+                        right = pop()
+                        result = arg(stack[-1], right)
+                        # Enteros fuera del rango exacto y strings largos van por el camino lento
+                        if result.__class__ is int and MIN_SAFE_INTEGER <= result <= MAX_SAFE_INTEGER or result.__class__ is float:
+                            stack[-1] = result
+                        else:
+                            stack[-1] = normalize_result(result)
+                    elif op == BINARY_OP:
+                        right = pop()
+                        stack[-1] = arg(stack[-1], right)
+                    elif op == POP_JUMP_IF_FALSE:
+                        if not pop():
+                            pc = arg
+                    elif op == JUMP:
+                        pc = arg
+                    elif op == JUMP_BACKWARD:
+                        pc = arg
+                        if budget is not None:
+                            budget.step()
+                    elif op == JUMP_TABLE:
+                        pc = arg[0].get(pop(), arg[1])
+                    elif op == JUMP_IF_FALSE_OR_POP:
+                        if stack[-1]:
+                            pop()
+                        else:
+                            pc = arg
+                    elif op == JUMP_IF_TRUE_OR_POP:
+                        if stack[-1]:
+                            pc = arg
+                        else:
+                            pop()
+                    elif op == LOAD_DEREF:
+                        depth, slot, name = arg
+                        value = env.frame(depth).values[slot]
+                        if value is UNINITIALIZED:
+                            raise Exception(f"Variable '{name}' no definida")
+                        push(value)
+                    elif op == STORE_DEREF:
+                        depth, slot = arg
+                        env.frame(depth).values[slot] = pop()
+                    elif op == POP_TOP:
+                        pop()
+                    elif op == DUP_TOP:
+                        push(stack[-1])
+                    elif op == NOT:
+                        stack[-1] = not stack[-1]
+                    elif op == LOAD_INDEX:
+                        array = pop()
+                        stack[-1] = get_element(array, arg, stack[-1])
+                    elif op == LOAD_PROPERTY:
+                        obj = stack[-1]
+                        if type(obj) is JSObject and obj.shape is arg.shape:
+                            stack[-1] = obj.values[arg.offset]
+                        else:
+                            stack[-1] = load_property(obj, arg)
+                    elif op == LOAD_FUNCTION:
+                        push(self.lookup_function(arg))
+                    elif op == CALL_FUNCTION:
+                        args = stack[len(stack) - arg:]
+                        del stack[len(stack) - arg:]
+                        func = pop()
+                        if budget is not None:
+                            budget.step()
+                        key = None
+                        if self.memo is not None and func.body.pure:
+                            key = memo_key(func, args)
+                            result = self.memo.get(key, UNINITIALIZED)
+                            if result is not UNINITIALIZED:
+                                push(result)
+                                continue
+                        if len(frames) >= MAX_CALL_DEPTH:
+                            raise Exception(STACK_OVERFLOW_MESSAGE)
+                        callee = self.make_frame(func, args)
+                        callee.memo_key = key
+                        frame.pc = pc
+                        frames.append(frame)
+                        frame = callee
+                        break
+                    elif op == TAIL_CALL:
+                        # Llamada en posición de cola: el frame actual se descarta,
+                        # y con él su clave de memoización
+                        args = stack[len(stack) - arg:]
+                        del stack[len(stack) - arg:]
+                        func = pop()
+                        if budget is not None:
+                            budget.step()
+                        key = None
+                        if self.memo is not None and func.body.pure:
+                            key = memo_key(func, args)
+                            result = self.memo.get(key, UNINITIALIZED)
+                            if result is not UNINITIALIZED:
+                                if not frames:
+                                    return result
+                                frame = frames.pop()
+                                frame.stack.append(result)
+                                break
+                        frame = self.make_frame(func, args)
+                        frame.memo_key = key
+                        break
+                    elif op == CALL_METHOD:
+                        cache, argc = arg
+                        args = stack[len(stack) - argc:]
+                        del stack[len(stack) - argc:]
+                        obj = pop()
+                        if type(obj) is not JSObject:
+                            push(call_method(obj, cache.name, args))
+                            continue
+                        func = load_method(obj, cache)
+                        if not isinstance(func, Function):
+                            raise Exception(f"Método '{cache.name}' no soportado")
+                        if budget is not None:
+                            budget.step()
+                        if len(frames) >= MAX_CALL_DEPTH:
+                            raise Exception(STACK_OVERFLOW_MESSAGE)
+                        callee = self.make_frame(func, args)
+                        frame.pc = pc
+                        frames.append(frame)
+                        frame = callee
+                        break
+                    elif op == CONSOLE_LOG:
+                        args = stack[len(stack) - arg:]
+                        del stack[len(stack) - arg:]
+                        output.write(format_output(args))
+                        push(None)
+                    elif op == BUILD_LIST:
+                        elements = stack[len(stack) - arg:]
+                        del stack[len(stack) - arg:]
+                        push(JSArray(elements))
+                    elif op == BUILD_OBJECT:
+                        properties = stack[len(stack) - len(arg.slots):]
+                        del stack[len(stack) - len(arg.slots):]
+                        push(arg.build(properties))
+                    elif op == MAKE_FUNCTION:
+                        func_name, node, params, body, function_code = arg
+                        func = Function(func_name, params, body, node.frame_size, env)
+                        func.code = function_code
+                        push(func)
+                    elif op == REGISTER_FUNCTION:
+                        self.functions[arg] = pop()
+                    elif op == SETUP_TRY:
+                        blocks.append((arg, len(stack)))
+                    elif op == POP_BLOCK:
+                        blocks.pop()
+                    elif op == INTERPRET:
+                        push(self.interpret(arg))
+                    elif op == LOAD_UNRESOLVED:
+                        raise Exception(f"Variable '{arg}' no definida")
+                    elif op == THROW:
+                        raise Exception(pop())
+                    elif op == RETURN_VALUE:
+                        result = pop()
+                        if frame.memo_key is not None:
+                            self.memo.store(frame.memo_key, result)
+                        if not frames:
+                            return result
+                        frame = frames.pop()
+                        frame.stack.append(result)
+                        break
+            except Exception as e:
+                # Saltar al catch del bloque try más interno, que puede estar
+                # en una función que espera el resultado de la llamada
+                while not frame.blocks:
+                    if not frames:
+                        raise
+                    frame = frames.pop()
+                target, depth = frame.blocks.pop()
+                del frame.stack[depth:]
+                frame.stack.append(error_message(e))
+                frame.pc = target
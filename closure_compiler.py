@@ -0,0 +1,415 @@
+import weakref
+from interpreter import (Interpreter, Environment, Function, JSArray, JSObject, InlineCache, UNINITIALIZED,
+                         Completion, BREAK, CONTINUE, RETURN, BINARY_OPERATORS, INTEGER_OPERATORS, MIN_SAFE_INTEGER,
+                         MAX_SAFE_INTEGER, normalize_result, may_complete, resolve_program, shape_for, get_element, load_property,
+                         format_output, switch_table, error_message)
+
+def _noop(env):
+    return None
+
+# Intérprete que compila el árbol a closures de Python antes de ejecutarlo.
+# Cada nodo se convierte una sola vez en una función f(env); los ciclos
+# vuelven a ejecutar esas funciones sin formatear nombres de método ni hacer
+# getattr por nodo. Los nodos sin compilador propio se delegan en el
+# intérprete de árbol, así ambos backends comparten la misma semántica.
+# Solo las sentencias que pueden contener break, continue o return revisan
+# la señal de terminación que devuelven.
+class ClosureInterpreter(Interpreter):
+
+    def __init__(self):
+        super().__init__()
+        self.compiled_bodies = weakref.WeakKeyDictionary()
+
+    def interpret_Program(self, node):
+        resolve_program(node)
+        with self.metered():
+            program = self.compile(node)
+            self.environment = Environment(node.frame_size)
+            program(self.environment)
+
+    def run_function(self, func, env):
+        code = func.code
+        if code is None:
+            # Función creada por el intérprete de árbol
+            code = self.compiled_bodies.get(func.body)
+            if code is None:
+                code = self.compiled_bodies[func.body] = self.compile(func.body)
+            func.code = code
+        return code(env)
+
+    def compile(self, node):
+        if node is None:
+            return _noop
+        method = getattr(self, f'compile_{node.type}', self.generic_compile)
+        return method(node)
+
+    def generic_compile(self, node):
+        interpret = self.interpret
+
+        def run(env):
+            return interpret(node)
+        return run
+
+    def compile_sequence(self, nodes):
+        body = tuple(self.compile(child) for child in nodes)
+        if not any(may_complete(child) for child in nodes):
+            def run(env):
+                for statement in body:
+                    statement(env)
+            return run
+
+        def run(env):
+            for statement in body:
+                signal = statement(env)
+                if signal.__class__ is Completion:
+                    return signal
+        return run
+
+    def compile_Program(self, node):
+        return self.compile_sequence(node.children)
+
+    def compile_Statements(self, node):
+        return self.compile_sequence(node.children)
+
+    def compile_Statement(self, node):
+        # El envoltorio Statement no agrega comportamiento: se compila su hijo
+        return self.compile(node.children[0])
+
+    def compile_fused(self, node):
+        # Los nodos fusionados se compilan a partir del nodo original
+        return self.compile(node.children[0])
+
+    compile_LocalUpdate = compile_fused
+    compile_AccumulateElement = compile_fused
+    compile_LocalCompare = compile_fused
+    compile_CountedLoop = compile_fused
+
+    def compile_Number(self, node):
+        value = node.value
+        return lambda env: value
+
+    compile_String = compile_Number
+    compile_Boolean = compile_Number
+
+    def compile_load(self, node):
+        # Lectura de una variable especializada según la profundidad de su frame
+        var_name = node.value
+
+        def undefined():
+            raise Exception(f"Variable '{var_name}' no definida")
+
+        if node.address is None:
+            return lambda env: undefined()
+        depth, slot = node.address
+        if depth == 0:
+            def run(env):
+                value = env.values[slot]
+                if value is UNINITIALIZED:
+                    undefined()
+                return value
+        elif depth == 1:
+            def run(env):
+                value = env.parent.values[slot]
+                if value is UNINITIALIZED:
+                    undefined()
+                return value
+        else:
+            def run(env):
+                value = env.frame(depth).values[slot]
+                if value is UNINITIALIZED:
+                    undefined()
+                return value
+        return run
+
+    def compile_store(self, address, value):
+        depth, slot = address
+        if depth == 0:
+            def run(env):
+                result = env.values[slot] = value(env)
+                return result
+        elif depth == 1:
+            def run(env):
+                result = env.parent.values[slot] = value(env)
+                return result
+        else:
+            def run(env):
+                result = env.frame(depth).values[slot] = value(env)
+                return result
+        return run
+
+    def compile_Identifier(self, node):
+        return self.compile_load(node)
+
+    def compile_Declaration(self, node):
+        if len(node.children) > 1:
+            return self.compile_store(node.address, self.compile(node.children[1]))
+        return self.compile_store(node.address, _noop)
+
+    def compile_Assignment(self, node):
+        return self.compile_store(node.address, self.compile(node.children[1]))
+
+    def compile_BinaryOp(self, node):
+        left = self.compile(node.children[0])
+        right = self.compile(node.children[1])
+        if node.value == '&&':
+            return lambda env: left(env) and right(env)
+        if node.value == '||':
+            return lambda env: left(env) or right(env)
+        if node.value in INTEGER_OPERATORS:
+            op = INTEGER_OPERATORS[node.value]
+
+            def run(env):
+                result = op(left(env), right(env))
+                if result.__class__ is int and MIN_SAFE_INTEGER <= result <= MAX_SAFE_INTEGER or result.__class__ is float:
+                    return result
+                return normalize_result(result)
+            return run
+        op = BINARY_OPERATORS[node.value]
+        return lambda env: op(left(env), right(env))
+
+    compile_Condition = compile_BinaryOp
+
+    def compile_UnaryOp(self, node):
+        operand = self.compile(node.children[0])
+        if node.value == '!':
+            return lambda env: not operand(env)
+        return _noop
+
+    def compile_TernaryOp(self, node):
+        condition = self.compile(node.children[0])
+        then_branch = self.compile(node.children[1])
+        else_branch = self.compile(node.children[2])
+        return lambda env: then_branch(env) if condition(env) else else_branch(env)
+
+    def compile_IfStatement(self, node):
+        condition = self.compile(node.children[0])
+        then_branch = self.compile(node.children[1])
+        if len(node.children) > 2:
+            else_branch = self.compile(node.children[2])
+        else:
+            else_branch = _noop
+        if not may_complete(node):
+            # El valor de las ramas no debe confundirse con una señal
+            def run(env):
+                if condition(env):
+                    then_branch(env)
+                else:
+                    else_branch(env)
+            return run
+        return lambda env: then_branch(env) if condition(env) else else_branch(env)
+
+    def compile_loop_body(self, node):
+        # Con presupuesto, cada iteración descuenta un paso antes del cuerpo
+        body = self.compile(node)
+        if self.budget is None:
+            return body
+        step = self.budget.step
+
+        def run(env):
+            step()
+            return body(env)
+        return run
+
+    def compile_WhileStatement(self, node):
+        condition = self.compile(node.children[0])
+        body = self.compile_loop_body(node.children[1])
+        if not may_complete(node.children[1]):
+            def run(env):
+                while condition(env):
+                    body(env)
+            return run
+
+        def run(env):
+            while condition(env):
+                signal = body(env)
+                if signal is BREAK:
+                    break
+                if signal is RETURN:
+                    return RETURN
+        return run
+
+    def compile_ForStatement(self, node):
+        init = self.compile(node.children[0])
+        has_condition = node.children[1] is not None
+        condition = self.compile(node.children[1])
+        update = self.compile(node.children[2])
+        body = self.compile_loop_body(node.children[3])
+
+        if not may_complete(node.children[3]):
+            def run(env):
+                init(env)
+                while not has_condition or condition(env):
+                    body(env)
+                    update(env)
+            return run
+
+        def run(env):
+            init(env)
+            while not has_condition or condition(env):
+                signal = body(env)
+                if signal is BREAK:
+                    break
+                if signal is RETURN:
+                    return RETURN
+                update(env)
+        return run
+
+    def compile_Break(self, node):
+        return lambda env: BREAK
+
+    def compile_Continue(self, node):
+        return lambda env: CONTINUE
+
+    def compile_Return(self, node):
+        value = self.compile(node.children[0])
+        interpreter = self
+
+        def run(env):
+            interpreter.return_value = value(env)
+            return RETURN
+        return run
+
+    def compile_SwitchStatement(self, node):
+        # Como en el intérprete de árbol: desde el caso que coincide hasta un break
+        expr = self.compile(node.children[0])
+        cases = node.children[1]
+        table = switch_table(cases)
+        labels = tuple(self.compile(case_expr) for case_expr, _ in cases)
+        bodies = tuple(self.compile(case_stmts) for _, case_stmts in cases) + (self.compile(node.children[2]),)
+        default = len(cases)
+        count = len(bodies)
+
+        def run_from(env, start):
+            for index in range(start, count):
+                signal = bodies[index](env)
+                if signal is BREAK:
+                    return None
+                if signal.__class__ is Completion:
+                    return signal
+
+        if table is not None:
+            def run(env):
+                return run_from(env, table.get(expr(env), default))
+            return run
+
+        def run(env):
+            value = expr(env)
+            for index, label in enumerate(labels):
+                if label(env) == value:
+                    return run_from(env, index)
+            return run_from(env, default)
+        return run
+
+    def compile_TryCatch(self, node):
+        try_block = self.compile(node.children[0])
+        catch_block = self.compile(node.children[2])
+        depth, slot = node.address
+        interpreter = self
+
+        def run(env):
+            environment = interpreter.environment
+            try:
+                return try_block(env)
+            except Exception as e:
+                # El mensaje del error queda en el slot de la variable del catch
+                interpreter.environment = environment
+                env.frame(depth).values[slot] = error_message(e)
+                return catch_block(env)
+        return run
+
+    def compile_Throw(self, node):
+        value = self.compile(node.children[0])
+
+        def run(env):
+            raise Exception(value(env))
+        return run
+
+    def compile_ConsoleLog(self, node):
+        args = tuple(self.compile(arg) for arg in node.children[0].children)
+
+        def run(env):
+            self.output.write(format_output([arg(env) for arg in args]))
+        return run
+
+    def compile_function(self, name, node, params, body):
+        code = self.compiled_bodies[body] = self.compile(body)
+        frame_size = node.frame_size
+
+        def run(env):
+            func = Function(name, params, body, frame_size, env)
+            func.code = code
+            return func
+        return run
+
+    def compile_FunctionDeclaration(self, node):
+        func_name = node.children[0].value
+        create = self.compile_function(func_name, node, node.children[1], node.children[2])
+        store = self.compile_store(node.address, create)
+        functions = self.functions
+
+        def run(env):
+            functions[func_name] = store(env)
+        return run
+
+    def compile_ArrowFunction(self, node):
+        return self.compile_function('=>', node, node.children[0], node.children[1])
+
+    def compile_AnonymousFunction(self, node):
+        return self.compile_function('anónima', node, node.children[0], node.children[1])
+
+    def compile_FunctionCall(self, node):
+        callee = node.children[0]
+        args = tuple(self.compile(arg) for arg in node.children[1].children)
+        lookup_function = self.lookup_function
+        call_function = self.call_function
+
+        def run(env):
+            func = lookup_function(callee)
+            # Los argumentos se evalúan en el scope de quien llama
+            return call_function(func, [arg(env) for arg in args])
+        return run
+
+    def compile_ArrayLiteral(self, node):
+        elements = tuple(self.compile(child) for child in node.children[0].children)
+        return lambda env: JSArray([element(env) for element in elements])
+
+    def compile_ArrayAccess(self, node):
+        array_name = node.children[0].value
+        load = self.compile_load(node.children[0])
+        index_code = self.compile(node.children[1])
+
+        def run(env):
+            index = index_code(env)
+            return get_element(load(env), array_name, index)
+        return run
+
+    def compile_PropertyAccess(self, node):
+        obj_code = self.compile(node.children[0])
+        cache = InlineCache(node.children[1].value)
+
+        def run(env):
+            obj = obj_code(env)
+            # Acierto de la caché: misma forma que la última vez
+            if type(obj) is JSObject and obj.shape is cache.shape:
+                return obj.values[cache.offset]
+            return load_property(obj, cache)
+        return run
+
+    def compile_ObjectLiteral(self, node):
+        shape = shape_for(key for key, _ in node.children[0])
+        values = tuple(self.compile(value_node) for _, value_node in node.children[0])
+        if shape.unique:
+            return lambda env: JSObject(shape, [value(env) for value in values])
+        build = shape.build
+        return lambda env: build([value(env) for value in values])
+
+    def compile_MethodCall(self, node):
+        obj_code = self.compile(node.children[0])
+        cache = InlineCache(node.children[1].value)
+        args = tuple(self.compile(arg) for arg in node.children[2].children)
+        invoke_method = self.invoke_method
+
+        def run(env):
+            obj = obj_code(env)
+            return invoke_method(obj, cache, [arg(env) for arg in args])
+        return run
@@ -0,0 +1,119 @@
+from syntax_tree import Node, copy_position
+from interpreter import BINARY_OPERATORS, INTEGER_OPERATORS, FUSED_NODES
+
+# Comparaciones que se fusionan cuando sus operandos son variables o literales
+COMPARISON_OPERATORS = {'<', '<=', '>', '>=', '==', '!='}
+
+LITERAL_NODES = {'Number', 'String', 'Boolean'}
+
+def is_variable(node):
+    return isinstance(node, Node) and node.type == 'Identifier' and node.address is not None
+
+def is_literal(node):
+    return isinstance(node, Node) and node.type in LITERAL_NODES
+
+# Pasada que reemplaza patrones frecuentes en los ciclos por un solo nodo
+# fusionado con su propio evaluador en el intérprete de árbol: x = x + 1,
+# x = x + arr[i], i < n y los for con contador. Así cada iteración hace una
+# llamada a interpret por patrón en lugar de una por nodo. El nodo fusionado
+# guarda el original como primer hijo para los demás backends. Corre después
+# del análisis semántico (usa las direcciones) y del optimizador.
+class Fuser:
+    def __init__(self):
+        self.fused = 0
+
+    def fuse(self, ast):
+        pending = [ast]
+        while pending:
+            node = pending.pop()
+            if isinstance(node, (list, tuple)):
+                pending.extend(node)
+                continue
+            if not isinstance(node, Node):
+                continue
+            children = node.children
+            for index, child in enumerate(children):
+                if not isinstance(child, Node):
+                    pending.append(child)
+                    continue
+                if child.type in FUSED_NODES:
+                    # Ya fusionado en una pasada anterior: solo se revisa el cuerpo
+                    if child.type == 'CountedLoop':
+                        pending.append(child.value[-1])
+                    continue
+                fused = self.match(child)
+                if fused is None:
+                    pending.append(child)
+                    continue
+                children[index] = fused
+                self.fused += 1
+                if fused.type == 'CountedLoop':
+                    pending.append(child.children[0])
+                    pending.append(child.children[3])
+        return ast
+
+    def match(self, node):
+        if node.type == 'ForStatement':
+            return self.match_loop(node)
+        return self.match_update(node) or self.match_compare(node)
+
+    def match_update(self, node):
+        # x = x op k  ->  LocalUpdate,  x = x op arr[i]  ->  AccumulateElement
+        if node.type != 'Assignment' or node.address is None:
+            return None
+        value = node.children[1]
+        if not isinstance(value, Node) or value.type != 'BinaryOp':
+            return None
+        if value.value not in INTEGER_OPERATORS:
+            return None
+        left, right = value.children
+        if not is_variable(left) or left.address != node.address:
+            return None
+        depth, slot = node.address
+        name = node.children[0].value
+        op = INTEGER_OPERATORS[value.value]
+        if isinstance(right, Node) and right.type == 'Number':
+            return copy_position(Node('LocalUpdate', [node], (depth, slot, name, op, right.value)), node)
+        if (isinstance(right, Node) and right.type == 'ArrayAccess'
+                and is_variable(right.children[0]) and is_variable(right.children[1])):
+            return copy_position(Node('AccumulateElement', [node], (depth, slot, name, op, right.children[0], right.children[1])), node)
+        return None
+
+    def match_compare(self, node):
+        # a < b  o  a < k
+        if node.type not in ('BinaryOp', 'Condition') or node.value not in COMPARISON_OPERATORS:
+            return None
+        left, right = node.children
+        if not is_variable(left):
+            return None
+        op = BINARY_OPERATORS[node.value]
+        if is_variable(right):
+            return copy_position(Node('LocalCompare', [node], (op, left, right, None)), node)
+        if is_literal(right):
+            return copy_position(Node('LocalCompare', [node], (op, left, None, right.value)), node)
+        return None
+
+    def match_loop(self, node):
+        # for (init; i < límite; i = i + k). El límite se vuelve a evaluar en
+        # cada iteración, como en el for original, así puede ser cualquier
+        # expresión (por ejemplo arr.length)
+        init, condition, update, body = node.children
+        if not isinstance(condition, Node) or update is None:
+            return None
+        if condition.type not in ('BinaryOp', 'Condition') or condition.value not in COMPARISON_OPERATORS:
+            return None
+        step = self.match_update(update)
+        if step is None or step.type != 'LocalUpdate':
+            return None
+        counter, limit = condition.children
+        depth, slot, name, op, step_value = step.value
+        if not is_variable(counter) or counter.address != (depth, slot):
+            return None
+        compare = BINARY_OPERATORS[condition.value]
+        if is_literal(limit):
+            limit_node, limit_value = None, limit.value
+        else:
+            limit_node, limit_value = limit, None
+        loop = Node('CountedLoop', [node],
+                    (init, depth, slot, name, compare, limit_node, limit_value, op, step_value, body))
+        return copy_position(loop, node)
@@ -5,8 +5,12 @@ import subprocess
 import sys
 import os
 import tempfile
-from lexer import tokenize
+from lexer import TokenStream
 from parser import parse
+from syntax_tree import Node
+from interpreter import CaptureSink, ExecutionBudget, ExecutionLimitExceeded
+from backends import create_interpreter, DEFAULT_BACKEND
+from ast_cache import ASTCache
 from ttkthemes import ThemedTk
 from pygments import lex
 from pygments.lexers import JavascriptLexer
@@ -84,6 +88,9 @@ class CompiladorGUI:
         
         # Lista de tokens almacenados
         self.current_tokens = []
+
+        # Programas ya analizados, compartidos con main.py
+        self.ast_cache = ASTCache()
         
         # Estado de los filtros
         self.filter_states = {
@@ -356,6 +363,20 @@ class CompiladorGUI:
         
         self.tokens_list.config(state=tk.DISABLED)
 
+    def show_tokens(self):
+        # Mostrar cada token con su tipo y valor
+        for token in self.current_tokens:
+            token_value = str(token.value)
+            if token.type == 'STRING':
+                token_value = f'"{token_value}"'
+            elif token.type == 'COMMENT':
+                token_value = f'// {token_value}'
+            
+            self.write_to_tokens(
+                f"{token.type:<15} {token_value:<30} Línea {token.lineno}, Columna {token.column}",
+                'NORMAL'
+            )
+
     def compile_code(self):
         self.clear_outputs()
         code = self.code_editor.get(1.0, tk.END).strip()
@@ -364,21 +385,28 @@ class CompiladorGUI:
             self.write_to_errors("Error: No hay código para compilar")
             return
 
+        # Un programa que ya se analizó sin errores sale de la caché
+        cached = self.ast_cache.load(code)
+        if cached is not None:
+            self.current_tokens, self.ast = cached
+            self.show_tokens()
+            self.write_to_ast("Árbol de Sintaxis Abstracta (AST):\n", 'INFO')
+            self.write_to_ast(str(self.ast), 'NORMAL')
+            self.write_to_console("AST recuperado de la caché", 'SUCCESS')
+            return
+
+        # Análisis léxico y sintáctico en una sola pasada: el parser lee los
+        # tokens del stream, que los guarda para mostrarlos
+        stream = TokenStream(keep=True)
+        result = parse(code, lexer=stream)
+
         # Análisis léxico
         try:
-            self.current_tokens = tokenize(code)
-            # Mostrar cada token con su tipo y valor
-            for token in self.current_tokens:
-                token_value = str(token.value)
-                if token.type == 'STRING':
-                    token_value = f'"{token_value}"'
-                elif token.type == 'COMMENT':
-                    token_value = f'// {token_value}'
-                
-                self.write_to_tokens(
-                    f"{token.type:<15} {token_value:<30} Línea {token.lineno}, Columna {token.column}",
-                    'NORMAL'
-                )
+            if stream.error is not None:
+                raise stream.error
+            # Tras un error de sintaxis quedan tokens que el parser no pidió
+            self.current_tokens = stream.drain()
+            self.show_tokens()
             self.write_to_console("Análisis léxico completado", 'NORMAL')
         except Exception as e:
             error_msg = f"Error léxico: {str(e)}"
@@ -388,7 +416,7 @@ class CompiladorGUI:
 
         # Análisis sintáctico y semántico
         try:
-            self.ast = parse(code)
+            self.ast = result
             if isinstance(self.ast, str):
                 self.write_to_errors(self.ast)
                 self.write_to_console(self.ast, 'ERROR')
@@ -397,6 +425,7 @@ class CompiladorGUI:
                 self.write_to_ast("Árbol de Sintaxis Abstracta (AST):\n", 'INFO')
                 self.write_to_ast(str(self.ast), 'NORMAL')
                 self.write_to_console("Análisis sintáctico completado", 'SUCCESS')
+                self.ast_cache.store(code, self.current_tokens, self.ast)
             else:
                 error_msg = "No se pudo generar el AST"
                 self.write_to_errors(error_msg)
@@ -443,7 +472,8 @@ class CompiladorGUI:
             except subprocess.TimeoutExpired:
                 self.write_to_console("Error: La ejecución del código tardó demasiado tiempo", 'ERROR')
             except FileNotFoundError:
-                self.write_to_console("Error: Node.js no está instalado. Por favor, instala Node.js para ejecutar código JavaScript.", 'ERROR')
+                self.write_to_console("Node.js no está instalado: se ejecuta con el intérprete del compilador", 'INFO')
+                self.run_with_interpreter(code)
             
         except Exception as e:
             self.write_to_console(f"Error inesperado: {str(e)}", 'ERROR')
@@ -454,6 +484,27 @@ class CompiladorGUI:
             except:
                 pass
 
+    def run_with_interpreter(self, code):
+        ast = parse(code)
+        if not isinstance(ast, Node):
+            self.write_to_console(ast or "No se pudo generar el AST", 'ERROR')
+            return
+        interpreter = create_interpreter(DEFAULT_BACKEND)
+        # La salida de console.log se junta en memoria en lugar de ir a sys.stdout
+        output = interpreter.output = CaptureSink()
+        interpreter.budget = ExecutionBudget(max_seconds=5)
+        try:
+            interpreter.interpret(ast)
+            error = None
+        except (Exception, ExecutionLimitExceeded) as e:
+            error = str(e)
+        if output.lines:
+            self.write_to_console(output.getvalue().strip(), 'OUTPUT')
+        if error is not None:
+            self.write_to_console(f"Error en la ejecución: {error}", 'ERROR')
+        elif not output.lines:
+            self.write_to_console("Código ejecutado correctamente", 'SUCCESS')
+
     def _highlight_syntax(self, event=None):
         # Obtener todo el texto
         content = self.code_editor.get("1.0", tk.END)
@@ -1,8 +1,675 @@
+import contextlib
+import operator
+import sys
+import time
+from array import array
+from collections import OrderedDict
+from semantic_analyzer import SemanticAnalyzer
+from numeric import MAX_SAFE_INTEGER, MIN_SAFE_INTEGER
+
+def times(a, b):
+    # "x" * n arma el string de una sola vez: el largo se revisa y se descuenta
+    # del presupuesto antes de construirlo, como los arrays y los frames
+    if a.__class__ is str or b.__class__ is str:
+        text, count = (a, b) if a.__class__ is str else (b, a)
+        if count.__class__ is int and count > 0:
+            length = len(text) * count
+            if length > MAX_STRING_LENGTH:
+                raise Exception("Longitud de string inválida")
+            budget = ExecutionBudget.active
+            if budget is not None:
+                budget.allocate(length)
+    return a * b
+
+# Operadores cuyo resultado entero puede salir del rango exacto. Los backends
+# aplican la operación y revisan el rango en línea, sin otra llamada.
+INTEGER_OPERATORS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': times,
+}
+
+# A partir de este largo, el resultado de concatenar strings pasa a ser un
+# Rope y las concatenaciones siguientes no copian el texto
+ROPE_THRESHOLD = 256
+
+def normalize_result(value):
+    # Camino lento de +, - y *: los backends solo lo llaman cuando el
+    # resultado no es un float ni un int dentro del rango exacto
+    if value.__class__ is int and not MIN_SAFE_INTEGER <= value <= MAX_SAFE_INTEGER:
+        return float(value)
+    if value.__class__ is str and len(value) >= ROPE_THRESHOLD:
+        return Rope(value)
+    return value
+
+def _integer_operator(op):
+    def evaluate(a, b):
+        return normalize_result(op(a, b))
+    return evaluate
+
+add = _integer_operator(operator.add)
+subtract = _integer_operator(operator.sub)
+multiply = _integer_operator(times)
+
+# Operadores binarios, resueltos por los backends compilados al generar código
+BINARY_OPERATORS = {
+    '+': add,
+    '-': subtract,
+    '*': multiply,
+    '/': operator.truediv,
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+# Operadores lógicos: el operando derecho solo se evalúa si hace falta
+LOGICAL_OPERATORS = {'&&', '||'}
+
+# Evaluadores del intérprete de árbol, uno por operador. Reciben los nodos de
+# los operandos para que && y || decidan si evalúan el derecho.
+def _eager_evaluator(op):
+    def evaluate(interpreter, left, right):
+        return op(interpreter.interpret(left), interpreter.interpret(right))
+    return evaluate
+
+def _evaluate_and(interpreter, left, right):
+    value = interpreter.interpret(left)
+    return interpreter.interpret(right) if value else value
+
+def _evaluate_or(interpreter, left, right):
+    value = interpreter.interpret(left)
+    return value if value else interpreter.interpret(right)
+
+def _integer_evaluator(op):
+    def evaluate(interpreter, left, right):
+        result = op(interpreter.interpret(left), interpreter.interpret(right))
+        if result.__class__ is int and MIN_SAFE_INTEGER <= result <= MAX_SAFE_INTEGER or result.__class__ is float:
+            return result
+        return normalize_result(result)
+    return evaluate
+
+OPERATOR_EVALUATORS = {symbol: _eager_evaluator(op) for symbol, op in BINARY_OPERATORS.items()}
+OPERATOR_EVALUATORS.update((symbol, _integer_evaluator(op)) for symbol, op in INTEGER_OPERATORS.items())
+OPERATOR_EVALUATORS['&&'] = _evaluate_and
+OPERATOR_EVALUATORS['||'] = _evaluate_or
+
+# Error de un programa que agota la pila de llamadas. La máquina virtual de
+# bytecode lleva su propia pila y el intérprete de árbol le pasa sus llamadas
+# más profundas; los demás backends anidan frames de Python en cada llamada y
+# convierten el RecursionError en este mismo error.
+STACK_OVERFLOW_MESSAGE = "Se excedió el tamaño máximo de la pila de llamadas"
+
+def error_message(error):
+    # Mensaje que recibe la variable de un catch
+    if isinstance(error, RecursionError):
+        return STACK_OVERFLOW_MESSAGE
+    return str(error)
+
+# Pasos entre dos revisiones del reloj y del límite de pasos
+CHECK_INTERVAL = 1024
+
+# Error al agotar el presupuesto de ejecución. Hereda de BaseException para
+# que un try/catch del programa no pueda atraparlo y seguir ejecutando.
+class ExecutionLimitExceeded(BaseException):
+    pass
+
+# Presupuesto de una ejecución: pasos (iteraciones de ciclos y llamadas a
+# funciones), segundos de reloj y valores reservados (slots de frames,
+# elementos de arrays, propiedades de objetos y caracteres de los Rope que
+# forman las concatenaciones). Cada paso solo descuenta un contador; el reloj y el total de pasos
+# se revisan cada CHECK_INTERVAL pasos. None deja ese límite sin tope. Los
+# objetos del runtime cuentan sus reservas en el presupuesto activo.
+class ExecutionBudget:
+    active = None
+
+    def __init__(self, max_steps=None, max_seconds=None, max_allocations=None):
+        self.max_steps = max_steps
+        self.max_seconds = max_seconds
+        self.max_allocations = max_allocations
+        self.steps = 0
+        self.allocations = 0
+        self.remaining = 0
+        self.interval = 0
+        self.deadline = None
+
+    def start(self):
+        if self.max_seconds is not None:
+            self.deadline = time.perf_counter() + self.max_seconds
+        self.refill()
+
+    def refill(self):
+        interval = CHECK_INTERVAL
+        if self.max_steps is not None:
+            interval = min(interval, self.max_steps - self.steps)
+        self.interval = self.remaining = interval
+
+    def step(self):
+        self.remaining -= 1
+        if self.remaining < 0:
+            self.check()
+
+    def check(self):
+        self.steps += self.interval + 1
+        if self.max_steps is not None and self.steps > self.max_steps:
+            self.steps = self.max_steps
+            self.interval = self.remaining = 0
+            raise ExecutionLimitExceeded(f"Se excedió el límite de {self.max_steps} pasos")
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise ExecutionLimitExceeded(f"Se excedió el límite de {self.max_seconds} segundos")
+        self.refill()
+
+    def used_steps(self):
+        return self.steps + self.interval - self.remaining
+
+    def allocate(self, count):
+        self.allocations += count
+        if self.max_allocations is not None and self.allocations > self.max_allocations:
+            raise ExecutionLimitExceeded(f"Se excedió el límite de {self.max_allocations} valores reservados")
+
+# Caracteres que BufferedSink junta antes de escribirlos
+OUTPUT_BUFFER_SIZE = 8192
+
+def format_output(values):
+    # Línea de console.log: los valores separados por un espacio, como print
+    return ' '.join([str(value) for value in values])
+
+# Destino de la salida de console.log. Recibe cada línea ya formateada en
+# write y la entrega en flush, que el intérprete llama al terminar el
+# programa. active es el destino del programa en ejecución, para el código
+# generado que no tiene acceso al intérprete.
+class OutputSink:
+    active = None
+
+    def write(self, line):
+        raise NotImplementedError
+
+    def flush(self):
+        pass
+
+# Destino por defecto: junta las líneas en memoria y las escribe con un solo
+# write al llegar a limit caracteres o al terminar el programa, en lugar de
+# un write por console.log. Sin stream escribe en el sys.stdout del momento
+# del flush, así redirect_stdout sigue funcionando.
+class BufferedSink(OutputSink):
+    def __init__(self, stream=None, limit=OUTPUT_BUFFER_SIZE):
+        self.stream = stream
+        self.limit = limit
+        self.pending = []
+        self.size = 0
+
+    def write(self, line):
+        self.pending.append(line)
+        self.size += len(line) + 1
+        if self.size >= self.limit:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        stream = self.stream if self.stream is not None else sys.stdout
+        self.pending.append('')
+        text = '\n'.join(self.pending)
+        self.pending = []
+        self.size = 0
+        stream.write(text)
+        stream.flush()
+
+# Destino que guarda las líneas en memoria, para quien ejecuta el intérprete
+# y quiere la salida sin redirigir sys.stdout (por ejemplo la interfaz gráfica)
+class CaptureSink(OutputSink):
+    def __init__(self):
+        self.lines = []
+
+    def write(self, line):
+        self.lines.append(line)
+
+    def getvalue(self):
+        return ''.join(line + '\n' for line in self.lines)
+
+# Tipo de array de C según el tipo de número de los elementos
+ARRAY_TYPECODES = {int: 'q', float: 'd'}
+ELEMENT_TYPES = {typecode: kind for kind, typecode in ARRAY_TYPECODES.items()}
+
+# Array de JavaScript. Mientras todos sus elementos son enteros (o todos
+# float) se guardan en un array de C; al agregar otro tipo de valor pasa a
+# una lista. Un array vacío toma el tipo del primer elemento que recibe.
+class JSArray:
+    __slots__ = ('items',)
+
+    def __init__(self, elements=()):
+        elements = list(elements)
+        budget = ExecutionBudget.active
+        if budget is not None:
+            budget.allocate(len(elements))
+        kind = type(elements[0]) if elements else float
+        if kind in ARRAY_TYPECODES and all(type(element) is kind for element in elements):
+            self.items = array(ARRAY_TYPECODES[kind], elements)
+        else:
+            self.items = elements
+
+    @property
+    def length(self):
+        return len(self.items)
+
+    def push(self, value):
+        budget = ExecutionBudget.active
+        if budget is not None:
+            budget.allocate(1)
+        items = self.items
+        if type(items) is array and type(value) is not ELEMENT_TYPES[items.typecode]:
+            if items or type(value) not in ARRAY_TYPECODES:
+                self.items = list(items)
+            else:
+                self.items = array(ARRAY_TYPECODES[type(value)])
+        self.items.append(value)
+
+    def pop(self):
+        # Como en JavaScript, pop sobre un array vacío devuelve undefined
+        if not self.items:
+            return None
+        return self.items.pop()
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __repr__(self):
+        return repr(list(self.items))
+
+# Largo máximo de un string, como el de los motores de JavaScript
+MAX_STRING_LENGTH = 2 ** 29 - 24
+
+# String construido por concatenación. Guarda las dos partes sin copiarlas y
+# las une recién cuando se necesita el texto: al imprimirlo, compararlo o
+# usarlo como mensaje de error. Así s = s + parte dentro de un ciclo es lineal
+# en lugar de cuadrático. El texto unido queda guardado y se sueltan las partes.
+# Los caracteres se descuentan del presupuesto al crearlo y no al unirlo, así
+# un string que se duplica en cada iteración lo agota aunque nunca se imprima.
+# Se descuenta la parte más corta, la que se agrega a la otra: agregar un
+# trozo cuesta su largo y duplicar un string cuesta tanto como el resultado.
+class Rope:
+    __slots__ = ('left', 'right', 'length', 'flat')
+
+    def __init__(self, left, right=''):
+        length = len(left) + len(right)
+        if length > MAX_STRING_LENGTH:
+            raise Exception("Longitud de string inválida")
+        budget = ExecutionBudget.active
+        if budget is not None:
+            # Sin right es un string largo recién unido por Python: cuesta todo
+            added = len(right)
+            budget.allocate(min(len(left), added) if added else length)
+        self.left = left
+        self.right = right
+        self.length = length
+        self.flat = None
+
+    def __str__(self):
+        if self.flat is None:
+            # Recorrido con pila explícita: los ciclos generan árboles muy profundos
+            pieces = []
+            pending = [self]
+            while pending:
+                item = pending.pop()
+                if item.__class__ is not Rope:
+                    pieces.append(item)
+                elif item.flat is not None:
+                    pieces.append(item.flat)
+                else:
+                    pending.append(item.right)
+                    pending.append(item.left)
+            self.flat = ''.join(pieces)
+            self.left = self.flat
+            self.right = ''
+        return self.flat
+
+    def __add__(self, other):
+        if other.__class__ is str or other.__class__ is Rope:
+            return Rope(self, other)
+        # Con otros tipos falla igual que un str
+        return str(self) + other
+
+    def __radd__(self, other):
+        if other.__class__ is str:
+            return Rope(other, self)
+        return other + str(self)
+
+    def __len__(self):
+        return self.length
+
+    def __bool__(self):
+        return self.length > 0
+
+    def __eq__(self, other):
+        return str(self) == (str(other) if other.__class__ is Rope else other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __lt__(self, other):
+        return str(self) < (str(other) if other.__class__ is Rope else other)
+
+    def __le__(self, other):
+        return str(self) <= (str(other) if other.__class__ is Rope else other)
+
+    def __gt__(self, other):
+        return str(self) > (str(other) if other.__class__ is Rope else other)
+
+    def __ge__(self, other):
+        return str(self) >= (str(other) if other.__class__ is Rope else other)
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __repr__(self):
+        return repr(str(self))
+
+# Forma (hidden class) de un objeto: el orden de sus propiedades y el slot de
+# cada una. Los objetos creados con las mismas claves comparten su forma, así
+# los valores se guardan en una lista compacta y no en un dict por objeto.
+class Shape:
+    __slots__ = ('keys', 'offsets', 'slots', 'unique')
+
+    def __init__(self, literal_keys):
+        self.offsets = {}
+        for key in literal_keys:
+            self.offsets.setdefault(key, len(self.offsets))
+        self.keys = tuple(self.offsets)
+        # Slot de cada valor del literal; con claves repetidas gana el último
+        self.slots = tuple(self.offsets[key] for key in literal_keys)
+        self.unique = len(self.slots) == len(self.keys)
+
+    def build(self, values):
+        if self.unique:
+            return JSObject(self, values)
+        object_values = [None] * len(self.keys)
+        for slot, value in zip(self.slots, values):
+            object_values[slot] = value
+        return JSObject(self, object_values)
+
+    def __repr__(self):
+        return f"<forma {', '.join(self.keys)}>"
+
+_shapes = {}
+
+def shape_for(literal_keys):
+    literal_keys = tuple(literal_keys)
+    shape = _shapes.get(literal_keys)
+    if shape is None:
+        shape = _shapes[literal_keys] = Shape(literal_keys)
+    return shape
+
+class JSObject:
+    __slots__ = ('shape', 'values')
+
+    def __init__(self, shape, values):
+        budget = ExecutionBudget.active
+        if budget is not None:
+            budget.allocate(len(values))
+        self.shape = shape
+        self.values = values
+
+    def __repr__(self):
+        return "{" + ", ".join(f"{key!r}: {value!r}" for key, value in zip(self.shape.keys, self.values)) + "}"
+
+# Caché en línea de un acceso a propiedad: recuerda la última forma vista en
+# ese punto del programa y el slot de la propiedad en ella.
+class InlineCache:
+    __slots__ = ('name', 'shape', 'offset')
+
+    def __init__(self, name):
+        self.name = name
+        self.shape = None
+        self.offset = 0
+
+# Entradas que guarda por defecto la caché de funciones puras
+MEMO_CACHE_SIZE = 4096
+
+# Caché LRU de los resultados de las funciones puras. La clave es el cuerpo de
+# la función junto con el tipo y el valor de cada argumento (en Python true
+# y 1 son iguales). Al llenarse descarta la entrada usada hace más tiempo.
+class MemoCache:
+    def __init__(self, maxsize=MEMO_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        result = self.entries.get(key, default)
+        if result is default:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return result
+
+    def store(self, key, value):
+        entries = self.entries
+        entries[key] = value
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def __repr__(self):
+        return (f"<MemoCache {len(self.entries)}/{self.maxsize} aciertos={self.hits} "
+                f"fallos={self.misses} desalojos={self.evictions}>")
+
+def memo_key(func, args):
+    return (func.body, *[(arg.__class__, arg) for arg in args])
+
+def load_property(obj, cache):
+    if type(obj) is JSObject:
+        shape = obj.shape
+        if shape is not cache.shape:
+            offset = shape.offsets.get(cache.name)
+            if offset is None:
+                raise Exception(f"Propiedad '{cache.name}' no encontrada en el objeto")
+            cache.shape = shape
+            cache.offset = offset
+        return obj.values[cache.offset]
+    return get_property(obj, cache.name)
+
+def load_method(obj, cache):
+    # Método de un objeto: la función guardada en la propiedad
+    shape = obj.shape
+    if shape is not cache.shape:
+        offset = shape.offsets.get(cache.name)
+        if offset is None:
+            raise Exception(f"Método '{cache.name}' no soportado")
+        cache.shape = shape
+        cache.offset = offset
+    return obj.values[cache.offset]
+
+def get_element(array, array_name, index):
+    if type(array) is not JSArray:
+        raise Exception(f"'{array_name}' no es un array")
+
+    if index.__class__ is not int:
+        # 2.0 es el mismo número que 2 en JavaScript
+        if index.__class__ is not float or not index.is_integer():
+            raise Exception("Índice debe ser un número entero")
+        index = int(index)
+
+    if index < 0 or index >= len(array.items):
+        raise Exception("Índice fuera de rango")
+
+    return array.items[index]
+
+def get_property(obj, prop):
+    if type(obj) is JSObject:
+        offset = obj.shape.offsets.get(prop)
+        if offset is not None:
+            return obj.values[offset]
+    elif type(obj) is JSArray:
+        if prop == 'length':
+            return len(obj.items)
+    raise Exception(f"Propiedad '{prop}' no encontrada en el objeto")
+
+def call_method(obj, method, args):
+    if method == 'push':
+        if type(obj) is JSArray:
+            obj.push(args[0])
+            return None
+        else:
+            raise Exception("El método 'push' solo se puede usar en arrays")
+    elif method == 'pop':
+        if type(obj) is JSArray:
+            return obj.pop()
+        else:
+            raise Exception("El método 'pop' solo se puede usar en arrays")
+    else:
+        raise Exception(f"Método '{method}' no soportado")
+
+# Señales de terminación anticipada. Las sentencias devuelven una de estas
+# señales en lugar de lanzar excepciones; el valor de un return queda en
+# Interpreter.return_value.
+class Completion:
+    __slots__ = ('kind',)
+
+    def __init__(self, kind):
+        self.kind = kind
+
+    def __repr__(self):
+        return f"<{self.kind}>"
+
+BREAK = Completion('break')
+CONTINUE = Completion('continue')
+RETURN = Completion('return')
+
+# Sentencias que terminan el bloque actual. No se buscan dentro de funciones anidadas
+COMPLETION_NODES = {'Break', 'Continue', 'Return'}
+
+# Nodos que genera fusion.Fuser. Cada uno guarda el nodo original como primer
+# hijo: los backends sin evaluador propio traducen el original.
+FUSED_NODES = {'LocalUpdate', 'AccumulateElement', 'LocalCompare', 'CountedLoop'}
+
+# Etiquetas de case que pueden ir en la tabla de saltos de un switch
+LITERAL_NODES = {'Number', 'String', 'Boolean'}
+
+def switch_table(cases):
+    # Tabla de saltos de un switch: valor de cada etiqueta -> índice del primer
+    # caso con ese valor, el mismo que encuentra la comparación en orden con
+    # ==. None si alguna etiqueta no es un literal
+    table = {}
+    for index, (case_expr, _) in enumerate(cases):
+        if case_expr is None or case_expr.type not in LITERAL_NODES:
+            return None
+        table.setdefault(case_expr.value, index)
+    return table
+
+# Evaluadores que Interpreter.set_tracer reemplaza mientras hay un tracer
+TRACED_EVALUATORS = ('interpret_Statements', 'interpret_CountedLoop')
+
+def may_complete(node):
+    # Indica si una sentencia puede devolver una señal de terminación
+    if node is None or not hasattr(node, 'type'):
+        return False
+    if node.type in FUSED_NODES:
+        return may_complete(node.children[0])
+    if node.type in COMPLETION_NODES:
+        return True
+    if node.type in ('Program', 'Statements', 'Statement', 'IfStatement'):
+        return any(may_complete(child) for child in node.children)
+    if node.type in ('WhileStatement', 'ForStatement'):
+        # break y continue terminan en el propio ciclo; solo return se propaga
+        return contains_return(node.children[-1])
+    if node.type == 'SwitchStatement':
+        return (any(may_complete(case_stmts) for _, case_stmts in node.children[1])
+                or may_complete(node.children[2]))
+    if node.type == 'TryCatch':
+        return may_complete(node.children[0]) or may_complete(node.children[2])
+    return False
+
+def contains_return(node):
+    if node is None or not hasattr(node, 'type'):
+        return False
+    if node.type in FUSED_NODES:
+        return contains_return(node.children[0])
+    if node.type == 'Return':
+        return True
+    if node.type in ('Program', 'Statements', 'Statement', 'IfStatement', 'WhileStatement', 'ForStatement'):
+        return any(contains_return(child) for child in node.children)
+    if node.type == 'SwitchStatement':
+        return (any(contains_return(case_stmts) for _, case_stmts in node.children[1])
+                or contains_return(node.children[2]))
+    if node.type == 'TryCatch':
+        return contains_return(node.children[0]) or contains_return(node.children[2])
+    return False
+
+# Valor de un slot cuya declaración todavía no se ejecutó
+UNINITIALIZED = object()
+
+# Frame de tamaño fijo: las variables se acceden por slot con la dirección
+# (profundidad, slot) que asigna el SemanticAnalyzer, y parent apunta al
+# entorno donde se definió la función (encadenamiento léxico).
+class Environment:
+    __slots__ = ('values', 'parent')
+
+    def __init__(self, size, parent=None):
+        budget = ExecutionBudget.active
+        if budget is not None:
+            budget.allocate(size)
+        self.values = [UNINITIALIZED] * size
+        self.parent = parent
+
+    def frame(self, depth):
+        env = self
+        while depth:
+            env = env.parent
+            depth -= 1
+        return env
+
+# Función de JavaScript: guarda el entorno donde fue creada. code queda a
+# disposición de los backends para guardar el cuerpo ya compilado.
+class Function:
+    __slots__ = ('name', 'param_slots', 'body', 'frame_size', 'env', 'code')
+
+    def __init__(self, name, params, body, frame_size, env):
+        self.name = name
+        self.param_slots = tuple(param.address[1] for param in params.children)
+        self.body = body
+        self.frame_size = frame_size
+        self.env = env
+        self.code = None
+
+    def __repr__(self):
+        return f"<función {self.name}>"
+
+# Llamadas anidadas que el intérprete de árbol ejecuta sobre la pila de Python,
+# donde cada nivel de recursión ocupa unos quince frames. Las más profundas
+# siguen en la máquina virtual de bytecode, que guarda sus frames en una pila
+# propia hasta MAX_CALL_DEPTH
+TREE_CALL_DEPTH = 16
+
+def resolve_program(node):
+    # Asigna las direcciones de las variables si el AST no fue analizado
+    if getattr(node, 'frame_size', None) is None:
+        SemanticAnalyzer().analyze(node)
+
 class Interpreter:
     def __init__(self):
-        self.variables = {}
         self.functions = {}
-        self.current_scope = self.variables
+        self.environment = None
+        self.return_value = None
+        # MemoCache de las funciones puras; None desactiva la memoización
+        self.memo = None
+        # ExecutionBudget de la ejecución; None la deja sin límites
+        self.budget = None
+        # OutputSink que recibe la salida de console.log
+        self.output = BufferedSink()
+        # LineTracer que registra las líneas ejecutadas; se cambia con set_tracer
+        self.tracer = None
+        # Llamadas de JavaScript en curso sobre la pila de Python y la máquina
+        # virtual que sigue con las más profundas
+        self.call_depth = 0
+        self.deep_calls = None
 
     def interpret(self, node):
         if node is None:
@@ -12,6 +679,65 @@ class Interpreter:
         method = getattr(self, method_name, self.generic_interpret)
         return method(node)
 
+    @contextlib.contextmanager
+    def metered(self):
+        # Activa el presupuesto y el destino de la salida mientras corre el
+        # programa. La salida pendiente se escribe al terminar, también si
+        # el programa termina con un error
+        budget = self.budget
+        previous_budget = ExecutionBudget.active
+        previous_output = OutputSink.active
+        if budget is not None:
+            ExecutionBudget.active = budget
+            budget.start()
+        OutputSink.active = self.output
+        try:
+            yield
+        except RecursionError:
+            raise Exception(STACK_OVERFLOW_MESSAGE) from None
+        finally:
+            ExecutionBudget.active = previous_budget
+            OutputSink.active = previous_output
+            self.output.flush()
+
+    def set_tracer(self, tracer):
+        # El trazado reemplaza los evaluadores de TRACED_EVALUATORS en esta
+        # instancia; sin tracer se usan los de la clase, así el despacho normal
+        # no revisa ninguna bandera por nodo
+        for name in TRACED_EVALUATORS:
+            self.__dict__.pop(name, None)
+        self.tracer = tracer
+        if tracer is not None:
+            self.interpret_Statements = self.traced_Statements
+            self.interpret_CountedLoop = self.traced_CountedLoop
+
+    def traced_Statements(self, node):
+        # Una línea se registra una vez por ejecución: no cuentan las
+        # sentencias que siguen en la misma línea que la anterior del bloque ni
+        # las de un bloque en la misma línea que la sentencia que lo contiene
+        tracer = self.tracer
+        enclosing = tracer.line
+        previous = enclosing
+        try:
+            for child in node.children:
+                # Un bloque anidado no es una sentencia: se registran las suyas
+                if child.type != 'Statements':
+                    line = child.lineno
+                    if line != previous:
+                        tracer.line_hit(child)
+                        previous = line
+                    tracer.line = line
+                signal = self.interpret(child)
+                if signal.__class__ is Completion:
+                    return signal
+        finally:
+            tracer.line = enclosing
+
+    def traced_CountedLoop(self, node):
+        # El for original ejecuta su bloque completo, aunque tenga una sola
+        # sentencia, así cada sentencia del cuerpo pasa por traced_Statements
+        return self.interpret_ForStatement(node.children[0])
+
     def generic_interpret(self, node):
         if hasattr(node, 'children'):
             for child in node.children:
@@ -19,56 +745,55 @@ class Interpreter:
         return None
 
     def interpret_Program(self, node):
-        for child in node.children:
-            self.interpret(child)
+        resolve_program(node)
+        with self.metered():
+            self.environment = Environment(node.frame_size)
+            # El programa es un bloque: se ejecuta como Statements (o como su
+            # versión trazada)
+            self.interpret_Statements(node)
 
     def interpret_Statements(self, node):
         for child in node.children:
-            self.interpret(child)
+            signal = self.interpret(child)
+            if signal.__class__ is Completion:
+                return signal
+
+    def interpret_Statement(self, node):
+        return self.interpret(node.children[0])
+
+    def load(self, node):
+        if node.address is not None:
+            depth, slot = node.address
+            value = self.environment.frame(depth).values[slot]
+            if value is not UNINITIALIZED:
+                return value
+        raise Exception(f"Variable '{node.value}' no definida")
+
+    def store(self, address, value):
+        depth, slot = address
+        self.environment.frame(depth).values[slot] = value
 
     def interpret_Declaration(self, node):
-        var_name = node.children[0].value
         if len(node.children) > 1:
             value = self.interpret(node.children[1])
-            self.current_scope[var_name] = value
+            self.store(node.address, value)
         else:
-            self.current_scope[var_name] = None
+            self.store(node.address, None)
 
     def interpret_Assignment(self, node):
-        var_name = node.children[0].value
         value = self.interpret(node.children[1])
-        self.current_scope[var_name] = value
+        self.store(node.address, value)
         return value
 
     def interpret_BinaryOp(self, node):
-        left = self.interpret(node.children[0])
-        right = self.interpret(node.children[1])
-        op = node.value
+        # El evaluador se busca una sola vez por nodo
+        evaluate = node.operator
+        if evaluate is None:
+            evaluate = node.operator = OPERATOR_EVALUATORS[node.value]
+        return evaluate(self, node.children[0], node.children[1])
 
-        if op == '+':
-            return left + right
-        elif op == '-':
-            return left - right
-        elif op == '*':
-            return left * right
-        elif op == '/':
-            return left / right
-        elif op == '>':
-            return left > right
-        elif op == '<':
-            return left < right
-        elif op == '>=':
-            return left >= right
-        elif op == '<=':
-            return left <= right
-        elif op == '==':
-            return left == right
-        elif op == '!=':
-            return left != right
-        elif op == '&&':
-            return left and right
-        elif op == '||':
-            return left or right
+    # Comparación en la condición de un if o while
+    interpret_Condition = interpret_BinaryOp
 
     def interpret_Number(self, node):
         return node.value
@@ -76,59 +801,89 @@ class Interpreter:
     def interpret_String(self, node):
         return node.value
 
+    def interpret_Boolean(self, node):
+        return node.value
+
     def interpret_Identifier(self, node):
-        var_name = node.value
-        if var_name in self.current_scope:
-            value = self.current_scope[var_name]
-            # Si es un array, agregar la propiedad length
-            if isinstance(value, list):
-                return {
-                    'value': value,
-                    'length': len(value)
-                }
-            return value
-        raise Exception(f"Variable '{var_name}' no definida")
+        return self.load(node)
 
     def interpret_FunctionDeclaration(self, node):
         func_name = node.children[0].value
-        params = node.children[1]
-        body = node.children[2]
-        self.functions[func_name] = {
-            'params': params,
-            'body': body
-        }
+        func = Function(func_name, node.children[1], node.children[2], node.frame_size, self.environment)
+        self.store(node.address, func)
+        self.functions[func_name] = func
+
+    def lookup_function(self, node):
+        # Primero el scope léxico; si no se resolvió, las funciones declaradas por nombre
+        if node.address is not None:
+            depth, slot = node.address
+            func = self.environment.frame(depth).values[slot]
+            if isinstance(func, Function):
+                return func
+        func = self.functions.get(node.value)
+        if func is None:
+            raise Exception(f"Función '{node.value}' no definida")
+        return func
 
     def interpret_FunctionCall(self, node):
-        func_name = node.children[0].value
-        args = node.children[1]
-
-        if func_name not in self.functions:
-            raise Exception(f"Función '{func_name}' no definida")
-
-        func = self.functions[func_name]
-        params = func['params']
-        body = func['body']
-
-        # Crear nuevo scope para la función
-        old_scope = self.current_scope
-        self.current_scope = {}
-        
-        # Asignar argumentos a parámetros
-        for i, param in enumerate(params.children):
-            param_name = param.value
-            if i < len(args.children):
-                self.current_scope[param_name] = self.interpret(args.children[i])
-            else:
-                self.current_scope[param_name] = None
-
-        # Ejecutar cuerpo de la función
-        result = self.interpret(body)
-        
-        # Restaurar scope anterior
-        self.current_scope = old_scope
-        
+        func = self.lookup_function(node.children[0])
+        # Los argumentos se evalúan en el scope de quien llama
+        args = [self.interpret(arg) for arg in node.children[1].children]
+        return self.call_function(func, args)
+
+    def bind_arguments(self, func, args):
+        # Crear un frame nuevo encadenado al entorno donde se definió la función
+        env = Environment(func.frame_size, func.env)
+        for i, slot in enumerate(func.param_slots):
+            env.values[slot] = args[i] if i < len(args) else None
+        return env
+
+    def call_function(self, func, args):
+        if self.budget is not None:
+            self.budget.step()
+        key = None
+        if self.memo is not None and func.body.pure:
+            key = memo_key(func, args)
+            result = self.memo.get(key, UNINITIALIZED)
+            if result is not UNINITIALIZED:
+                return result
+        env = self.bind_arguments(func, args)
+        old_environment = self.environment
+        self.environment = env
+        try:
+            result = self.run_function(func, env)
+        finally:
+            self.environment = old_environment
+        if result.__class__ is Completion:
+            result = self.return_value if result is RETURN else None
+        if key is not None:
+            self.memo.store(key, result)
         return result
 
+    def run_function(self, func, env):
+        # Con un tracer todo queda en el árbol: la máquina virtual no registra
+        # las líneas que ejecuta
+        if self.call_depth >= TREE_CALL_DEPTH and self.tracer is None:
+            return self.deep_interpreter().run_function(func, env)
+        self.call_depth += 1
+        try:
+            return self.interpret(func.body)
+        finally:
+            self.call_depth -= 1
+
+    def deep_interpreter(self):
+        # La máquina virtual comparte las funciones declaradas, la caché, el
+        # presupuesto y la salida; el frame de la llamada ya está armado
+        vm = self.deep_calls
+        if vm is None:
+            from bytecode_vm import BytecodeInterpreter
+            vm = self.deep_calls = BytecodeInterpreter()
+        vm.functions = self.functions
+        vm.memo = self.memo
+        vm.budget = self.budget
+        vm.output = self.output
+        return vm
+
     def interpret_IfStatement(self, node):
         condition = self.interpret(node.children[0])
         if condition:
@@ -138,58 +893,47 @@ class Interpreter:
         return None
 
     def interpret_ArrayLiteral(self, node):
-        return [self.interpret(child) for child in node.children[0].children]
+        return JSArray([self.interpret(child) for child in node.children[0].children])
 
     def interpret_ArrayAccess(self, node):
-        array_name = node.children[0].value
+        array_node = node.children[0]
         index = self.interpret(node.children[1])
-        
-        if array_name not in self.current_scope:
-            raise Exception(f"Array '{array_name}' no definido")
-            
-        array = self.current_scope[array_name]
-        if isinstance(array, dict) and 'value' in array:
-            array = array['value']
-            
-        if not isinstance(array, list):
-            raise Exception(f"'{array_name}' no es un array")
-            
-        if not isinstance(index, int):
-            raise Exception("Índice debe ser un número entero")
-            
-        if index < 0 or index >= len(array):
-            raise Exception("Índice fuera de rango")
-            
-        return array[index]
+        return get_element(self.load(array_node), array_node.value, index)
 
     def interpret_ConsoleLog(self, node):
         args = [self.interpret(arg) for arg in node.children[0].children]
-        print(*args)
+        self.output.write(format_output(args))
         return None
 
     def interpret_Break(self, node):
-        raise BreakException()
+        return BREAK
+
+    def interpret_Continue(self, node):
+        return CONTINUE
+
+    def interpret_Return(self, node):
+        self.return_value = self.interpret(node.children[0])
+        return RETURN
 
     def interpret_WhileStatement(self, node):
         condition = node.children[0]
         body = node.children[1]
+        budget = self.budget
         while self.interpret(condition):
-            try:
-                self.interpret(body)
-            except BreakException:
+            if budget is not None:
+                budget.step()
+            signal = self.interpret(body)
+            if signal is BREAK:
                 break
+            if signal is RETURN:
+                return RETURN
 
     def interpret_PropertyAccess(self, node):
         obj = self.interpret(node.children[0])
-        prop = node.children[1].value
-        if isinstance(obj, dict) and prop in obj:
-            return obj[prop]
-        elif prop == 'length' and isinstance(obj, list):
-            return len(obj)
-        elif isinstance(obj, dict) and 'value' in obj and prop == 'length' and isinstance(obj['value'], list):
-            return len(obj['value'])
-        else:
-            raise Exception(f"Propiedad '{prop}' no encontrada en el objeto")
+        cache = node.cache
+        if cache is None:
+            cache = node.cache = InlineCache(node.children[1].value)
+        return load_property(obj, cache)
 
     def interpret_UnaryOp(self, node):
         op = node.value
@@ -202,21 +946,96 @@ class Interpreter:
         condition = node.children[1]
         update = node.children[2]
         body = node.children[3]
+        budget = self.budget
         self.interpret(init)
         while True:
             if condition is not None and not self.interpret(condition):
                 break
-            try:
-                self.interpret(body)
-            except BreakException:
+            if budget is not None:
+                budget.step()
+            signal = self.interpret(body)
+            if signal is BREAK:
                 break
+            if signal is RETURN:
+                return RETURN
             self.interpret(update)
 
+    # --- Nodos fusionados: evalúan el patrón completo sin pasar por interpret ---
+
+    def interpret_LocalUpdate(self, node):
+        # x = x op k
+        depth, slot, name, op, step = node.value
+        values = self.environment.frame(depth).values
+        value = values[slot]
+        if value is UNINITIALIZED:
+            raise Exception(f"Variable '{name}' no definida")
+        value = op(value, step)
+        if not (value.__class__ is int and MIN_SAFE_INTEGER <= value <= MAX_SAFE_INTEGER or value.__class__ is float):
+            value = normalize_result(value)
+        values[slot] = value
+        return value
+
+    def interpret_AccumulateElement(self, node):
+        # x = x op arr[i]
+        depth, slot, name, op, array_node, index_node = node.value
+        values = self.environment.frame(depth).values
+        value = values[slot]
+        if value is UNINITIALIZED:
+            raise Exception(f"Variable '{name}' no definida")
+        index = self.load(index_node)
+        value = op(value, get_element(self.load(array_node), array_node.value, index))
+        if not (value.__class__ is int and MIN_SAFE_INTEGER <= value <= MAX_SAFE_INTEGER or value.__class__ is float):
+            value = normalize_result(value)
+        values[slot] = value
+        return value
+
+    def interpret_LocalCompare(self, node):
+        # a < b o a < k
+        op, left, right, constant = node.value
+        if right is None:
+            return op(self.load(left), constant)
+        return op(self.load(left), self.load(right))
+
+    def interpret_CountedLoop(self, node):
+        # for (init; i < límite; i = i + k) con el contador en un slot fijo
+        init, depth, slot, name, compare, limit_node, limit, op, step, body = node.value
+        interpret = self.interpret
+        load = self.load
+        budget = self.budget
+        if body is not None and body.type == 'Statements' and len(body.children) == 1:
+            # Un bloque de una sola sentencia no necesita su propio nodo
+            body = body.children[0]
+        interpret(init)
+        values = self.environment.frame(depth).values
+        while True:
+            counter = values[slot]
+            if counter is UNINITIALIZED:
+                raise Exception(f"Variable '{name}' no definida")
+            if limit_node is not None:
+                limit = load(limit_node) if limit_node.type == 'Identifier' else interpret(limit_node)
+            if not compare(counter, limit):
+                break
+            if budget is not None:
+                budget.step()
+            signal = interpret(body)
+            if signal is BREAK:
+                break
+            if signal is RETURN:
+                return RETURN
+            # El cuerpo puede haber cambiado el contador
+            counter = values[slot]
+            if counter is UNINITIALIZED:
+                raise Exception(f"Variable '{name}' no definida")
+            counter = op(counter, step)
+            if not (counter.__class__ is int and MIN_SAFE_INTEGER <= counter <= MAX_SAFE_INTEGER or counter.__class__ is float):
+                counter = normalize_result(counter)
+            values[slot] = counter
+
     def interpret_ObjectLiteral(self, node):
-        obj = {}
-        for key, value_node in node.children[0]:
-            obj[key] = self.interpret(value_node)
-        return obj
+        shape = node.cache
+        if shape is None:
+            shape = node.cache = shape_for(key for key, _ in node.children[0])
+        return shape.build([self.interpret(value_node) for _, value_node in node.children[0]])
 
     def interpret_MethodCall(self, node):
         obj_node = node.children[0]
@@ -224,22 +1043,19 @@ class Interpreter:
         args_node = node.children[2]
 
         obj = self.interpret(obj_node)
-        method = method_node.value
         args = [self.interpret(arg) for arg in args_node.children]
+        cache = node.cache
+        if cache is None:
+            cache = node.cache = InlineCache(method_node.value)
+        return self.invoke_method(obj, cache, args)
 
-        if method == 'push':
-            if isinstance(obj, list):
-                obj.append(args[0])
-                return None
-            else:
-                raise Exception("El método 'push' solo se puede usar en arrays")
-        elif method == 'pop':
-            if isinstance(obj, list):
-                return obj.pop()
-            else:
-                raise Exception("El método 'pop' solo se puede usar en arrays")
-        else:
-            raise Exception(f"Método '{method}' no soportado")
+    def invoke_method(self, obj, cache, args):
+        if type(obj) is JSObject:
+            func = load_method(obj, cache)
+            if not isinstance(func, Function):
+                raise Exception(f"Método '{cache.name}' no soportado")
+            return self.call_function(func, args)
+        return call_method(obj, cache.name, args)
 
     def interpret_TernaryOp(self, node):
         condition = self.interpret(node.children[0])
@@ -249,58 +1065,51 @@ class Interpreter:
             return self.interpret(node.children[2])
 
     def interpret_ArrowFunction(self, node):
-        params = node.children[0]
-        expr = node.children[1]
-        def func(*args):
-            old_scope = self.current_scope
-            self.current_scope = {}
-            for i, param in enumerate(params.children):
-                self.current_scope[param.value] = args[i] if i < len(args) else None
-            result = self.interpret(expr)
-            self.current_scope = old_scope
-            return result
-        return func
+        # El cuerpo es una expresión: su valor es el resultado de la llamada
+        return Function('=>', node.children[0], node.children[1], node.frame_size, self.environment)
 
     def interpret_SwitchStatement(self, node):
-        expr = self.interpret(node.children[0])
-        cases = node.children[1]
-        default = node.children[2]
-        for case_expr, case_stmts in cases:
-            if self.interpret(case_expr) == expr:
-                self.interpret(case_stmts)
-                return
-        if default is not None:
-            self.interpret(default)
+        # La ejecución empieza en el caso que coincide y sigue por los casos
+        # siguientes y el default hasta un break, como en JavaScript. break
+        # termina el switch; continue y return se propagan
+        value = self.interpret(node.children[0])
+        dispatch = node.cache
+        if dispatch is None:
+            cases = node.children[1]
+            bodies = [case_stmts for _, case_stmts in cases] + [node.children[2]]
+            dispatch = node.cache = (switch_table(cases), bodies)
+        table, bodies = dispatch
+        default = len(bodies) - 1
+        if table is not None:
+            start = table.get(value, default)
+        else:
+            start = default
+            for index, (case_expr, _) in enumerate(node.children[1]):
+                if self.interpret(case_expr) == value:
+                    start = index
+                    break
+        for index in range(start, len(bodies)):
+            signal = self.interpret(bodies[index])
+            if signal is BREAK:
+                return None
+            if signal.__class__ is Completion:
+                return signal
 
     def interpret_AnonymousFunction(self, node):
-        params = node.children[0]
-        body = node.children[1]
-        def func(*args):
-            old_scope = self.current_scope
-            self.current_scope = {}
-            for i, param in enumerate(params.children):
-                self.current_scope[param.value] = args[i] if i < len(args) else None
-            result = self.interpret(body)
-            self.current_scope = old_scope
-            return result
-        return func
+        return Function('anónima', node.children[0], node.children[1], node.frame_size, self.environment)
 
     def interpret_TryCatch(self, node):
         try_block = node.children[0]
-        error_var = node.children[1]
         catch_block = node.children[2]
+        environment = self.environment
         try:
-            self.interpret(try_block)
+            return self.interpret(try_block)
         except Exception as e:
-            old_scope = self.current_scope
-            self.current_scope = dict(old_scope)  # Copia el scope actual
-            self.current_scope[error_var] = str(e)
-            self.interpret(catch_block)
-            self.current_scope = old_scope
+            self.environment = environment
+            self.store(node.address, error_message(e))
+            return self.interpret(catch_block)
 
     def interpret_Throw(self, node):
         value = self.interpret(node.children[0])
         raise Exception(value)
-
-class BreakException(Exception):
-    pass 
\ No newline at end of file
+ 
\ No newline at end of file
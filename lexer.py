@@ -1,4 +1,35 @@
 import ply.lex as lex
+import os
+import re
+import zlib
+from numeric import make_number
+
+# Con tablas congeladas el lexer y el parser se cargan de lextab.py y
+# parsetab.py sin recorrer las reglas t_*/p_*. Las tablas llevan el hash del
+# código que las generó: si lexer.py o parser.py cambian se construyen en
+# memoria hasta que build_tables.py las regenere; importar nunca escribe
+# archivos. JS_FROZEN_TABLES=0 vuelve a la construcción de PLY.
+FROZEN_TABLES = os.environ.get('JS_FROZEN_TABLES', '1') != '0'
+
+# Lexer de tokenize() y del parser: 'ply' (por defecto) o 'scanner' (Scanner,
+# más abajo, a prueba). Un nombre desconocido es un error, no el de siempre
+LEXER_NAMES = ('ply', 'scanner')
+LEXER = os.environ.get('JS_LEXER', 'ply')
+if LEXER not in LEXER_NAMES:
+    raise ValueError(f"Lexer '{LEXER}' desconocido en JS_LEXER. Opciones: {', '.join(LEXER_NAMES)}")
+
+TABLES_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def source_hash(*paths):
+    # CRC32 y no sha256: basta para detectar cambios y zlib importa mucho más
+    # rápido que hashlib, que sería la mitad del arranque del lexer
+    checksum = 0
+    for path in paths:
+        with open(path, 'rb') as f:
+            checksum = zlib.crc32(f.read(), checksum)
+    return f"{checksum:08x}"
+
+LEXER_HASH = source_hash(os.path.abspath(__file__))
 
 # Lista de tokens
 tokens = [
@@ -48,6 +79,7 @@ reserved = {
     'console': 'CONSOLE',
     'log': 'LOG',
     'break': 'BREAK',
+    'continue': 'CONTINUE',
     'for': 'FOR',
     'switch': 'SWITCH',
     'case': 'CASE',
@@ -99,7 +131,11 @@ def t_STRING(t):
 
 def t_NUMBER(t):
     r'\d*\.?\d+'
-    t.value = float(t.value)
+    # Los literales sin punto decimal son enteros
+    if '.' in t.value:
+        t.value = float(t.value)
+    else:
+        t.value = make_number(int(t.value))
     return t
 
 def t_ID(t):
@@ -123,25 +159,207 @@ def t_error(t):
     t.lexer.skip(1)
     raise SyntaxError(error_msg)
 
+# Lexer de PLY que empieza cada código en la línea 1, como el Scanner. El
+# parser de PLY llama a input() directamente y lex.Lexer no reinicia lineno
+# ni linestart, que p_error usa para ubicar el error.
+class PlyLexer(lex.Lexer):
+    def input(self, s):
+        super().input(s)
+        self.lineno = 1
+        self.linestart = 0
+
+def load_frozen_lexer():
+    # None si lextab.py no existe o lo generó otra versión de este archivo
+    frozen = PlyLexer()
+    try:
+        import lextab
+        if getattr(lextab, '_source_hash', None) != LEXER_HASH:
+            return None
+        frozen.readtab(lextab, globals())
+    except ImportError:
+        # Tampoco sirve una tabla escrita por otra versión de PLY
+        return None
+    return frozen
+
+def build_lexer():
+    # Construcción en memoria, sin escribir lextab.py. lex.lex() deja el lexer
+    # nuevo en lex.lexer; el que vale es el de abajo, si ya existe
+    previous = getattr(lex, 'lexer', None)
+    built = lex.lex()
+    built.__class__ = PlyLexer
+    lex.lexer = previous
+    return built
+
+def ply_lexer():
+    return (load_frozen_lexer() if FROZEN_TABLES else None) or build_lexer()
+
+def unescape(pattern):
+    return re.sub(r'\\(.)', r'\1', pattern)
+
+# Operadores: las reglas t_* que son cadenas. Como en PLY se prueban de la
+# expresión más larga a la más corta, así '==' gana sobre '='
+OPERATOR_RULES = sorted(((name, pattern) for name, pattern in globals().items()
+                         if name.startswith('t_') and name != 't_ignore' and isinstance(pattern, str)),
+                        key=lambda rule: len(rule[1]), reverse=True)
+OPERATOR_TYPES = {unescape(pattern): name[2:] for name, pattern in OPERATOR_RULES}
+
+# Una sola expresión con un grupo por regla, en el orden en que PLY arma la
+# suya: primero las funciones t_* en el orden del archivo y después los
+# operadores. Las expresiones son las mismas de las reglas, así los dos
+# lexers no pueden diferir. Los espacios de t_ignore se consumen delante de
+# cada token en lugar de ser una coincidencia aparte, y el último grupo toma
+# cualquier carácter ilegal.
+IGNORED = re.escape(t_ignore)
+MASTER_PATTERN = re.compile(f"[{IGNORED}]*(?:" + '|'.join([
+    f"(?P<STRING>{t_STRING.__doc__})",
+    f"(?P<NUMBER>{t_NUMBER.__doc__})",
+    f"(?P<ID>{t_ID.__doc__})",
+    f"(?P<NEWLINE>{t_newline.__doc__})",
+    f"(?P<COMMENT>{t_COMMENT.__doc__})",
+    "(?P<OPERATOR>" + '|'.join(pattern for _, pattern in OPERATOR_RULES) + ")",
+    f"(?P<ILLEGAL>[^{IGNORED}])",
+]) + ")", re.VERBOSE)
+
+# Token compacto del Scanner: sin __dict__ por instancia. El parser de PLY le
+# asigna lexer al token del error de sintaxis, por eso tiene ese atributo.
+class Token:
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'column', 'lexer')
+
+    def __init__(self, type, value, lineno, lexpos, column):
+        self.type = type
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+        self.column = column
+
+    def __repr__(self):
+        return f"Token({self.type},{self.value!r},{self.lineno},{self.column})"
+
+# Scanner de una pasada que reemplaza al lexer de PLY. Recorre el código con
+# finditer sobre MASTER_PATTERN y despacha por el número del grupo que
+# coincidió, sin una llamada a t_STRING/t_NUMBER/t_ID por token. Produce los
+# mismos tokens (tipo, valor, línea, columna y lexpos) y tiene la interfaz que
+# usa el parser de PLY: input() y token(), más lexdata, lineno y linestart.
+# Los espacios al final del código no coinciden con nada y finditer los salta.
+class Scanner:
+    def __init__(self):
+        self.lexdata = ''
+        self.lineno = 1
+        self.linestart = 0
+        self.stream = iter(())
+
+    def input(self, data):
+        self.lexdata = data
+        self.lineno = 1
+        self.linestart = 0
+        self.stream = self.scan(data)
+
+    def token(self):
+        return next(self.stream, None)
+
+    def __iter__(self):
+        return self.stream
+
+    def scan(self, data):
+        groups = MASTER_PATTERN.groupindex
+        STRING, NUMBER, ID = groups['STRING'], groups['NUMBER'], groups['ID']
+        NEWLINE, COMMENT, OPERATOR = groups['NEWLINE'], groups['COMMENT'], groups['OPERATOR']
+        operator_types = OPERATOR_TYPES
+        keywords = reserved
+        lineno = 1
+        linestart = 0
+        for match in MASTER_PATTERN.finditer(data):
+            kind = match.lastindex
+            value = match.group(kind)
+            if kind == OPERATOR:
+                type = operator_types[value]
+            elif kind == ID:
+                type = keywords.get(value, 'ID')
+            elif kind == NUMBER:
+                type = 'NUMBER'
+                value = float(value) if '.' in value else make_number(int(value))
+            elif kind == NEWLINE:
+                lineno += len(value)
+                linestart = self.linestart = match.end()
+                self.lineno = lineno
+                continue
+            elif kind == STRING:
+                type = 'STRING'
+                value = value[1:-1]
+            elif kind == COMMENT:
+                continue
+            else:
+                start = match.start(kind)
+                raise SyntaxError(f"Carácter ilegal '{value}' en la línea {lineno}, columna {start - linestart}")
+            start = match.start(kind)
+            yield Token(type, value, lineno, start, start - linestart + 1)
+
 # Construir el lexer
-lexer = lex.lex()
+lexer = Scanner() if LEXER == 'scanner' else ply_lexer()
 
-def tokenize(data):
+# Como con lex.lex(): parser.parse() sin lexer usa lex.lexer
+lex.lexer = lexer
+
+def iter_tokens(data, lexer=lexer):
+    # Los tokens de data uno por uno, con la columna calculada. Se generan a
+    # medida que se piden: nunca está la lista completa en memoria
     lexer.input(data)
     lexer.lineno = 1
     lexer.linestart = 0
-    tokens = []
-    
     try:
+        if isinstance(lexer, Scanner):
+            # Scanner ya calcula la columna
+            yield from lexer
+            return
         while True:
             tok = lexer.token()
             if not tok:
                 break
             # Calcular la columna
             tok.column = tok.lexpos - lexer.linestart + 1
-            tokens.append(tok)
-        return tokens
-    except SyntaxError as e:
-        raise e
+            yield tok
+    except SyntaxError:
+        raise
     except Exception as e:
-        raise SyntaxError(f"Error durante el análisis léxico: {str(e)}") 
\ No newline at end of file
+        raise SyntaxError(f"Error durante el análisis léxico: {str(e)}")
+
+def tokenize(data, lexer=lexer):
+    return list(iter_tokens(data, lexer))
+
+# Lexer para parser.parse() que entrega los tokens de a uno. Con keep=True
+# guarda los que le pasa al parser, para que la interfaz y el REPL los
+# muestren sin analizar el código dos veces; si no, no retiene ninguno. El
+# error léxico queda en error, aparte de los de sintaxis.
+class TokenStream:
+    def __init__(self, lexer=lexer, keep=False):
+        self.lexer = lexer
+        self.keep = keep
+        self.tokens = []
+        self.error = None
+        self.stream = iter(())
+
+    def input(self, data):
+        self.tokens = []
+        self.error = None
+        self.stream = iter_tokens(data, self.lexer)
+
+    def token(self):
+        try:
+            tok = next(self.stream, None)
+        except SyntaxError as e:
+            self.error = e
+            raise
+        if tok is not None and self.keep:
+            self.tokens.append(tok)
+        return tok
+
+    def drain(self):
+        # Después de un error de sintaxis: los tokens que el parser no pidió,
+        # también para encontrar un error léxico más adelante
+        while self.token() is not None:
+            pass
+        return self.tokens
+
+    def __getattr__(self, name):
+        # lexdata y linestart (los usa p_error) son los del lexer de verdad
+        return getattr(self.lexer, name)
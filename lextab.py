@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'ARROW', 'ASSIGN', 'BREAK', 'CASE', 'CATCH', 'COLON', 'COMMA', 'CONSOLE', 'CONST', 'CONTINUE', 'DEFAULT', 'DIVIDE', 'DOT', 'ELSE', 'EQUALS', 'FALSE', 'FOR', 'FUNCTION', 'GE', 'GT', 'ID', 'IF', 'LBRACE', 'LBRACKET', 'LE', 'LET', 'LOG', 'LPAREN', 'LT', 'MINUS', 'NOT', 'NOTEQUALS', 'NUMBER', 'OR', 'PLUS', 'QUESTION', 'RBRACE', 'RBRACKET', 'RETURN', 'RPAREN', 'SEMICOLON', 'STRING', 'SWITCH', 'THROW', 'TIMES', 'TRUE', 'TRY', 'VAR', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_STRING>\\"([^\\"\\\\]|\\\\.)*\\")|(?P<t_NUMBER>\\d*\\.?\\d+)|(?P<t_ID>[a-zA-Z_\\u00C0-\\u00FF][a-zA-Z0-9_\\u00C0-\\u00FF]*)|(?P<t_newline>\\n+)|(?P<t_COMMENT>//.*)|(?P<t_OR>\\|\\|)|(?P<t_PLUS>\\+)|(?P<t_TIMES>\\*)|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_LBRACE>\\{)|(?P<t_RBRACE>\\})|(?P<t_LBRACKET>\\[)|(?P<t_RBRACKET>\\])|(?P<t_EQUALS>==)|(?P<t_NOTEQUALS>!=)|(?P<t_GE>>=)|(?P<t_LE><=)|(?P<t_DOT>\\.)|(?P<t_AND>&&)|(?P<t_QUESTION>\\?)|(?P<t_ARROW>=>)|(?P<t_MINUS>-)|(?P<t_DIVIDE>/)|(?P<t_ASSIGN>=)|(?P<t_SEMICOLON>;)|(?P<t_COMMA>,)|(?P<t_COLON>:)|(?P<t_GT>>)|(?P<t_LT><)|(?P<t_NOT>!)', [None, ('t_STRING', 'STRING'), None, ('t_NUMBER', 'NUMBER'), ('t_ID', 'ID'), ('t_newline', 'newline'), ('t_COMMENT', 'COMMENT'), (None, 'OR'), (None, 'PLUS'), (None, 'TIMES'), (None, 'LPAREN'), (None, 'RPAREN'), (None, 'LBRACE'), (None, 'RBRACE'), (None, 'LBRACKET'), (None, 'RBRACKET'), (None, 'EQUALS'), (None, 'NOTEQUALS'), (None, 'GE'), (None, 'LE'), (None, 'DOT'), (None, 'AND'), (None, 'QUESTION'), (None, 'ARROW'), (None, 'MINUS'), (None, 'DIVIDE'), (None, 'ASSIGN'), (None, 'SEMICOLON'), (None, 'COMMA'), (None, 'COLON'), (None, 'GT'), (None, 'LT'), (None, 'NOT')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
+_source_hash = '90ca27e7'
@@ -1,10 +1,66 @@
-from lexer import tokenize
+from lexer import TokenStream
 from parser import parser
 from semantic_analyzer import SemanticAnalyzer
-from interpreter import Interpreter
+from optimizer import Optimizer
+from fusion import Fuser
+from purity import PurityAnalyzer
+from profiler import ProfilingInterpreter, Sampler, write_collapsed
+from tracing import LineTracer, executable_lines
+from ast_cache import ASTCache, DEFAULT_CACHE_DIR
+from interpreter import Interpreter, MemoCache, MEMO_CACHE_SIZE, ExecutionBudget, ExecutionLimitExceeded
+from backends import BACKENDS, DEFAULT_BACKEND, create_interpreter
+from bytecode_vm import compile_program
 from colorama import init, Fore, Style
+import argparse
+import sys
 
 def main():
+    arg_parser = argparse.ArgumentParser(description="Compilador de JavaScript en Python")
+    arg_parser.add_argument('--backend', choices=list(BACKENDS),
+                            help="Motor de ejecución a utilizar. El de árbol (por defecto) sigue las "
+                                 "llamadas más profundas en la VM de bytecode, que lleva su propia pila; "
+                                 "closure y tiered llegan a uno o dos cientos de niveles de recursión, python "
+                                 "a unos mil, y con --coverage, --trace o --profile deterministic el árbol "
+                                 "a unas decenas")
+    arg_parser.add_argument('--disassemble', action='store_true',
+                            help="Mostrar el bytecode generado antes de ejecutar")
+    arg_parser.add_argument('--no-optimize', action='store_true',
+                            help="Ejecutar el AST sin optimizarlo")
+    arg_parser.add_argument('--memoize', action='store_true',
+                            help="Guardar los resultados de las funciones puras")
+    arg_parser.add_argument('--memo-size', type=int, default=MEMO_CACHE_SIZE,
+                            help="Entradas máximas de la caché de funciones puras")
+    arg_parser.add_argument('--max-steps', type=int,
+                            help="Máximo de iteraciones de ciclos y llamadas a funciones")
+    arg_parser.add_argument('--timeout', type=float,
+                            help="Máximo de segundos de ejecución")
+    arg_parser.add_argument('--max-allocations', type=int,
+                            help="Máximo de valores reservados en frames, arrays, objetos y strings")
+    arg_parser.add_argument('--profile', choices=['deterministic', 'sampling'],
+                            help="Perfilar la ejecución: cada nodo y llamada, o muestreo del stack")
+    arg_parser.add_argument('--profile-output',
+                            help="Archivo de stacks colapsados para un flame graph")
+    arg_parser.add_argument('--coverage', action='store_true',
+                            help="Mostrar las líneas ejecutadas y las que no se alcanzaron")
+    arg_parser.add_argument('--trace', action='store_true',
+                            help="Escribir en stderr cada línea al ejecutarla")
+    arg_parser.add_argument('--no-cache', action='store_true',
+                            help="Analizar el código aunque ya esté en la caché de ASTs")
+    arg_parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                            help="Directorio de la caché de ASTs analizados")
+    args = arg_parser.parse_args()
+    # El perfilador determinista y el trazado de líneas solo miden el intérprete
+    # de árbol: otro backend pedido explícitamente no se ignora en silencio
+    tree_only = ('--profile deterministic' if args.profile == 'deterministic'
+                 else '--coverage' if args.coverage
+                 else '--trace' if args.trace else None)
+    if tree_only and args.backend not in (None, 'tree'):
+        arg_parser.error(f"{tree_only} solo funciona con el intérprete de árbol, "
+                         f"no con --backend {args.backend}")
+    if args.backend is None:
+        args.backend = DEFAULT_BACKEND
+    ast_cache = None if args.no_cache else ASTCache(args.cache_dir)
+
     init()  # Inicializar colorama para colores en la terminal
     print(Fore.CYAN + "Compilador de JavaScript en Python" + Style.RESET_ALL)
     print(Fore.YELLOW + "Escribe 'exit' para salir" + Style.RESET_ALL)
@@ -16,41 +72,119 @@ def main():
             if code.lower() == 'exit':
                 break
             
+            # Un programa ya analizado sin errores se toma de la caché con sus tokens
+            cached = ast_cache.load(code) if ast_cache is not None else None
+
             # Análisis léxico
             print(Fore.CYAN + "\n=== Análisis Léxico ===" + Style.RESET_ALL)
-            tokens = tokenize(code)
+            syntax_error = None
+            if cached is not None:
+                tokens, ast = cached
+            else:
+                # Una sola pasada: el parser lee los tokens del stream, que los
+                # guarda para mostrarlos aquí
+                stream = TokenStream(keep=True)
+                try:
+                    ast = parser.parse(code, lexer=stream)
+                except SyntaxError as e:
+                    if stream.error is not None:
+                        raise
+                    # El error de sintaxis se informa en su sección, después
+                    # de los tokens; un error léxico más adelante gana
+                    syntax_error = e
+                    stream.drain()
+                tokens = stream.tokens
             for token in tokens:
                 print(f"Token: {token.type}, Valor: {token.value}, Línea: {token.lineno}")
             
             # Análisis sintáctico
             print(Fore.CYAN + "\n=== Análisis Sintáctico ===" + Style.RESET_ALL)
             try:
-                ast = parser.parse(code)
+                if syntax_error is not None:
+                    raise syntax_error
                 if ast:
                     print(ast)
                 
                 # Análisis semántico
                 print(Fore.CYAN + "\n=== Análisis Semántico ===" + Style.RESET_ALL)
-                semantic_analyzer = SemanticAnalyzer()
-                semantic_analyzer.analyze(ast)
-                
-                errors = semantic_analyzer.get_errors()
+                if cached is not None:
+                    print("AST recuperado de la caché")
+                    errors = []
+                else:
+                    semantic_analyzer = SemanticAnalyzer()
+                    semantic_analyzer.analyze(ast)
+                    errors = semantic_analyzer.get_errors()
                 if errors:
                     print(Fore.RED + "Errores semánticos encontrados:" + Style.RESET_ALL)
                     for error in errors:
                         print(Fore.RED + f"- {error}" + Style.RESET_ALL)
                 else:
                     print(Fore.GREEN + "No se encontraron errores semánticos" + Style.RESET_ALL)
-                    
+                    if cached is None and ast_cache is not None and ast is not None:
+                        # Se guarda antes de optimizar: el optimizador modifica el AST
+                        ast_cache.store(code, tokens, ast)
+                    # Las líneas ejecutables se toman antes de optimizar
+                    executable = executable_lines(ast) if args.coverage else None
+
+                    if not args.no_optimize:
+                        print(Fore.CYAN + "\n=== Optimización ===" + Style.RESET_ALL)
+                        optimizer = Optimizer()
+                        ast = optimizer.optimize(ast)
+                        fuser = Fuser()
+                        ast = fuser.fuse(ast)
+                        print(f"Nodos eliminados: {optimizer.removed}")
+                        print(f"Patrones fusionados: {fuser.fused}")
+
+                    if args.memoize:
+                        purity_analyzer = PurityAnalyzer()
+                        purity_analyzer.analyze(ast)
+                        print(f"Funciones puras: {purity_analyzer.pure}")
+
+                    if args.disassemble:
+                        print(Fore.CYAN + "\n=== Bytecode ===" + Style.RESET_ALL)
+                        print(compile_program(ast))
+
                     # Ejecución del código
                     print(Fore.CYAN + "\n=== Resultado de la Ejecución ===" + Style.RESET_ALL)
-                    interpreter = Interpreter()
+                    if args.profile == 'deterministic':
+                        # El perfilador determinista mide sobre el intérprete de árbol
+                        interpreter = ProfilingInterpreter()
+                    elif args.coverage or args.trace:
+                        # El trazado de líneas solo pasa por el intérprete de árbol
+                        interpreter = Interpreter()
+                    else:
+                        interpreter = create_interpreter(args.backend)
+                    tracer = None
+                    if args.coverage or args.trace:
+                        tracer = LineTracer(code, sys.stderr if args.trace else None)
+                        interpreter.set_tracer(tracer)
+                    if args.memoize:
+                        interpreter.memo = MemoCache(args.memo_size)
+                    if args.max_steps is not None or args.timeout is not None or args.max_allocations is not None:
+                        interpreter.budget = ExecutionBudget(args.max_steps, args.timeout, args.max_allocations)
+                    profiler = interpreter if args.profile == 'deterministic' else None
                     try:
-                        result = interpreter.interpret(ast)
+                        if args.profile == 'sampling':
+                            with Sampler() as profiler:
+                                result = interpreter.interpret(ast)
+                        else:
+                            result = interpreter.interpret(ast)
                         if result is not None:
                             print(Fore.GREEN + f"Resultado: {result}" + Style.RESET_ALL)
-                    except Exception as e:
+                    except (Exception, ExecutionLimitExceeded) as e:
                         print(Fore.RED + f"Error en la ejecución: {str(e)}" + Style.RESET_ALL)
+                    if profiler is not None:
+                        print(Fore.CYAN + "\n=== Perfil ===" + Style.RESET_ALL)
+                        print(profiler.report())
+                        if args.profile_output:
+                            write_collapsed(profiler.collapsed(), args.profile_output)
+                    if executable is not None:
+                        print(Fore.CYAN + "\n=== Cobertura ===" + Style.RESET_ALL)
+                        print(tracer.report(executable))
+                    if interpreter.memo is not None:
+                        memo = interpreter.memo
+                        print(f"Memoización: {memo.hits} aciertos, {memo.misses} fallos, "
+                              f"{memo.evictions} desalojos (máximo {memo.maxsize} entradas)")
                     
             except Exception as e:
                 print(Fore.RED + f"Error en el análisis: {str(e)}" + Style.RESET_ALL)
@@ -0,0 +1,11 @@
+# Los números enteros se guardan como int mientras un double los represente
+# exactamente; si una operación sale de ese rango o es una división, el
+# resultado es float, como en JavaScript. Así los contadores e índices no
+# pasan por float. Lo usan el lexer y los backends, sin depender entre sí.
+MAX_SAFE_INTEGER = 2 ** 53 - 1
+MIN_SAFE_INTEGER = -MAX_SAFE_INTEGER
+
+def make_number(value):
+    if value.__class__ is int and not MIN_SAFE_INTEGER <= value <= MAX_SAFE_INTEGER:
+        return float(value)
+    return value
@@ -0,0 +1,183 @@
+from syntax_tree import Node, copy_position
+from interpreter import BINARY_OPERATORS, LOGICAL_OPERATORS, Rope
+
+# Literales cuyo valor se conoce antes de ejecutar
+LITERAL_NODES = {'Number', 'String', 'Boolean'}
+
+# Sentencias después de las cuales el resto del bloque no se ejecuta
+TERMINATOR_NODES = {'Return', 'Throw', 'Break', 'Continue'}
+
+def count_nodes(tree):
+    count = 0
+    pending = [tree]
+    while pending:
+        item = pending.pop()
+        if isinstance(item, Node):
+            count += 1
+            pending.extend(item.children)
+        elif isinstance(item, (list, tuple)):
+            pending.extend(item)
+    return count
+
+def make_literal(value, source):
+    # bool va antes que int porque True también es un int en Python. El
+    # literal toma la posición del nodo source que reemplaza
+    if isinstance(value, bool):
+        return copy_position(Node('Boolean', value=value), source)
+    if isinstance(value, (int, float)):
+        return copy_position(Node('Number', value=value), source)
+    if isinstance(value, (str, Rope)):
+        return copy_position(Node('String', value=str(value)), source)
+    return None
+
+def is_literal(node):
+    return isinstance(node, Node) and node.type in LITERAL_NODES
+
+# Optimizador que reescribe el AST antes de ejecutarlo: pliega operaciones
+# entre literales, elimina ramas con condición constante, quita los nodos
+# Statement y las sentencias inalcanzables. Corre después del análisis
+# semántico y modifica los nodos en su lugar, así se conservan las
+# direcciones y los tamaños de frame ya asignados. Las operaciones que fallan
+# (por ejemplo 1 / 0) se dejan para que el error ocurra al ejecutar.
+class Optimizer:
+    def __init__(self):
+        self.removed = 0
+
+    def optimize(self, ast):
+        before = count_nodes(ast)
+        ast = self.visit(ast)
+        self.removed += before - count_nodes(ast)
+        return ast
+
+    def visit(self, tree):
+        # Cada método es un generador que cede los hijos a optimizar y recibe
+        # el nodo que los reemplaza. La pila de trabajo es explícita, así un
+        # anidamiento profundo no agota la pila de Python.
+        if not isinstance(tree, Node):
+            return tree
+        pending = [self.start(tree)]
+        result = None
+        while pending:
+            try:
+                child = pending[-1].send(result)
+            except StopIteration as stop:
+                pending.pop()
+                result = stop.value
+                continue
+            if isinstance(child, Node):
+                pending.append(self.start(child))
+                result = None
+            else:
+                result = child
+        return result
+
+    def start(self, node):
+        return getattr(self, f'optimize_{node.type}', self.generic_optimize)(node)
+
+    def generic_optimize(self, node):
+        children = []
+        for child in node.children:
+            children.append((yield child))
+        node.children = children
+        return node
+
+    def optimize_Program(self, node):
+        statements = []
+        for child in node.children:
+            child = yield child
+            if child is None:
+                continue
+            # Los bloques que quedan de un if eliminado se integran al bloque actual
+            if child.type == 'Statements':
+                statements.extend(child.children)
+            else:
+                statements.append(child)
+            if statements and statements[-1].type in TERMINATOR_NODES:
+                break
+        node.children = statements
+        return node
+
+    optimize_Statements = optimize_Program
+
+    def optimize_Statement(self, node):
+        return (yield node.children[0])
+
+    def optimize_BinaryOp(self, node):
+        yield from self.generic_optimize(node)
+        left, right = node.children
+        if node.value in LOGICAL_OPERATORS:
+            # Con el operando izquierdo constante, el cortocircuito ya se conoce
+            if not is_literal(left):
+                return node
+            if node.value == '&&':
+                return right if left.value else left
+            return left if left.value else right
+        op = BINARY_OPERATORS.get(node.value)
+        if op is None or not is_literal(left) or not is_literal(right):
+            return node
+        if node.value == '*' and (isinstance(left.value, str) or isinstance(right.value, str)):
+            # "x" * n se arma al ejecutar, donde se descuenta del presupuesto
+            return node
+        try:
+            value = op(left.value, right.value)
+        except Exception:
+            return node
+        return make_literal(value, node) or node
+
+    optimize_Condition = optimize_BinaryOp
+
+    def optimize_UnaryOp(self, node):
+        yield from self.generic_optimize(node)
+        operand = node.children[0]
+        if node.value == '!' and is_literal(operand):
+            return make_literal(not operand.value, node)
+        return node
+
+    def optimize_TernaryOp(self, node):
+        yield from self.generic_optimize(node)
+        condition, then_branch, else_branch = node.children
+        if is_literal(condition):
+            return then_branch if condition.value else else_branch
+        return node
+
+    def optimize_IfStatement(self, node):
+        yield from self.generic_optimize(node)
+        condition = node.children[0]
+        if not is_literal(condition):
+            return node
+        if condition.value:
+            return node.children[1]
+        if len(node.children) > 2:
+            return node.children[2]
+        return None
+
+    def optimize_WhileStatement(self, node):
+        yield from self.generic_optimize(node)
+        condition = node.children[0]
+        if is_literal(condition) and not condition.value:
+            return None
+        return node
+
+    def optimize_ForStatement(self, node):
+        yield from self.generic_optimize(node)
+        condition = node.children[1]
+        if is_literal(condition) and not condition.value:
+            # Solo se ejecuta la inicialización
+            return node.children[0]
+        return node
+
+    def optimize_SwitchStatement(self, node):
+        expr, cases, default = node.children
+        expr = yield expr
+        optimized_cases = []
+        for case_expr, case_stmts in cases:
+            optimized_cases.append(((yield case_expr), (yield case_stmts)))
+        node.children = [expr, optimized_cases, (yield default)]
+        return node
+
+    def optimize_ObjectLiteral(self, node):
+        properties = []
+        for key, value in node.children[0]:
+            properties.append((key, (yield value)))
+        node.children = [properties]
+        return node
@@ -1,28 +1,58 @@
 import ply.yacc as yacc
-from lexer import tokens
+from lexer import tokens, FROZEN_TABLES, TABLES_DIR, source_hash
 from semantic_analyzer import SemanticAnalyzer
+from syntax_tree import Node
+from pratt import PrattParser
+import bisect
+import os
+import re
 import sys
 
-class Node:
-    def __init__(self, type, children=None, value=None):
-        self.type = type
-        self.children = children if children else []
-        self.value = value
-
-    def __str__(self, level=0):
-        ret = "  " * level + f"Type: {self.type}"
-        if self.value is not None:
-            ret += f", Value: {self.value}"
-        ret += "\n"
-        for child in self.children:
-            ret += child.__str__(level + 1)
-        return ret
+# Hash de la gramática: los tokens salen de lexer.py y las reglas de este archivo
+GRAMMAR_HASH = source_hash(os.path.join(TABLES_DIR, 'lexer.py'), os.path.abspath(__file__))
+
+# Parser que usa parser.parse(): 'ply' (tablas LALR, por defecto) o 'pratt'
+# (descendente, a prueba). Un nombre desconocido es un error, no el de siempre
+PARSER_NAMES = ('ply', 'pratt')
+PARSER = os.environ.get('JS_PARSER', 'ply')
+if PARSER not in PARSER_NAMES:
+    raise ValueError(f"Parser '{PARSER}' desconocido en JS_PARSER. Opciones: {', '.join(PARSER_NAMES)}")
+
+def line_offsets(lexer):
+    # Posición donde empieza cada línea del código que se está analizando, para
+    # los tokens del lexer de PLY, que no traen la columna. Se
+    # calcula una vez por código: lexer.lineno no se reinicia entre dos
+    # llamadas a parser.parse, la posición del token sí
+    data = lexer.lexdata
+    if getattr(lexer, 'offsets_source', None) is not data:
+        lexer.offsets_source = data
+        lexer.line_offsets = [0] + [match.end() for match in re.finditer('\n', data)]
+    return lexer.line_offsets
+
+def locate(node, p, index):
+    # Asigna al nodo la posición del símbolo index de la producción: la del
+    # nodo ya construido si es un no terminal, o la del token
+    symbol = p.slice[index]
+    value = symbol.value
+    if value.__class__ is Node:
+        node.lineno = value.lineno
+        node.column = value.column
+    elif getattr(symbol, 'column', None) is not None:
+        # Los tokens del Scanner ya traen la línea y la columna
+        node.lineno = symbol.lineno
+        node.column = symbol.column
+    else:
+        lexpos = symbol.lexpos
+        offsets = line_offsets(p.lexer)
+        node.lineno = bisect.bisect_right(offsets, lexpos)
+        node.column = lexpos - offsets[node.lineno - 1] + 1
+    return node
 
 def p_program(p):
     '''program : statements
                | empty'''
     if len(p) == 2 and p[1] is not None:
-        p[0] = Node('Program', [p[1]])
+        p[0] = locate(Node('Program', [p[1]]), p, 1)
     else:
         p[0] = Node('Program', [])
 
@@ -34,7 +64,7 @@ def p_statements(p):
         if isinstance(p[1], list):
             p[0] = Node('Statements', p[1])
         else:
-            p[0] = Node('Statements', [p[1]])
+            p[0] = locate(Node('Statements', [p[1]]), p, 1)
     elif len(p) == 3:
         p[1].children.append(p[2])
         p[0] = p[1]
@@ -58,18 +88,19 @@ def p_statement(p):
                 | while_statement
                 | for_statement
                 | break_statement
+                | continue_statement
                 | switch_statement
                 | try_catch_statement
                 | throw_statement'''
-    p[0] = Node('Statement', [p[1]])
+    p[0] = locate(Node('Statement', [p[1]]), p, 1)
 
 def p_function_declaration(p):
     '''function_declaration : FUNCTION ID LPAREN parameter_list RPAREN block'''
-    p[0] = Node('FunctionDeclaration', [
-        Node('Identifier', value=p[2]),
+    p[0] = locate(Node('FunctionDeclaration', [
+        locate(Node('Identifier', value=p[2]), p, 2),
         p[4],  # parameter_list
         p[6]   # block (statements)
-    ])
+    ]), p, 1)
 
 def p_parameter_list(p):
     '''parameter_list : 
@@ -78,14 +109,14 @@ def p_parameter_list(p):
     if len(p) == 1:
         p[0] = Node('Parameters', [])
     elif len(p) == 2:
-        p[0] = Node('Parameters', [Node('Parameter', value=p[1])])
+        p[0] = locate(Node('Parameters', [locate(Node('Parameter', value=p[1]), p, 1)]), p, 1)
     else:
-        p[1].children.append(Node('Parameter', value=p[3]))
+        p[1].children.append(locate(Node('Parameter', value=p[3]), p, 3))
         p[0] = p[1]
 
 def p_statement_return(p):
     '''statement : RETURN expression SEMICOLON'''
-    p[0] = Node('Return', [p[2]])
+    p[0] = locate(Node('Return', [p[2]]), p, 1)
 
 def p_declaration(p):
     '''declaration : VAR ID
@@ -95,13 +126,13 @@ def p_declaration(p):
                   | LET ID ASSIGN expression
                   | CONST ID ASSIGN expression'''
     if len(p) == 3:
-        p[0] = Node('Declaration', [Node('Identifier', value=p[2])], value=p[1])
+        p[0] = locate(Node('Declaration', [locate(Node('Identifier', value=p[2]), p, 2)], value=p[1]), p, 1)
     else:
-        p[0] = Node('Declaration', [Node('Identifier', value=p[2]), p[4]], value=p[1])
+        p[0] = locate(Node('Declaration', [locate(Node('Identifier', value=p[2]), p, 2), p[4]], value=p[1]), p, 1)
 
 def p_assignment(p):
     '''assignment : ID ASSIGN expression'''
-    p[0] = Node('Assignment', [Node('Identifier', value=p[1]), p[3]])
+    p[0] = locate(Node('Assignment', [locate(Node('Identifier', value=p[1]), p, 1), p[3]]), p, 1)
 
 def p_expression(p):
     '''expression : expression QUESTION expression COLON expression
@@ -119,11 +150,11 @@ def p_expression(p):
                  | array_literal
                  | array_access'''
     if len(p) == 6:
-        p[0] = Node('TernaryOp', [p[1], p[3], p[5]])
+        p[0] = locate(Node('TernaryOp', [p[1], p[3], p[5]]), p, 1)
     elif len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = Node('BinaryOp', [p[1], p[3]], value=p[2])
+        p[0] = locate(Node('BinaryOp', [p[1], p[3]], value=p[2]), p, 1)
 
 def p_term(p):
     '''term : factor
@@ -132,7 +163,7 @@ def p_term(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = Node('BinaryOp', [p[1], p[3]], value=p[2])
+        p[0] = locate(Node('BinaryOp', [p[1], p[3]], value=p[2]), p, 1)
 
 def p_factor(p):
     '''factor : NUMBER
@@ -154,25 +185,25 @@ def p_factor(p):
             p[0] = p[1]
         else:
             if isinstance(p[1], (int, float)):
-                p[0] = Node('Number', value=p[1])
+                p[0] = locate(Node('Number', value=p[1]), p, 1)
             elif p.slice[1].type == 'STRING':
-                p[0] = Node('String', value=p[1])
+                p[0] = locate(Node('String', value=p[1]), p, 1)
             elif p[1] == 'true':
-                p[0] = Node('Boolean', value=True)
+                p[0] = locate(Node('Boolean', value=True), p, 1)
             elif p[1] == 'false':
-                p[0] = Node('Boolean', value=False)
+                p[0] = locate(Node('Boolean', value=False), p, 1)
             elif p.slice[1].type == 'TRUE':
-                p[0] = Node('Boolean', value=True)
+                p[0] = locate(Node('Boolean', value=True), p, 1)
             elif p.slice[1].type == 'FALSE':
-                p[0] = Node('Boolean', value=False)
+                p[0] = locate(Node('Boolean', value=False), p, 1)
             else:
-                p[0] = Node('Identifier', value=p[1])
+                p[0] = locate(Node('Identifier', value=p[1]), p, 1)
     else:
-        p[0] = Node('UnaryOp', [p[2]], value=p[1])
+        p[0] = locate(Node('UnaryOp', [p[2]], value=p[1]), p, 1)
 
 def p_function_call(p):
     '''function_call : ID LPAREN arguments RPAREN'''
-    p[0] = Node('FunctionCall', [Node('Identifier', value=p[1]), p[3]])
+    p[0] = locate(Node('FunctionCall', [locate(Node('Identifier', value=p[1]), p, 1), p[3]]), p, 1)
 
 def p_method_call(p):
     '''method_call : console_log
@@ -180,13 +211,13 @@ def p_method_call(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        object_node = Node('Identifier', value=p[1])
-        method_node = Node('Identifier', value=p[3])
-        p[0] = Node('MethodCall', [object_node, method_node, p[5]])
+        object_node = locate(Node('Identifier', value=p[1]), p, 1)
+        method_node = locate(Node('Identifier', value=p[3]), p, 3)
+        p[0] = locate(Node('MethodCall', [object_node, method_node, p[5]]), p, 1)
 
 def p_console_log(p):
     '''console_log : CONSOLE DOT LOG LPAREN arguments RPAREN'''
-    p[0] = Node('ConsoleLog', [p[5]])
+    p[0] = locate(Node('ConsoleLog', [p[5]]), p, 1)
 
 def p_arguments(p):
     '''arguments : 
@@ -195,7 +226,7 @@ def p_arguments(p):
     if len(p) == 1:
         p[0] = Node('Arguments', [])
     elif len(p) == 2:
-        p[0] = Node('Arguments', [p[1]])
+        p[0] = locate(Node('Arguments', [p[1]]), p, 1)
     else:
         p[1].children.append(p[3])
         p[0] = p[1]
@@ -204,9 +235,9 @@ def p_if_statement(p):
     '''if_statement : IF LPAREN condition RPAREN block
                    | IF LPAREN condition RPAREN block ELSE block'''
     if len(p) == 6:  # if sin else
-        p[0] = Node('IfStatement', [p[3], p[5]])
+        p[0] = locate(Node('IfStatement', [p[3], p[5]]), p, 1)
     else:  # if con else
-        p[0] = Node('IfStatement', [p[3], p[5], p[7]])
+        p[0] = locate(Node('IfStatement', [p[3], p[5], p[7]]), p, 1)
 
 def p_condition(p):
     '''condition : expression
@@ -219,11 +250,11 @@ def p_condition(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = Node('Condition', [p[1], p[3]], value=p[2])
+        p[0] = locate(Node('Condition', [p[1], p[3]], value=p[2]), p, 1)
 
 def p_array_literal(p):
     '''array_literal : LBRACKET array_elements RBRACKET'''
-    p[0] = Node('ArrayLiteral', [p[2]])
+    p[0] = locate(Node('ArrayLiteral', [p[2]]), p, 1)
 
 def p_array_elements(p):
     '''array_elements : 
@@ -232,18 +263,18 @@ def p_array_elements(p):
     if len(p) == 1:
         p[0] = Node('ArrayElements', [])
     elif len(p) == 2:
-        p[0] = Node('ArrayElements', [p[1]])
+        p[0] = locate(Node('ArrayElements', [p[1]]), p, 1)
     else:
         p[1].children.append(p[3])
         p[0] = p[1]
 
 def p_array_access(p):
     '''array_access : ID LBRACKET expression RBRACKET'''
-    p[0] = Node('ArrayAccess', [Node('Identifier', value=p[1]), p[3]])
+    p[0] = locate(Node('ArrayAccess', [locate(Node('Identifier', value=p[1]), p, 1), p[3]]), p, 1)
 
 def p_while_statement(p):
     'while_statement : WHILE LPAREN condition RPAREN block'
-    p[0] = Node('WhileStatement', [p[3], p[5]])
+    p[0] = locate(Node('WhileStatement', [p[3], p[5]]), p, 1)
 
 def p_block(p):
     'block : LBRACE statements RBRACE'
@@ -255,15 +286,20 @@ def p_empty(p):
 
 def p_property_access(p):
     'property_access : ID DOT ID'
-    p[0] = Node('PropertyAccess', [Node('Identifier', value=p[1]), Node('Identifier', value=p[3])])
+    p[0] = locate(Node('PropertyAccess', [locate(Node('Identifier', value=p[1]), p, 1),
+                                          locate(Node('Identifier', value=p[3]), p, 3)]), p, 1)
 
 def p_break_statement(p):
     'break_statement : BREAK SEMICOLON'
-    p[0] = Node('Break')
+    p[0] = locate(Node('Break'), p, 1)
+
+def p_continue_statement(p):
+    'continue_statement : CONTINUE SEMICOLON'
+    p[0] = locate(Node('Continue'), p, 1)
 
 def p_for_statement(p):
     'for_statement : FOR LPAREN for_init SEMICOLON for_condition SEMICOLON for_update RPAREN block'
-    p[0] = Node('ForStatement', [p[3], p[5], p[7], p[9]])
+    p[0] = locate(Node('ForStatement', [p[3], p[5], p[7], p[9]]), p, 1)
 
 def p_for_init(p):
     '''for_init : declaration
@@ -314,7 +350,7 @@ def p_error(p):
 
 def p_object_literal(p):
     'object_literal : LBRACE object_properties RBRACE'
-    p[0] = Node('ObjectLiteral', [p[2]])
+    p[0] = locate(Node('ObjectLiteral', [p[2]]), p, 1)
 
 def p_object_properties(p):
     '''object_properties : object_property
@@ -334,11 +370,11 @@ def p_object_property(p):
 
 def p_arrow_function(p):
     'arrow_function : LPAREN parameter_list RPAREN ARROW expression'
-    p[0] = Node('ArrowFunction', [p[2], p[5]])
+    p[0] = locate(Node('ArrowFunction', [p[2], p[5]]), p, 1)
 
 def p_switch_statement(p):
     'switch_statement : SWITCH LPAREN expression RPAREN LBRACE case_blocks default_block RBRACE'
-    p[0] = Node('SwitchStatement', [p[3], p[6], p[7]])
+    p[0] = locate(Node('SwitchStatement', [p[3], p[6], p[7]]), p, 1)
 
 def p_case_blocks(p):
     '''case_blocks : case_blocks case_block
@@ -368,15 +404,15 @@ def p_default_block(p):
 
 def p_anonymous_function(p):
     'anonymous_function : FUNCTION LPAREN parameter_list RPAREN block'
-    p[0] = Node('AnonymousFunction', [p[3], p[5]])
+    p[0] = locate(Node('AnonymousFunction', [p[3], p[5]]), p, 1)
 
 def p_try_catch_statement(p):
     'try_catch_statement : TRY block CATCH LPAREN ID RPAREN block'
-    p[0] = Node('TryCatch', [p[2], p[5], p[7]])
+    p[0] = locate(Node('TryCatch', [p[2], p[5], p[7]]), p, 1)
 
 def p_throw_statement(p):
     'throw_statement : THROW expression SEMICOLON'
-    p[0] = Node('Throw', [p[2]])
+    p[0] = locate(Node('Throw', [p[2]]), p, 1)
 
 # --- Reglas de manejo de errores sintácticos específicas ---
 
@@ -424,12 +460,34 @@ def p_switch_statement_error_paren(p):
     '''switch_statement : SWITCH LPAREN error RPAREN LBRACE case_blocks default_block RBRACE'''
     raise SyntaxError(f"Error: Paréntesis sin cerrar en la condición del switch en la línea {p.lineno(1)}.")
 
+def load_frozen_parser():
+    # Arma el parser directamente con las tablas de parsetab.py, sin pasar por
+    # yacc.yacc(): no se leen los docstrings de las reglas ni se escribe nada
+    tables = yacc.LRTable()
+    try:
+        import parsetab
+        if getattr(parsetab, '_source_hash', None) != GRAMMAR_HASH:
+            return None
+        tables.read_table(parsetab)
+    except (ImportError, yacc.VersionError):
+        return None
+    tables.bind_callables(globals())
+    return yacc.LRParser(tables, p_error)
+
+def build_parser():
+    # Construcción en memoria: yacc.yacc() reusa parsetab.py si la firma de la
+    # gramática no cambió, pero no escribe parsetab.py ni parser.out
+    return yacc.yacc(write_tables=False, debug=False)
+
 # Construir el parser
-parser = yacc.yacc()
+lalr_parser = (load_frozen_parser() if FROZEN_TABLES else None) or build_parser()
+pratt_parser = PrattParser(lalr_parser)
+PARSERS = {'ply': lalr_parser, 'pratt': pratt_parser}
+parser = PARSERS[PARSER]
 
-def parse(data):
+def parse(data, lexer=None):
     try:
-        result = parser.parse(data)
+        result = parser.parse(data, lexer=lexer)
         if result is None:
             return None  # No hacer análisis semántico si el AST no se pudo construir
         # Realizar análisis semántico
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'AND ARROW ASSIGN BREAK CASE CATCH COLON COMMA CONSOLE CONST DEFAULT DIVIDE DOT ELSE EQUALS FALSE FALSE FOR FUNCTION GE GT ID IF LBRACE LBRACKET LE LET LOG LPAREN LT MINUS NOT NOTEQUALS NUMBER OR PLUS QUESTION RBRACE RBRACKET RETURN RPAREN SEMICOLON STRING SWITCH THROW TIMES TRUE TRUE TRY VAR WHILEprogram : statements\n| emptystatements : statement\n| statements statement\n| emptystatement : expression\n| declaration\n| assignment\n| method_callstatement : expression SEMICOLON\n| declaration SEMICOLON\n| assignment SEMICOLON\n| method_call SEMICOLON\n| function_declaration\n| if_statement\n| while_statement\n| for_statement\n| break_statement\n| switch_statement\n| try_catch_statement\n| throw_statementfunction_declaration : FUNCTION ID LPAREN parameter_list RPAREN blockparameter_list : \n| ID\n| parameter_list COMMA IDstatement : RETURN expression SEMICOLONdeclaration : VAR ID\n| LET ID\n| CONST ID\n| VAR ID ASSIGN expression\n| LET ID ASSIGN expression\n| CONST ID ASSIGN expressionassignment : ID ASSIGN expressionexpression : expression QUESTION expression COLON expression\n| term\n| expression PLUS term\n| expression MINUS term\n| expression GT term\n| expression LT term\n| expression GE term\n| expression LE term\n| expression EQUALS term\n| expression NOTEQUALS term\n| expression AND term\n| expression OR term\n| array_literal\n| array_accessterm : factor\n| term TIMES factor\n| term DIVIDE factorfactor : NUMBER\n| STRING\n| ID\n| LPAREN expression RPAREN\n| method_call\n| function_call\n| array_access\n| property_access\n| NOT factor\n| object_literal\n| arrow_function\n| anonymous_function\n| TRUE\n| FALSEfunction_call : ID LPAREN arguments RPARENmethod_call : console_log\n| ID DOT ID LPAREN arguments RPARENconsole_log : CONSOLE DOT LOG LPAREN arguments RPARENarguments : \n| expression\n| arguments COMMA expressionif_statement : IF LPAREN condition RPAREN block\n| IF LPAREN condition RPAREN block ELSE blockcondition : expression\n| expression GT expression\n| expression LT expression\n| expression GE expression\n| expression LE expression\n| expression EQUALS expression\n| expression NOTEQUALS expressionarray_literal : LBRACKET array_elements RBRACKETarray_elements : \n| expression\n| array_elements COMMA expressionarray_access : ID LBRACKET expression RBRACKETwhile_statement : WHILE LPAREN condition RPAREN blockblock : LBRACE statements RBRACEempty :property_access : ID DOT IDbreak_statement : BREAK SEMICOLONfor_statement : FOR LPAREN for_init SEMICOLON for_condition SEMICOLON for_update RPAREN blockfor_init : declaration\n| assignment\n| emptyfor_condition : expression\n| emptyfor_update : assignment\n| expression\n| emptyobject_literal : LBRACE object_properties RBRACEobject_properties : object_property\n| object_properties COMMA object_property\n| emptyobject_property : ID COLON expressionarrow_function : LPAREN parameter_list RPAREN ARROW expressionswitch_statement : SWITCH LPAREN expression RPAREN LBRACE case_blocks default_block RBRACEcase_blocks : case_blocks case_block\n| case_blockcase_block : CASE error COLONcase_block : CASE expression COLON statementsdefault_block : DEFAULT COLON statements\n| emptyanonymous_function : FUNCTION LPAREN parameter_list RPAREN blocktry_catch_statement : TRY block CATCH LPAREN ID RPAREN blockthrow_statement : THROW expression SEMICOLONif_statement : IF error blockdeclaration : VAR error\n| LET error\n| CONST errorswitch_statement : SWITCH error blockfor_statement : FOR error blockif_statement : IF LPAREN error blockblock : LBRACE statements errorfunction_declaration : FUNCTION ID LPAREN error RPAREN blockcase_block : CASE error COLON statementsswitch_statement : SWITCH LPAREN error RPAREN LBRACE case_blocks default_block RBRACE'
+_lr_signature = 'AND ARROW ASSIGN BREAK CASE CATCH COLON COMMA CONSOLE CONST CONTINUE DEFAULT DIVIDE DOT ELSE EQUALS FALSE FALSE FOR FUNCTION GE GT ID IF LBRACE LBRACKET LE LET LOG LPAREN LT MINUS NOT NOTEQUALS NUMBER OR PLUS QUESTION RBRACE RBRACKET RETURN RPAREN SEMICOLON STRING SWITCH THROW TIMES TRUE TRUE TRY VAR WHILEprogram : statements\n               | emptystatements : statement\n                 | statements statement\n                 | emptystatement : expression\n                 | declaration\n                 | assignment\n                 | method_callstatement : expression SEMICOLON\n                | declaration SEMICOLON\n                | assignment SEMICOLON\n                | method_call SEMICOLON\n                | function_declaration\n                | if_statement\n                | while_statement\n                | for_statement\n                | break_statement\n                | continue_statement\n                | switch_statement\n                | try_catch_statement\n                | throw_statementfunction_declaration : FUNCTION ID LPAREN parameter_list RPAREN blockparameter_list : \n                     | ID\n                     | parameter_list COMMA IDstatement : RETURN expression SEMICOLONdeclaration : VAR ID\n                  | LET ID\n                  | CONST ID\n                  | VAR ID ASSIGN expression\n                  | LET ID ASSIGN expression\n                  | CONST ID ASSIGN expressionassignment : ID ASSIGN expressionexpression : expression QUESTION expression COLON expression\n                 | term\n                 | expression PLUS term\n                 | expression MINUS term\n                 | expression GT term\n                 | expression LT term\n                 | expression GE term\n                 | expression LE term\n                 | expression EQUALS term\n                 | expression NOTEQUALS term\n                 | expression AND term\n                 | expression OR term\n                 | array_literal\n                 | array_accessterm : factor\n            | term TIMES factor\n            | term DIVIDE factorfactor : NUMBER\n              | STRING\n              | ID\n              | LPAREN expression RPAREN\n              | method_call\n              | function_call\n              | array_access\n              | property_access\n              | NOT factor\n              | object_literal\n              | arrow_function\n              | anonymous_function\n              | TRUE\n              | FALSEfunction_call : ID LPAREN arguments RPARENmethod_call : console_log\n                  | ID DOT ID LPAREN arguments RPARENconsole_log : CONSOLE DOT LOG LPAREN arguments RPARENarguments : \n                | expression\n                | arguments COMMA expressionif_statement : IF LPAREN condition RPAREN block\n                   | IF LPAREN condition RPAREN block ELSE blockcondition : expression\n                | expression GT expression\n                | expression LT expression\n                | expression GE expression\n                | expression LE expression\n                | expression EQUALS expression\n                | expression NOTEQUALS expressionarray_literal : LBRACKET array_elements RBRACKETarray_elements : \n                     | expression\n                     | array_elements COMMA expressionarray_access : ID LBRACKET expression RBRACKETwhile_statement : WHILE LPAREN condition RPAREN blockblock : LBRACE statements RBRACEempty :property_access : ID DOT IDbreak_statement : BREAK SEMICOLONcontinue_statement : CONTINUE SEMICOLONfor_statement : FOR LPAREN for_init SEMICOLON for_condition SEMICOLON for_update RPAREN blockfor_init : declaration\n               | assignment\n               | emptyfor_condition : expression\n                    | emptyfor_update : assignment\n                 | expression\n                 | emptyobject_literal : LBRACE object_properties RBRACEobject_properties : object_property\n                        | object_properties COMMA object_property\n                        | emptyobject_property : ID COLON expressionarrow_function : LPAREN parameter_list RPAREN ARROW expressionswitch_statement : SWITCH LPAREN expression RPAREN LBRACE case_blocks default_block RBRACEcase_blocks : case_blocks case_block\n                  | case_blockcase_block : CASE error COLONcase_block : CASE expression COLON statementsdefault_block : DEFAULT COLON statements\n                    | emptyanonymous_function : FUNCTION LPAREN parameter_list RPAREN blocktry_catch_statement : TRY block CATCH LPAREN ID RPAREN blockthrow_statement : THROW expression SEMICOLONif_statement : IF error blockdeclaration : VAR error\n                   | LET error\n                   | CONST errorswitch_statement : SWITCH error blockfor_statement : FOR error blockif_statement : IF LPAREN error blockblock : LBRACE statements errorfunction_declaration : FUNCTION ID LPAREN error RPAREN blockcase_block : CASE error COLON statementsswitch_statement : SWITCH LPAREN error RPAREN LBRACE case_blocks default_block RBRACE'
     
-_lr_action_items = {'$end':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,49,50,62,63,64,66,67,71,72,77,78,79,80,91,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,129,138,145,148,149,155,156,160,162,164,165,166,173,187,188,191,194,197,198,211,219,220,221,229,230,243,245,249,250,],[-88,0,-1,-2,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,-4,-10,-11,-12,-13,-53,-55,-27,-117,-28,-118,-29,-119,-90,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,-33,-89,-54,-116,-121,-120,-100,-115,-81,-30,-65,-85,-31,-32,-122,-87,-123,-34,-105,-113,-72,-86,-67,-22,-124,-68,-73,-114,-106,-126,-91,]),'RETURN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,49,50,62,63,64,66,67,71,72,77,78,79,80,91,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,129,138,145,148,149,153,154,155,156,160,162,164,165,166,173,187,188,191,194,197,198,211,219,220,221,229,230,243,245,246,247,248,249,250,251,252,253,],[17,17,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,-4,-10,-11,-12,-13,-53,-55,-27,-117,-28,-118,-29,-119,-90,17,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,-33,-89,-54,-116,-121,-120,-100,17,-5,-115,-81,-30,-65,-85,-31,-32,-122,-87,-123,-34,-105,-113,-72,-86,-67,-22,-124,-68,-73,-114,-106,17,17,17,-126,-91,17,17,17,]),'VAR':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,49,50,62,63,64,66,67,71,72,77,78,79,80,89,91,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,129,138,145,148,149,153,154,155,156,160,162,164,165,166,173,187,188,191,194,197,198,211,219,220,221,229,230,243,245,246,247,248,249,250,251,252,253,],[21,21,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,-4,-10,-11,-12,-13,-53,-55,-27,-117,-28,-118,-29,-119,21,-90,21,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,-33,-89,-54,-116,-121,-120,-100,21,-5,-115,-81,-30,-65,-85,-31,-32,-122,-87,-123,-34,-105,-113,-72,-86,-67,-22,-124,-68,-73,-114,-106,21,21,21,-126,-91,21,21,21,]),'LET':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,49,50,62,63,64,66,67,71,72,77,78,79,80,89,91,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,129,138,145,148,149,153,154,155,156,160,162,164,165,166,173,187,188,191,194,197,198,211,219,220,221,229,230,243,245,246,247,248,249,250,251,252,253,],[23,23,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,-4,-10,-11,-12,-13,-53,-55,-27,-117,-28,-118,-29,-119,23,-90,23,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,-33,-89,-54,-116,-121,-120,-100,23,-5,-115,-81,-30,-65,-85,-31,-32,-122,-87,-123,-34,-105,-113,-72,-86,-67,-22,-124,-68,-73,-114,-106,23,23,23,-126,-91,23,23,23,]),'CONST':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,49,50,62,63,64,66,67,71,72,77,78,79,80,89,91,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,129,138,145,148,149,153,154,155,156,160,162,164,165,166,173,187,188,191,194,197,198,211,219,220,221,229,230,243,245,246,247,248,249,250,251,252,253,],[24,24,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,-4,-10,-11,-12,-13,-53,-55,-27,-117,-28,-118,-29,-119,24,-90,24,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,-33,-89,-54,-116,-121,-120,-100,24,-5,-115,-81,-30,-65,-85,-31,-32,-122,-87,-123,-34,-105,-113,-72,-86,-67,-22,-124,-68,-73,-114,-106,24,24,24,-126,-91,24,24,24,]),'ID':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,33,35,36,37,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,66,67,69,70,71,72,73,74,75,76,77,78,79,80,85,86,88,89,91,92,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,127,128,129,131,132,138,145,148,149,150,151,153,154,155,156,157,159,160,161,162,163,164,165,166,167,173,174,175,176,177,178,179,181,186,187,188,190,191,194,197,198,211,219,220,221,223,226,229,230,243,245,246,247,248,249,250,251,252,253,],[22,22,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,66,-35,-46,-47,71,-53,77,79,-66,83,84,97,66,-48,66,-51,-52,-56,-58,105,-60,-61,-62,-63,-64,-4,-10,66,105,105,105,105,105,105,105,105,105,105,-11,-12,-13,-53,-55,105,105,-27,-117,66,123,66,66,-28,-118,-29,-119,134,66,66,144,-90,66,22,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,66,-33,-89,66,66,-54,168,134,-116,-121,-120,-100,97,66,22,-5,-115,-81,66,66,-30,66,-65,66,-85,-31,-32,66,-122,66,66,66,66,66,66,66,217,-87,-123,66,-34,-105,-113,-72,-86,-67,-22,-124,235,66,-68,-73,-114,-106,22,22,22,-126,-91,22,22,22,]),'FUNCTION':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,25,26,35,36,37,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,66,67,69,70,71,72,73,75,76,77,78,79,80,86,88,91,92,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,127,128,129,138,145,148,149,151,153,154,155,156,157,159,160,161,162,163,164,165,166,167,173,174,175,176,177,178,179,181,187,188,190,191,194,197,198,211,219,220,221,223,226,229,230,243,245,246,247,248,249,250,251,252,253,],[27,27,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,68,-35,-46,-47,-53,-66,68,68,-48,68,-51,-52,-56,-58,68,-60,-61,-62,-63,-64,-4,-10,68,68,68,68,68,68,68,68,68,68,68,-11,-12,-13,-53,-55,68,68,-27,-117,68,68,68,-28,-118,-29,-119,68,68,-90,68,27,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,68,-33,-89,68,68,-54,-116,-121,-120,-100,68,27,-5,-115,-81,68,68,-30,68,-65,68,-85,-31,-32,68,-122,68,68,68,68,68,68,68,-87,-123,68,-34,-105,-113,-72,-86,-67,-22,-124,68,68,-68,-73,-114,-106,27,27,27,-126,-91,27,27,27,]),'IF':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,49,50,62,63,64,66,67,71,72,77,78,79,80,91,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,129,138,145,148,149,153,154,155,156,160,162,164,165,166,173,187,188,191,194,197,198,211,219,220,221,229,230,243,245,246,247,248,249,250,251,252,253,],[28,28,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,-4,-10,-11,-12,-13,-53,-55,-27,-117,-28,-118,-29,-119,-90,28,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,-33,-89,-54,-116,-121,-120,-100,28,-5,-115,-81,-30,-65,-85,-31,-32,-122,-87,-123,-34,-105,-113,-72,-86,-67,-22,-124,-68,-73,-114,-106,28,28,28,-126,-91,28,28,28,]),'WHILE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,49,50,62,63,64,66,67,71,72,77,78,79,80,91,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,129,138,145,148,149,153,154,155,156,160,162,164,165,166,173,187,188,191,194,197,198,211,219,220,221,229,230,243,245,246,247,248,249,250,251,252,253,],[29,29,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,-4,-10,-11,-12,-13,-53,-55,-27,-117,-28,-118,-29,-119,-90,29,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,-33,-89,-54,-116,-121,-120,-100,29,-5,-115,-81,-30,-65,-85,-31,-32,-122,-87,-123,-34,-105,-113,-72,-86,-67,-22,-124,-68,-73,-114,-106,29,29,29,-126,-91,29,29,29,]),'FOR':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,49,50,62,63,64,66,67,71,72,77,78,79,80,91,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,129,138,145,148,149,153,154,155,156,160,162,164,165,166,173,187,188,191,194,197,198,211,219,220,221,229,230,243,245,246,247,248,249,250,251,252,253,],[30,30,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,-4,-10,-11,-12,-13,-53,-55,-27,-117,-28,-118,-29,-119,-90,30,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,-33,-89,-54,-116,-121,-120,-100,30,-5,-115,-81,-30,-65,-85,-31,-32,-122,-87,-123,-34,-105,-113,-72,-86,-67,-22,-124,-68,-73,-114,-106,30,30,30,-126,-91,30,30,30,]),'BREAK':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,49,50,62,63,64,66,67,71,72,77,78,79,80,91,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,129,138,145,148,149,153,154,155,156,160,162,164,165,166,173,187,188,191,194,197,198,211,219,220,221,229,230,243,245,246,247,248,249,250,251,252,253,],[31,31,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,-4,-10,-11,-12,-13,-53,-55,-27,-117,-28,-118,-29,-119,-90,31,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,-33,-89,-54,-116,-121,-120,-100,31,-5,-115,-81,-30,-65,-85,-31,-32,-122,-87,-123,-34,-105,-113,-72,-86,-67,-22,-124,-68,-73,-114,-106,31,31,31,-126,-91,31,31,31,]),'SWITCH':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,49,50,62,63,64,66,67,71,72,77,78,79,80,91,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,129,138,145,148,149,153,154,155,156,160,162,164,165,166,173,187,188,191,194,197,198,211,219,220,221,229,230,243,245,246,247,248,249,250,251,252,253,],[32,32,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,-4,-10,-11,-12,-13,-53,-55,-27,-117,-28,-118,-29,-119,-90,32,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,-33,-89,-54,-116,-121,-120,-100,32,-5,-115,-81,-30,-65,-85,-31,-32,-122,-87,-123,-34,-105,-113,-72,-86,-67,-22,-124,-68,-73,-114,-106,32,32,32,-126,-91,32,32,32,]),'TRY':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,49,50,62,63,64,66,67,71,72,77,78,79,80,91,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,129,138,145,148,149,153,154,155,156,160,162,164,165,166,173,187,188,191,194,197,198,211,219,220,221,229,230,243,245,246,247,248,249,250,251,252,253,],[34,34,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,-4,-10,-11,-12,-13,-53,-55,-27,-117,-28,-118,-29,-119,-90,34,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,-33,-89,-54,-116,-121,-120,-100,34,-5,-115,-81,-30,-65,-85,-31,-32,-122,-87,-123,-34,-105,-113,-72,-86,-67,-22,-124,-68,-73,-114,-106,34,34,34,-126,-91,34,34,34,]),'THROW':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,49,50,62,63,64,66,67,71,72,77,78,79,80,91,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,129,138,145,148,149,153,154,155,156,160,162,164,165,166,173,187,188,191,194,197,198,211,219,220,221,229,230,243,245,246,247,248,249,250,251,252,253,],[35,35,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,-4,-10,-11,-12,-13,-53,-55,-27,-117,-28,-118,-29,-119,-90,35,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,-33,-89,-54,-116,-121,-120,-100,35,-5,-115,-81,-30,-65,-85,-31,-32,-122,-87,-123,-34,-105,-113,-72,-86,-67,-22,-124,-68,-73,-114,-106,35,35,35,-126,-91,35,35,35,]),'LBRACKET':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,25,26,35,36,37,39,40,41,42,44,45,46,47,48,49,50,51,62,63,64,66,67,71,72,73,75,76,77,78,79,80,83,86,88,91,92,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,127,128,129,138,145,148,149,151,153,154,155,156,157,159,160,161,162,163,164,165,166,167,173,174,175,176,177,178,179,181,187,188,190,191,194,197,198,211,219,220,221,223,226,229,230,235,243,245,246,247,248,249,250,251,252,253,],[37,37,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,37,-35,-46,-47,76,-66,37,37,-48,37,-51,-52,-56,-58,-60,-61,-62,-63,-64,-4,-10,37,-11,-12,-13,76,-55,-27,-117,37,37,37,-28,-118,-29,-119,76,37,37,-90,37,37,-59,76,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,37,-33,-89,37,37,-54,-116,-121,-120,-100,37,37,-5,-115,-81,37,37,-30,37,-65,37,-85,-31,-32,37,-122,37,37,37,37,37,37,37,-87,-123,37,-34,-105,-113,-72,-86,-67,-22,-124,37,37,-68,-73,76,-114,-106,37,37,37,-126,-91,37,37,37,]),'CONSOLE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,25,26,35,36,37,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,66,67,69,70,71,72,73,75,76,77,78,79,80,86,88,91,92,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,127,128,129,138,145,148,149,151,153,154,155,156,157,159,160,161,162,163,164,165,166,167,173,174,175,176,177,178,179,181,187,188,190,191,194,197,198,211,219,220,221,223,226,229,230,243,245,246,247,248,249,250,251,252,253,],[38,38,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,38,-35,-46,-47,-53,-66,38,38,-48,38,-51,-52,-56,-58,38,-60,-61,-62,-63,-64,-4,-10,38,38,38,38,38,38,38,38,38,38,38,-11,-12,-13,-53,-55,38,38,-27,-117,38,38,38,-28,-118,-29,-119,38,38,-90,38,38,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,38,-33,-89,38,38,-54,-116,-121,-120,-100,38,38,-5,-115,-81,38,38,-30,38,-65,38,-85,-31,-32,38,-122,38,38,38,38,38,38,38,-87,-123,38,-34,-105,-113,-72,-86,-67,-22,-124,38,38,-68,-73,-114,-106,38,38,38,-126,-91,38,38,38,]),'NUMBER':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,25,26,35,36,37,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,66,67,69,70,71,72,73,75,76,77,78,79,80,86,88,91,92,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,127,128,129,138,145,148,149,151,153,154,155,156,157,159,160,161,162,163,164,165,166,167,173,174,175,176,177,178,179,181,187,188,190,191,194,197,198,211,219,220,221,223,226,229,230,243,245,246,247,248,249,250,251,252,253,],[39,39,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,39,-35,-46,-47,-53,-66,39,39,-48,39,-51,-52,-56,-58,39,-60,-61,-62,-63,-64,-4,-10,39,39,39,39,39,39,39,39,39,39,39,-11,-12,-13,-53,-55,39,39,-27,-117,39,39,39,-28,-118,-29,-119,39,39,-90,39,39,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,39,-33,-89,39,39,-54,-116,-121,-120,-100,39,39,-5,-115,-81,39,39,-30,39,-65,39,-85,-31,-32,39,-122,39,39,39,39,39,39,39,-87,-123,39,-34,-105,-113,-72,-86,-67,-22,-124,39,39,-68,-73,-114,-106,39,39,39,-126,-91,39,39,39,]),'STRING':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,25,26,35,36,37,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,66,67,69,70,71,72,73,75,76,77,78,79,80,86,88,91,92,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,127,128,129,138,145,148,149,151,153,154,155,156,157,159,160,161,162,163,164,165,166,167,173,174,175,176,177,178,179,181,187,188,190,191,194,197,198,211,219,220,221,223,226,229,230,243,245,246,247,248,249,250,251,252,253,],[40,40,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,40,-35,-46,-47,-53,-66,40,40,-48,40,-51,-52,-56,-58,40,-60,-61,-62,-63,-64,-4,-10,40,40,40,40,40,40,40,40,40,40,40,-11,-12,-13,-53,-55,40,40,-27,-117,40,40,40,-28,-118,-29,-119,40,40,-90,40,40,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,40,-33,-89,40,40,-54,-116,-121,-120,-100,40,40,-5,-115,-81,40,40,-30,40,-65,40,-85,-31,-32,40,-122,40,40,40,40,40,40,40,-87,-123,40,-34,-105,-113,-72,-86,-67,-22,-124,40,40,-68,-73,-114,-106,40,40,40,-126,-91,40,40,40,]),'LPAREN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,25,26,27,28,29,30,32,35,36,37,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,66,67,68,69,70,71,72,73,75,76,77,78,79,80,83,84,86,88,91,92,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,127,128,129,138,145,148,149,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,173,174,175,176,177,178,179,181,187,188,190,191,194,197,198,211,219,220,221,223,226,229,230,235,243,245,246,247,248,249,250,251,252,253,],[26,26,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,26,-35,-46,-47,75,-66,26,85,86,88,89,92,26,-48,26,-51,-52,-56,-58,26,-60,-61,-62,-63,-64,-4,-10,26,26,26,26,26,26,26,26,26,26,26,-11,-12,-13,75,-55,85,26,26,-27,-117,26,26,26,-28,-118,-29,-119,75,132,26,26,-90,26,26,-59,75,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,26,-33,161,26,26,-54,-116,-121,-120,-100,26,186,26,-5,-115,-81,26,190,26,-30,26,-65,26,-85,-31,-32,26,-122,26,26,26,26,26,26,26,-87,-123,26,-34,-105,-113,-72,-86,-67,-22,-124,26,26,-68,-73,75,-114,-106,26,26,26,-126,-91,26,26,26,]),'NOT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,25,26,35,36,37,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,66,67,69,70,71,72,73,75,76,77,78,79,80,86,88,91,92,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,127,128,129,138,145,148,149,151,153,154,155,156,157,159,160,161,162,163,164,165,166,167,173,174,175,176,177,178,179,181,187,188,190,191,194,197,198,211,219,220,221,223,226,229,230,243,245,246,247,248,249,250,251,252,253,],[43,43,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,43,-35,-46,-47,-53,-66,43,43,-48,43,-51,-52,-56,-58,43,-60,-61,-62,-63,-64,-4,-10,43,43,43,43,43,43,43,43,43,43,43,-11,-12,-13,-53,-55,43,43,-27,-117,43,43,43,-28,-118,-29,-119,43,43,-90,43,43,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,43,-33,-89,43,43,-54,-116,-121,-120,-100,43,43,-5,-115,-81,43,43,-30,43,-65,43,-85,-31,-32,43,-122,43,43,43,43,43,43,43,-87,-123,43,-34,-105,-113,-72,-86,-67,-22,-124,43,43,-68,-73,-114,-106,43,43,43,-126,-91,43,43,43,]),'TRUE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,25,26,35,36,37,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,66,67,69,70,71,72,73,75,76,77,78,79,80,86,88,91,92,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,127,128,129,138,145,148,149,151,153,154,155,156,157,159,160,161,162,163,164,165,166,167,173,174,175,176,177,178,179,181,187,188,190,191,194,197,198,211,219,220,221,223,226,229,230,243,245,246,247,248,249,250,251,252,253,],[47,47,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,47,-35,-46,-47,-53,-66,47,47,-48,47,-51,-52,-56,-58,47,-60,-61,-62,-63,-64,-4,-10,47,47,47,47,47,47,47,47,47,47,47,-11,-12,-13,-53,-55,47,47,-27,-117,47,47,47,-28,-118,-29,-119,47,47,-90,47,47,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,47,-33,-89,47,47,-54,-116,-121,-120,-100,47,47,-5,-115,-81,47,47,-30,47,-65,47,-85,-31,-32,47,-122,47,47,47,47,47,47,47,-87,-123,47,-34,-105,-113,-72,-86,-67,-22,-124,47,47,-68,-73,-114,-106,47,47,47,-126,-91,47,47,47,]),'FALSE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,25,26,35,36,37,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,66,67,69,70,71,72,73,75,76,77,78,79,80,86,88,91,92,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,127,128,129,138,145,148,149,151,153,154,155,156,157,159,160,161,162,163,164,165,166,167,173,174,175,176,177,178,179,181,187,188,190,191,194,197,198,211,219,220,221,223,226,229,230,243,245,246,247,248,249,250,251,252,253,],[48,48,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,48,-35,-46,-47,-53,-66,48,48,-48,48,-51,-52,-56,-58,48,-60,-61,-62,-63,-64,-4,-10,48,48,48,48,48,48,48,48,48,48,48,-11,-12,-13,-53,-55,48,48,-27,-117,48,48,48,-28,-118,-29,-119,48,48,-90,48,48,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,48,-33,-89,48,48,-54,-116,-121,-120,-100,48,48,-5,-115,-81,48,48,-30,48,-65,48,-85,-31,-32,48,-122,48,48,48,48,48,48,48,-87,-123,48,-34,-105,-113,-72,-86,-67,-22,-124,48,48,-68,-73,-114,-106,48,48,48,-126,-91,48,48,48,]),'LBRACE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,25,26,34,35,36,37,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,66,67,69,70,71,72,73,75,76,77,78,79,80,86,87,88,90,91,92,93,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,127,128,129,136,138,145,148,149,151,153,154,155,156,157,159,160,161,162,163,164,165,166,167,171,172,173,174,175,176,177,178,179,180,181,182,183,187,188,190,191,194,195,196,197,198,211,219,220,221,222,223,226,228,229,230,243,244,245,246,247,248,249,250,251,252,253,],[33,33,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,33,-35,-46,-47,-53,-66,33,99,33,-48,33,-51,-52,-56,-58,33,-60,-61,-62,-63,-64,-4,-10,33,33,33,33,33,33,33,33,33,33,33,-11,-12,-13,-53,-55,33,33,-27,-117,33,33,33,-28,-118,-29,-119,33,99,33,99,-90,33,99,33,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,33,-33,-89,33,33,-54,99,-116,-121,-120,-100,33,33,-5,-115,-81,33,33,-30,33,-65,33,-85,-31,-32,33,99,99,-122,33,33,33,33,33,33,99,33,215,216,-87,-123,33,-34,-105,99,99,-113,-72,-86,-67,-22,-124,99,33,33,99,-68,-73,-114,99,-106,33,33,33,-126,-91,33,33,33,]),'RBRACE':([4,5,6,7,8,9,10,11,12,13,14,15,16,18,19,20,22,25,33,36,39,40,41,42,44,45,46,47,48,49,50,62,63,64,66,67,71,72,77,78,79,80,91,94,95,96,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,129,138,145,148,149,153,154,155,156,160,162,164,165,166,173,184,185,187,188,191,194,197,198,211,219,220,221,224,225,227,229,230,236,237,239,242,243,245,246,247,248,249,250,251,252,253,],[-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-35,-46,-47,-53,-66,-88,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,-4,-10,-11,-12,-13,-53,-55,-27,-117,-28,-118,-29,-119,-90,149,-101,-103,-88,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,-33,-89,-54,-116,-121,-120,-100,187,-5,-115,-81,-30,-65,-85,-31,-32,-122,-102,-104,-87,-123,-34,-105,-113,-72,-86,-67,-22,-124,-88,-108,-88,-68,-73,245,-107,-112,249,-114,-106,-88,-88,-88,-126,-91,-111,-125,-110,]),'error':([4,5,6,7,8,9,10,11,12,13,14,15,16,18,19,20,21,22,23,24,25,28,30,32,36,39,40,41,42,44,45,46,47,48,49,50,62,63,64,66,67,71,72,77,78,79,80,86,91,92,99,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,129,132,138,145,148,149,153,154,155,156,160,162,164,165,166,173,187,188,191,194,197,198,211,219,220,221,226,229,230,243,245,249,250,],[-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-35,-46,-47,72,-53,78,80,-66,87,90,93,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,-4,-10,-11,-12,-13,-53,-55,-27,-117,-28,-118,-29,-119,136,-90,147,-88,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,-33,-89,-54,170,-116,-121,-120,-100,188,-5,-115,-81,-30,-65,-85,-31,-32,-122,-87,-123,-34,-105,-113,-72,-86,-67,-22,-124,240,-68,-73,-114,-106,-126,-91,]),'DEFAULT':([4,5,6,7,8,9,10,11,12,13,14,15,16,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,49,50,62,63,64,66,67,71,72,77,78,79,80,91,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,129,138,145,148,149,154,155,156,160,162,164,165,166,173,187,188,191,194,197,198,211,219,220,221,224,225,227,229,230,237,243,245,247,248,249,250,252,253,],[-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,-4,-10,-11,-12,-13,-53,-55,-27,-117,-28,-118,-29,-119,-90,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,-33,-89,-54,-116,-121,-120,-100,-5,-115,-81,-30,-65,-85,-31,-32,-122,-87,-123,-34,-105,-113,-72,-86,-67,-22,-124,238,-108,238,-68,-73,-107,-114,-106,-88,-88,-126,-91,-125,-110,]),'CASE':([4,5,6,7,8,9,10,11,12,13,14,15,16,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,49,50,62,63,64,66,67,71,72,77,78,79,80,91,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,129,138,145,148,149,154,155,156,160,162,164,165,166,173,187,188,191,194,197,198,211,215,216,219,220,221,224,225,227,229,230,237,243,245,247,248,249,250,252,253,],[-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,-4,-10,-11,-12,-13,-53,-55,-27,-117,-28,-118,-29,-119,-90,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-26,-49,-50,-33,-89,-54,-116,-121,-120,-100,-5,-115,-81,-30,-65,-85,-31,-32,-122,-87,-123,-34,-105,-113,-72,-86,226,226,-67,-22,-124,226,-108,226,-68,-73,-107,-114,-106,-88,-88,-126,-91,-125,-110,]),'SEMICOLON':([5,6,7,8,18,19,20,22,25,31,36,39,40,41,42,44,45,46,47,48,65,66,67,71,72,77,78,79,80,89,100,104,105,106,108,109,110,111,112,113,114,115,116,117,119,120,122,123,129,140,141,142,143,149,156,160,162,164,165,166,181,187,188,191,194,197,212,213,214,219,229,],[50,62,63,64,-35,-46,-47,-53,-66,91,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,118,-53,-55,-27,-117,-28,-118,-29,-119,-88,155,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-49,-50,-33,-89,-54,181,-92,-93,-94,-100,-81,-30,-65,-85,-31,-32,-88,-87,-123,-34,-105,-113,223,-95,-96,-67,-68,]),'QUESTION':([5,8,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,65,66,67,81,83,100,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,119,120,122,123,125,126,129,137,146,149,156,160,162,164,165,166,185,187,188,189,191,193,194,197,199,200,201,202,203,204,205,206,207,208,209,210,213,219,229,233,235,241,],[51,-55,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,51,-53,-55,51,-53,51,51,-59,-53,-57,51,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-49,-50,51,-89,51,51,-54,51,51,-100,-81,51,-65,-85,51,51,51,-87,-123,51,51,51,51,-113,51,-35,51,-35,51,-35,51,-35,51,-35,51,-35,51,-67,-68,51,-53,51,]),'PLUS':([5,8,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,65,66,67,81,83,100,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,119,120,122,123,125,126,129,137,146,149,156,160,162,164,165,166,185,187,188,189,191,193,194,197,199,200,201,202,203,204,205,206,207,208,209,210,213,219,229,233,235,241,],[52,-55,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,52,-53,-55,52,-53,52,52,-59,-53,-57,52,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-49,-50,52,-89,52,52,-54,52,52,-100,-81,52,-65,-85,52,52,52,-87,-123,52,52,52,52,-113,52,-35,52,-35,52,-35,52,-35,52,-35,52,-35,52,-67,-68,52,-53,52,]),'MINUS':([5,8,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,65,66,67,81,83,100,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,119,120,122,123,125,126,129,137,146,149,156,160,162,164,165,166,185,187,188,189,191,193,194,197,199,200,201,202,203,204,205,206,207,208,209,210,213,219,229,233,235,241,],[53,-55,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,53,-53,-55,53,-53,53,53,-59,-53,-57,53,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-49,-50,53,-89,53,53,-54,53,53,-100,-81,53,-65,-85,53,53,53,-87,-123,53,53,53,53,-113,53,-35,53,-35,53,-35,53,-35,53,-35,53,-35,53,-67,-68,53,-53,53,]),'GT':([5,8,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,65,66,67,81,83,100,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,119,120,122,123,125,126,129,137,146,149,156,160,162,164,165,166,185,187,188,189,191,193,194,197,199,200,201,202,203,204,205,206,207,208,209,210,213,219,229,233,235,241,],[54,-55,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,54,-53,-55,54,-53,54,54,-59,-53,-57,54,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-49,-50,54,-89,54,54,-54,174,54,-100,-81,54,-65,-85,54,54,54,-87,-123,54,54,54,54,-113,54,-35,54,-35,54,-35,54,-35,54,-35,54,-35,54,-67,-68,54,-53,54,]),'LT':([5,8,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,65,66,67,81,83,100,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,119,120,122,123,125,126,129,137,146,149,156,160,162,164,165,166,185,187,188,189,191,193,194,197,199,200,201,202,203,204,205,206,207,208,209,210,213,219,229,233,235,241,],[55,-55,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,55,-53,-55,55,-53,55,55,-59,-53,-57,55,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-49,-50,55,-89,55,55,-54,175,55,-100,-81,55,-65,-85,55,55,55,-87,-123,55,55,55,55,-113,55,-35,55,-35,55,-35,55,-35,55,-35,55,-35,55,-67,-68,55,-53,55,]),'GE':([5,8,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,65,66,67,81,83,100,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,119,120,122,123,125,126,129,137,146,149,156,160,162,164,165,166,185,187,188,189,191,193,194,197,199,200,201,202,203,204,205,206,207,208,209,210,213,219,229,233,235,241,],[56,-55,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,56,-53,-55,56,-53,56,56,-59,-53,-57,56,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-49,-50,56,-89,56,56,-54,176,56,-100,-81,56,-65,-85,56,56,56,-87,-123,56,56,56,56,-113,56,-35,56,-35,56,-35,56,-35,56,-35,56,-35,56,-67,-68,56,-53,56,]),'LE':([5,8,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,65,66,67,81,83,100,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,119,120,122,123,125,126,129,137,146,149,156,160,162,164,165,166,185,187,188,189,191,193,194,197,199,200,201,202,203,204,205,206,207,208,209,210,213,219,229,233,235,241,],[57,-55,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,57,-53,-55,57,-53,57,57,-59,-53,-57,57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-49,-50,57,-89,57,57,-54,177,57,-100,-81,57,-65,-85,57,57,57,-87,-123,57,57,57,57,-113,57,-35,57,-35,57,-35,57,-35,57,-35,57,-35,57,-67,-68,57,-53,57,]),'EQUALS':([5,8,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,65,66,67,81,83,100,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,119,120,122,123,125,126,129,137,146,149,156,160,162,164,165,166,185,187,188,189,191,193,194,197,199,200,201,202,203,204,205,206,207,208,209,210,213,219,229,233,235,241,],[58,-55,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,58,-53,-55,58,-53,58,58,-59,-53,-57,58,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-49,-50,58,-89,58,58,-54,178,58,-100,-81,58,-65,-85,58,58,58,-87,-123,58,58,58,58,-113,58,-35,58,-35,58,-35,58,-35,58,-35,58,-35,58,-67,-68,58,-53,58,]),'NOTEQUALS':([5,8,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,65,66,67,81,83,100,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,119,120,122,123,125,126,129,137,146,149,156,160,162,164,165,166,185,187,188,189,191,193,194,197,199,200,201,202,203,204,205,206,207,208,209,210,213,219,229,233,235,241,],[59,-55,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,59,-53,-55,59,-53,59,59,-59,-53,-57,59,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-49,-50,59,-89,59,59,-54,179,59,-100,-81,59,-65,-85,59,59,59,-87,-123,59,59,59,59,-113,59,-35,59,-35,59,-35,59,-35,59,-35,59,-35,59,-67,-68,59,-53,59,]),'AND':([5,8,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,65,66,67,81,83,100,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,119,120,122,123,125,126,129,137,146,149,156,160,162,164,165,166,185,187,188,189,191,193,194,197,199,200,201,202,203,204,205,206,207,208,209,210,213,219,229,233,235,241,],[60,-55,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,60,-53,-55,60,-53,60,60,-59,-53,-57,60,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-49,-50,60,-89,60,60,-54,60,60,-100,-81,60,-65,-85,60,60,60,-87,-123,60,60,60,60,-113,60,-35,60,-35,60,-35,60,-35,60,-35,60,-35,60,-67,-68,60,-53,60,]),'OR':([5,8,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,65,66,67,81,83,100,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,119,120,122,123,125,126,129,137,146,149,156,160,162,164,165,166,185,187,188,189,191,193,194,197,199,200,201,202,203,204,205,206,207,208,209,210,213,219,229,233,235,241,],[61,-55,-35,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,61,-53,-55,61,-53,61,61,-59,-53,-57,61,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-49,-50,61,-89,61,61,-54,61,61,-100,-81,61,-65,-85,61,61,61,-87,-123,61,61,61,61,-113,61,-35,61,-35,61,-35,61,-35,61,-35,61,-35,61,-67,-68,61,-53,61,]),'TIMES':([8,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,66,67,83,104,105,106,108,109,110,111,112,113,114,115,116,117,119,120,123,129,149,156,162,164,187,188,191,194,197,200,202,204,206,208,210,219,229,235,],[-55,69,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,-53,-55,-53,-59,-53,-57,69,69,69,69,69,69,69,69,69,69,-49,-50,-89,-54,-100,-81,-65,-85,-87,-123,-34,-105,-113,69,69,69,69,69,69,-67,-68,-53,]),'DIVIDE':([8,18,19,20,22,25,36,39,40,41,42,44,45,46,47,48,66,67,83,104,105,106,108,109,110,111,112,113,114,115,116,117,119,120,123,129,149,156,162,164,187,188,191,194,197,200,202,204,206,208,210,219,229,235,],[-55,70,-46,-47,-53,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,-53,-55,-53,-59,-53,-57,70,70,70,70,70,70,70,70,70,70,-49,-50,-89,-54,-100,-81,-65,-85,-87,-123,-34,-105,-113,70,70,70,70,70,70,-67,-68,-53,]),'RPAREN':([18,19,20,25,26,36,39,40,41,42,44,45,46,47,48,66,67,75,81,82,83,85,104,105,106,108,109,110,111,112,113,114,115,116,117,119,120,122,123,124,125,129,132,133,134,135,137,139,146,147,149,156,161,162,164,168,169,170,187,188,190,191,192,193,194,197,199,200,201,202,203,204,205,206,207,208,209,210,217,218,219,223,229,231,232,233,234,235,],[-35,-46,-47,-66,-23,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,-53,-55,-69,129,130,-24,-23,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-49,-50,-33,-89,162,-70,-54,-23,171,-24,172,-74,180,182,183,-100,-81,-69,-65,-85,-25,195,196,-87,-123,-69,-34,219,-71,-105,-113,-75,-35,-76,-35,-77,-35,-78,-35,-79,-35,-80,-35,228,229,-67,-88,-68,244,-97,-98,-99,-53,]),'RBRACKET':([18,19,20,25,36,37,39,40,41,42,44,45,46,47,48,66,67,101,102,104,105,106,108,109,110,111,112,113,114,115,116,117,119,120,123,126,129,149,156,162,164,187,188,189,191,194,197,219,229,],[-35,-46,-47,-66,-48,-82,-51,-52,-56,-58,-60,-61,-62,-63,-64,-53,-55,156,-83,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-49,-50,-89,164,-54,-100,-81,-65,-85,-87,-123,-84,-34,-105,-113,-67,-68,]),'COMMA':([18,19,20,25,26,33,36,37,39,40,41,42,44,45,46,47,48,66,67,75,82,83,85,94,95,96,101,102,104,105,106,108,109,110,111,112,113,114,115,116,117,119,120,123,124,125,129,132,133,134,149,156,161,162,164,168,169,184,185,187,188,189,190,191,192,193,194,197,218,219,229,],[-35,-46,-47,-66,-23,-88,-48,-82,-51,-52,-56,-58,-60,-61,-62,-63,-64,-53,-55,-69,131,-24,-23,150,-101,-103,157,-83,-59,-53,-57,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-49,-50,-89,163,-70,-54,-23,131,-24,-100,-81,-69,-65,-85,-25,131,-102,-104,-87,-123,-84,-69,-34,163,-71,-105,-113,163,-67,-68,]),'COLON':([18,19,20,25,36,39,40,41,42,44,45,46,47,48,66,67,97,104,105,106,107,108,109,110,111,112,113,114,115,116,117,119,120,123,129,149,156,162,164,187,188,191,194,197,219,229,238,240,241,],[-35,-46,-47,-66,-48,-51,-52,-56,-58,-60,-61,-62,-63,-64,-53,-55,151,-59,-53,-57,159,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-49,-50,-89,-54,-100,-81,-65,-85,-87,-123,-34,-105,-113,-67,-68,246,247,248,]),'ASSIGN':([22,71,77,79,144,235,],[73,121,127,128,73,73,]),'DOT':([22,38,66,83,105,235,],[74,103,74,74,74,74,]),'CATCH':([98,187,188,],[152,-87,-123,]),'LOG':([103,],[158,]),'ARROW':([130,],[167,]),'ELSE':([187,188,198,],[-87,-123,222,]),}
+_lr_action_items = {'$end':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,51,52,64,65,66,68,69,73,74,79,80,81,82,93,94,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,125,126,132,141,148,151,152,158,159,163,165,167,168,169,176,190,191,194,197,200,201,214,222,223,224,232,233,246,248,252,253,],[-89,0,-1,-2,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,-4,-10,-11,-12,-13,-54,-56,-28,-119,-29,-120,-30,-121,-91,-92,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,-34,-90,-55,-118,-123,-122,-102,-117,-82,-31,-66,-86,-32,-33,-124,-88,-125,-35,-107,-115,-73,-87,-68,-23,-126,-69,-74,-116,-108,-128,-93,]),'RETURN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,51,52,64,65,66,68,69,73,74,79,80,81,82,93,94,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,125,126,132,141,148,151,152,156,157,158,159,163,165,167,168,169,176,190,191,194,197,200,201,214,222,223,224,232,233,246,248,249,250,251,252,253,254,255,256,],[18,18,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,-4,-10,-11,-12,-13,-54,-56,-28,-119,-29,-120,-30,-121,-91,-92,18,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,-34,-90,-55,-118,-123,-122,-102,18,-5,-117,-82,-31,-66,-86,-32,-33,-124,-88,-125,-35,-107,-115,-73,-87,-68,-23,-126,-69,-74,-116,-108,18,18,18,-128,-93,18,18,18,]),'VAR':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,51,52,64,65,66,68,69,73,74,79,80,81,82,91,93,94,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,125,126,132,141,148,151,152,156,157,158,159,163,165,167,168,169,176,190,191,194,197,200,201,214,222,223,224,232,233,246,248,249,250,251,252,253,254,255,256,],[22,22,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,-4,-10,-11,-12,-13,-54,-56,-28,-119,-29,-120,-30,-121,22,-91,-92,22,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,-34,-90,-55,-118,-123,-122,-102,22,-5,-117,-82,-31,-66,-86,-32,-33,-124,-88,-125,-35,-107,-115,-73,-87,-68,-23,-126,-69,-74,-116,-108,22,22,22,-128,-93,22,22,22,]),'LET':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,51,52,64,65,66,68,69,73,74,79,80,81,82,91,93,94,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,125,126,132,141,148,151,152,156,157,158,159,163,165,167,168,169,176,190,191,194,197,200,201,214,222,223,224,232,233,246,248,249,250,251,252,253,254,255,256,],[24,24,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,-4,-10,-11,-12,-13,-54,-56,-28,-119,-29,-120,-30,-121,24,-91,-92,24,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,-34,-90,-55,-118,-123,-122,-102,24,-5,-117,-82,-31,-66,-86,-32,-33,-124,-88,-125,-35,-107,-115,-73,-87,-68,-23,-126,-69,-74,-116,-108,24,24,24,-128,-93,24,24,24,]),'CONST':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,51,52,64,65,66,68,69,73,74,79,80,81,82,91,93,94,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,125,126,132,141,148,151,152,156,157,158,159,163,165,167,168,169,176,190,191,194,197,200,201,214,222,223,224,232,233,246,248,249,250,251,252,253,254,255,256,],[25,25,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,-4,-10,-11,-12,-13,-54,-56,-28,-119,-29,-120,-30,-121,25,-91,-92,25,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,-34,-90,-55,-118,-123,-122,-102,25,-5,-117,-82,-31,-66,-86,-32,-33,-124,-88,-125,-35,-107,-115,-73,-87,-68,-23,-126,-69,-74,-116,-108,25,25,25,-128,-93,25,25,25,]),'ID':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,35,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,68,69,71,72,73,74,75,76,77,78,79,80,81,82,87,88,90,91,93,94,95,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,134,135,141,148,151,152,153,154,156,157,158,159,160,162,163,164,165,166,167,168,169,170,176,177,178,179,180,181,182,184,189,190,191,193,194,197,200,201,214,222,223,224,226,229,232,233,246,248,249,250,251,252,253,254,255,256,],[23,23,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,68,-36,-47,-48,73,-54,79,81,-67,85,86,100,68,-49,68,-52,-53,-57,-59,108,-61,-62,-63,-64,-65,-4,-10,68,108,108,108,108,108,108,108,108,108,108,-11,-12,-13,-54,-56,108,108,-28,-119,68,126,68,68,-29,-120,-30,-121,137,68,68,147,-91,-92,68,23,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,68,-34,-90,68,68,-55,171,137,-118,-123,-122,-102,100,68,23,-5,-117,-82,68,68,-31,68,-66,68,-86,-32,-33,68,-124,68,68,68,68,68,68,68,220,-88,-125,68,-35,-107,-115,-73,-87,-68,-23,-126,238,68,-69,-74,-116,-108,23,23,23,-128,-93,23,23,23,]),'FUNCTION':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,23,26,27,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,68,69,71,72,73,74,75,77,78,79,80,81,82,88,90,93,94,95,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,141,148,151,152,154,156,157,158,159,160,162,163,164,165,166,167,168,169,170,176,177,178,179,180,181,182,184,190,191,193,194,197,200,201,214,222,223,224,226,229,232,233,246,248,249,250,251,252,253,254,255,256,],[28,28,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,70,-36,-47,-48,-54,-67,70,70,-49,70,-52,-53,-57,-59,70,-61,-62,-63,-64,-65,-4,-10,70,70,70,70,70,70,70,70,70,70,70,-11,-12,-13,-54,-56,70,70,-28,-119,70,70,70,-29,-120,-30,-121,70,70,-91,-92,70,28,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,70,-34,-90,70,70,-55,-118,-123,-122,-102,70,28,-5,-117,-82,70,70,-31,70,-66,70,-86,-32,-33,70,-124,70,70,70,70,70,70,70,-88,-125,70,-35,-107,-115,-73,-87,-68,-23,-126,70,70,-69,-74,-116,-108,28,28,28,-128,-93,28,28,28,]),'IF':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,51,52,64,65,66,68,69,73,74,79,80,81,82,93,94,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,125,126,132,141,148,151,152,156,157,158,159,163,165,167,168,169,176,190,191,194,197,200,201,214,222,223,224,232,233,246,248,249,250,251,252,253,254,255,256,],[29,29,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,-4,-10,-11,-12,-13,-54,-56,-28,-119,-29,-120,-30,-121,-91,-92,29,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,-34,-90,-55,-118,-123,-122,-102,29,-5,-117,-82,-31,-66,-86,-32,-33,-124,-88,-125,-35,-107,-115,-73,-87,-68,-23,-126,-69,-74,-116,-108,29,29,29,-128,-93,29,29,29,]),'WHILE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,51,52,64,65,66,68,69,73,74,79,80,81,82,93,94,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,125,126,132,141,148,151,152,156,157,158,159,163,165,167,168,169,176,190,191,194,197,200,201,214,222,223,224,232,233,246,248,249,250,251,252,253,254,255,256,],[30,30,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,-4,-10,-11,-12,-13,-54,-56,-28,-119,-29,-120,-30,-121,-91,-92,30,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,-34,-90,-55,-118,-123,-122,-102,30,-5,-117,-82,-31,-66,-86,-32,-33,-124,-88,-125,-35,-107,-115,-73,-87,-68,-23,-126,-69,-74,-116,-108,30,30,30,-128,-93,30,30,30,]),'FOR':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,51,52,64,65,66,68,69,73,74,79,80,81,82,93,94,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,125,126,132,141,148,151,152,156,157,158,159,163,165,167,168,169,176,190,191,194,197,200,201,214,222,223,224,232,233,246,248,249,250,251,252,253,254,255,256,],[31,31,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,-4,-10,-11,-12,-13,-54,-56,-28,-119,-29,-120,-30,-121,-91,-92,31,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,-34,-90,-55,-118,-123,-122,-102,31,-5,-117,-82,-31,-66,-86,-32,-33,-124,-88,-125,-35,-107,-115,-73,-87,-68,-23,-126,-69,-74,-116,-108,31,31,31,-128,-93,31,31,31,]),'BREAK':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,51,52,64,65,66,68,69,73,74,79,80,81,82,93,94,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,125,126,132,141,148,151,152,156,157,158,159,163,165,167,168,169,176,190,191,194,197,200,201,214,222,223,224,232,233,246,248,249,250,251,252,253,254,255,256,],[32,32,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,-4,-10,-11,-12,-13,-54,-56,-28,-119,-29,-120,-30,-121,-91,-92,32,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,-34,-90,-55,-118,-123,-122,-102,32,-5,-117,-82,-31,-66,-86,-32,-33,-124,-88,-125,-35,-107,-115,-73,-87,-68,-23,-126,-69,-74,-116,-108,32,32,32,-128,-93,32,32,32,]),'CONTINUE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,51,52,64,65,66,68,69,73,74,79,80,81,82,93,94,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,125,126,132,141,148,151,152,156,157,158,159,163,165,167,168,169,176,190,191,194,197,200,201,214,222,223,224,232,233,246,248,249,250,251,252,253,254,255,256,],[33,33,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,-4,-10,-11,-12,-13,-54,-56,-28,-119,-29,-120,-30,-121,-91,-92,33,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,-34,-90,-55,-118,-123,-122,-102,33,-5,-117,-82,-31,-66,-86,-32,-33,-124,-88,-125,-35,-107,-115,-73,-87,-68,-23,-126,-69,-74,-116,-108,33,33,33,-128,-93,33,33,33,]),'SWITCH':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,51,52,64,65,66,68,69,73,74,79,80,81,82,93,94,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,125,126,132,141,148,151,152,156,157,158,159,163,165,167,168,169,176,190,191,194,197,200,201,214,222,223,224,232,233,246,248,249,250,251,252,253,254,255,256,],[34,34,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,-4,-10,-11,-12,-13,-54,-56,-28,-119,-29,-120,-30,-121,-91,-92,34,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,-34,-90,-55,-118,-123,-122,-102,34,-5,-117,-82,-31,-66,-86,-32,-33,-124,-88,-125,-35,-107,-115,-73,-87,-68,-23,-126,-69,-74,-116,-108,34,34,34,-128,-93,34,34,34,]),'TRY':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,51,52,64,65,66,68,69,73,74,79,80,81,82,93,94,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,125,126,132,141,148,151,152,156,157,158,159,163,165,167,168,169,176,190,191,194,197,200,201,214,222,223,224,232,233,246,248,249,250,251,252,253,254,255,256,],[36,36,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,-4,-10,-11,-12,-13,-54,-56,-28,-119,-29,-120,-30,-121,-91,-92,36,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,-34,-90,-55,-118,-123,-122,-102,36,-5,-117,-82,-31,-66,-86,-32,-33,-124,-88,-125,-35,-107,-115,-73,-87,-68,-23,-126,-69,-74,-116,-108,36,36,36,-128,-93,36,36,36,]),'THROW':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,51,52,64,65,66,68,69,73,74,79,80,81,82,93,94,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,125,126,132,141,148,151,152,156,157,158,159,163,165,167,168,169,176,190,191,194,197,200,201,214,222,223,224,232,233,246,248,249,250,251,252,253,254,255,256,],[37,37,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,-4,-10,-11,-12,-13,-54,-56,-28,-119,-29,-120,-30,-121,-91,-92,37,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,-34,-90,-55,-118,-123,-122,-102,37,-5,-117,-82,-31,-66,-86,-32,-33,-124,-88,-125,-35,-107,-115,-73,-87,-68,-23,-126,-69,-74,-116,-108,37,37,37,-128,-93,37,37,37,]),'LBRACKET':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,23,26,27,37,38,39,41,42,43,44,46,47,48,49,50,51,52,53,64,65,66,68,69,73,74,75,77,78,79,80,81,82,85,88,90,93,94,95,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,141,148,151,152,154,156,157,158,159,160,162,163,164,165,166,167,168,169,170,176,177,178,179,180,181,182,184,190,191,193,194,197,200,201,214,222,223,224,226,229,232,233,238,246,248,249,250,251,252,253,254,255,256,],[39,39,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,39,-36,-47,-48,78,-67,39,39,-49,39,-52,-53,-57,-59,-61,-62,-63,-64,-65,-4,-10,39,-11,-12,-13,78,-56,-28,-119,39,39,39,-29,-120,-30,-121,78,39,39,-91,-92,39,39,-60,78,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,39,-34,-90,39,39,-55,-118,-123,-122,-102,39,39,-5,-117,-82,39,39,-31,39,-66,39,-86,-32,-33,39,-124,39,39,39,39,39,39,39,-88,-125,39,-35,-107,-115,-73,-87,-68,-23,-126,39,39,-69,-74,78,-116,-108,39,39,39,-128,-93,39,39,39,]),'CONSOLE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,23,26,27,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,68,69,71,72,73,74,75,77,78,79,80,81,82,88,90,93,94,95,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,141,148,151,152,154,156,157,158,159,160,162,163,164,165,166,167,168,169,170,176,177,178,179,180,181,182,184,190,191,193,194,197,200,201,214,222,223,224,226,229,232,233,246,248,249,250,251,252,253,254,255,256,],[40,40,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,40,-36,-47,-48,-54,-67,40,40,-49,40,-52,-53,-57,-59,40,-61,-62,-63,-64,-65,-4,-10,40,40,40,40,40,40,40,40,40,40,40,-11,-12,-13,-54,-56,40,40,-28,-119,40,40,40,-29,-120,-30,-121,40,40,-91,-92,40,40,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,40,-34,-90,40,40,-55,-118,-123,-122,-102,40,40,-5,-117,-82,40,40,-31,40,-66,40,-86,-32,-33,40,-124,40,40,40,40,40,40,40,-88,-125,40,-35,-107,-115,-73,-87,-68,-23,-126,40,40,-69,-74,-116,-108,40,40,40,-128,-93,40,40,40,]),'NUMBER':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,23,26,27,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,68,69,71,72,73,74,75,77,78,79,80,81,82,88,90,93,94,95,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,141,148,151,152,154,156,157,158,159,160,162,163,164,165,166,167,168,169,170,176,177,178,179,180,181,182,184,190,191,193,194,197,200,201,214,222,223,224,226,229,232,233,246,248,249,250,251,252,253,254,255,256,],[41,41,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,41,-36,-47,-48,-54,-67,41,41,-49,41,-52,-53,-57,-59,41,-61,-62,-63,-64,-65,-4,-10,41,41,41,41,41,41,41,41,41,41,41,-11,-12,-13,-54,-56,41,41,-28,-119,41,41,41,-29,-120,-30,-121,41,41,-91,-92,41,41,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,41,-34,-90,41,41,-55,-118,-123,-122,-102,41,41,-5,-117,-82,41,41,-31,41,-66,41,-86,-32,-33,41,-124,41,41,41,41,41,41,41,-88,-125,41,-35,-107,-115,-73,-87,-68,-23,-126,41,41,-69,-74,-116,-108,41,41,41,-128,-93,41,41,41,]),'STRING':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,23,26,27,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,68,69,71,72,73,74,75,77,78,79,80,81,82,88,90,93,94,95,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,141,148,151,152,154,156,157,158,159,160,162,163,164,165,166,167,168,169,170,176,177,178,179,180,181,182,184,190,191,193,194,197,200,201,214,222,223,224,226,229,232,233,246,248,249,250,251,252,253,254,255,256,],[42,42,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,42,-36,-47,-48,-54,-67,42,42,-49,42,-52,-53,-57,-59,42,-61,-62,-63,-64,-65,-4,-10,42,42,42,42,42,42,42,42,42,42,42,-11,-12,-13,-54,-56,42,42,-28,-119,42,42,42,-29,-120,-30,-121,42,42,-91,-92,42,42,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,42,-34,-90,42,42,-55,-118,-123,-122,-102,42,42,-5,-117,-82,42,42,-31,42,-66,42,-86,-32,-33,42,-124,42,42,42,42,42,42,42,-88,-125,42,-35,-107,-115,-73,-87,-68,-23,-126,42,42,-69,-74,-116,-108,42,42,42,-128,-93,42,42,42,]),'LPAREN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,23,26,27,28,29,30,31,34,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,68,69,70,71,72,73,74,75,77,78,79,80,81,82,85,86,88,90,93,94,95,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,141,148,151,152,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,176,177,178,179,180,181,182,184,190,191,193,194,197,200,201,214,222,223,224,226,229,232,233,238,246,248,249,250,251,252,253,254,255,256,],[27,27,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,27,-36,-47,-48,77,-67,27,87,88,90,91,95,27,-49,27,-52,-53,-57,-59,27,-61,-62,-63,-64,-65,-4,-10,27,27,27,27,27,27,27,27,27,27,27,-11,-12,-13,77,-56,87,27,27,-28,-119,27,27,27,-29,-120,-30,-121,77,135,27,27,-91,-92,27,27,-60,77,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,27,-34,164,27,27,-55,-118,-123,-122,-102,27,189,27,-5,-117,-82,27,193,27,-31,27,-66,27,-86,-32,-33,27,-124,27,27,27,27,27,27,27,-88,-125,27,-35,-107,-115,-73,-87,-68,-23,-126,27,27,-69,-74,77,-116,-108,27,27,27,-128,-93,27,27,27,]),'NOT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,23,26,27,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,68,69,71,72,73,74,75,77,78,79,80,81,82,88,90,93,94,95,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,141,148,151,152,154,156,157,158,159,160,162,163,164,165,166,167,168,169,170,176,177,178,179,180,181,182,184,190,191,193,194,197,200,201,214,222,223,224,226,229,232,233,246,248,249,250,251,252,253,254,255,256,],[45,45,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,45,-36,-47,-48,-54,-67,45,45,-49,45,-52,-53,-57,-59,45,-61,-62,-63,-64,-65,-4,-10,45,45,45,45,45,45,45,45,45,45,45,-11,-12,-13,-54,-56,45,45,-28,-119,45,45,45,-29,-120,-30,-121,45,45,-91,-92,45,45,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,45,-34,-90,45,45,-55,-118,-123,-122,-102,45,45,-5,-117,-82,45,45,-31,45,-66,45,-86,-32,-33,45,-124,45,45,45,45,45,45,45,-88,-125,45,-35,-107,-115,-73,-87,-68,-23,-126,45,45,-69,-74,-116,-108,45,45,45,-128,-93,45,45,45,]),'TRUE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,23,26,27,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,68,69,71,72,73,74,75,77,78,79,80,81,82,88,90,93,94,95,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,141,148,151,152,154,156,157,158,159,160,162,163,164,165,166,167,168,169,170,176,177,178,179,180,181,182,184,190,191,193,194,197,200,201,214,222,223,224,226,229,232,233,246,248,249,250,251,252,253,254,255,256,],[49,49,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,49,-36,-47,-48,-54,-67,49,49,-49,49,-52,-53,-57,-59,49,-61,-62,-63,-64,-65,-4,-10,49,49,49,49,49,49,49,49,49,49,49,-11,-12,-13,-54,-56,49,49,-28,-119,49,49,49,-29,-120,-30,-121,49,49,-91,-92,49,49,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,49,-34,-90,49,49,-55,-118,-123,-122,-102,49,49,-5,-117,-82,49,49,-31,49,-66,49,-86,-32,-33,49,-124,49,49,49,49,49,49,49,-88,-125,49,-35,-107,-115,-73,-87,-68,-23,-126,49,49,-69,-74,-116,-108,49,49,49,-128,-93,49,49,49,]),'FALSE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,23,26,27,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,68,69,71,72,73,74,75,77,78,79,80,81,82,88,90,93,94,95,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,141,148,151,152,154,156,157,158,159,160,162,163,164,165,166,167,168,169,170,176,177,178,179,180,181,182,184,190,191,193,194,197,200,201,214,222,223,224,226,229,232,233,246,248,249,250,251,252,253,254,255,256,],[50,50,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,50,-36,-47,-48,-54,-67,50,50,-49,50,-52,-53,-57,-59,50,-61,-62,-63,-64,-65,-4,-10,50,50,50,50,50,50,50,50,50,50,50,-11,-12,-13,-54,-56,50,50,-28,-119,50,50,50,-29,-120,-30,-121,50,50,-91,-92,50,50,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,50,-34,-90,50,50,-55,-118,-123,-122,-102,50,50,-5,-117,-82,50,50,-31,50,-66,50,-86,-32,-33,50,-124,50,50,50,50,50,50,50,-88,-125,50,-35,-107,-115,-73,-87,-68,-23,-126,50,50,-69,-74,-116,-108,50,50,50,-128,-93,50,50,50,]),'LBRACE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,23,26,27,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,68,69,71,72,73,74,75,77,78,79,80,81,82,88,89,90,92,93,94,95,96,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,139,141,148,151,152,154,156,157,158,159,160,162,163,164,165,166,167,168,169,170,174,175,176,177,178,179,180,181,182,183,184,185,186,190,191,193,194,197,198,199,200,201,214,222,223,224,225,226,229,231,232,233,246,247,248,249,250,251,252,253,254,255,256,],[35,35,-5,-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,35,-36,-47,-48,-54,-67,35,102,35,-49,35,-52,-53,-57,-59,35,-61,-62,-63,-64,-65,-4,-10,35,35,35,35,35,35,35,35,35,35,35,-11,-12,-13,-54,-56,35,35,-28,-119,35,35,35,-29,-120,-30,-121,35,102,35,102,-91,-92,35,102,35,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,35,-34,-90,35,35,-55,102,-118,-123,-122,-102,35,35,-5,-117,-82,35,35,-31,35,-66,35,-86,-32,-33,35,102,102,-124,35,35,35,35,35,35,102,35,218,219,-88,-125,35,-35,-107,102,102,-115,-73,-87,-68,-23,-126,102,35,35,102,-69,-74,-116,102,-108,35,35,35,-128,-93,35,35,35,]),'RBRACE':([4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,23,26,35,38,41,42,43,44,46,47,48,49,50,51,52,64,65,66,68,69,73,74,79,80,81,82,93,94,97,98,99,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,125,126,132,141,148,151,152,156,157,158,159,163,165,167,168,169,176,187,188,190,191,194,197,200,201,214,222,223,224,227,228,230,232,233,239,240,242,245,246,248,249,250,251,252,253,254,255,256,],[-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,-36,-47,-48,-54,-67,-89,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,-4,-10,-11,-12,-13,-54,-56,-28,-119,-29,-120,-30,-121,-91,-92,152,-103,-105,-89,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,-34,-90,-55,-118,-123,-122,-102,190,-5,-117,-82,-31,-66,-86,-32,-33,-124,-104,-106,-88,-125,-35,-107,-115,-73,-87,-68,-23,-126,-89,-110,-89,-69,-74,248,-109,-114,252,-116,-108,-89,-89,-89,-128,-93,-113,-127,-112,]),'error':([4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,22,23,24,25,26,29,31,34,38,41,42,43,44,46,47,48,49,50,51,52,64,65,66,68,69,73,74,79,80,81,82,88,93,94,95,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,125,126,132,135,141,148,151,152,156,157,158,159,163,165,167,168,169,176,190,191,194,197,200,201,214,222,223,224,229,232,233,246,248,252,253,],[-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,-36,-47,-48,74,-54,80,82,-67,89,92,96,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,-4,-10,-11,-12,-13,-54,-56,-28,-119,-29,-120,-30,-121,139,-91,-92,150,-89,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,-34,-90,-55,173,-118,-123,-122,-102,191,-5,-117,-82,-31,-66,-86,-32,-33,-124,-88,-125,-35,-107,-115,-73,-87,-68,-23,-126,243,-69,-74,-116,-108,-128,-93,]),'DEFAULT':([4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,51,52,64,65,66,68,69,73,74,79,80,81,82,93,94,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,125,126,132,141,148,151,152,157,158,159,163,165,167,168,169,176,190,191,194,197,200,201,214,222,223,224,227,228,230,232,233,240,246,248,250,251,252,253,255,256,],[-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,-4,-10,-11,-12,-13,-54,-56,-28,-119,-29,-120,-30,-121,-91,-92,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,-34,-90,-55,-118,-123,-122,-102,-5,-117,-82,-31,-66,-86,-32,-33,-124,-88,-125,-35,-107,-115,-73,-87,-68,-23,-126,241,-110,241,-69,-74,-109,-116,-108,-89,-89,-128,-93,-127,-112,]),'CASE':([4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,51,52,64,65,66,68,69,73,74,79,80,81,82,93,94,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,125,126,132,141,148,151,152,157,158,159,163,165,167,168,169,176,190,191,194,197,200,201,214,218,219,222,223,224,227,228,230,232,233,240,246,248,250,251,252,253,255,256,],[-3,-6,-7,-8,-9,-14,-15,-16,-17,-18,-19,-20,-21,-22,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,-4,-10,-11,-12,-13,-54,-56,-28,-119,-29,-120,-30,-121,-91,-92,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-27,-50,-51,-34,-90,-55,-118,-123,-122,-102,-5,-117,-82,-31,-66,-86,-32,-33,-124,-88,-125,-35,-107,-115,-73,-87,229,229,-68,-23,-126,229,-110,229,-69,-74,-109,-116,-108,-89,-89,-128,-93,-127,-112,]),'SEMICOLON':([5,6,7,8,19,20,21,23,26,32,33,38,41,42,43,44,46,47,48,49,50,67,68,69,73,74,79,80,81,82,91,103,107,108,109,111,112,113,114,115,116,117,118,119,120,122,123,125,126,132,143,144,145,146,152,159,163,165,167,168,169,184,190,191,194,197,200,215,216,217,222,232,],[52,64,65,66,-36,-47,-48,-54,-67,93,94,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,121,-54,-56,-28,-119,-29,-120,-30,-121,-89,158,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-50,-51,-34,-90,-55,184,-94,-95,-96,-102,-82,-31,-66,-86,-32,-33,-89,-88,-125,-35,-107,-115,226,-97,-98,-68,-69,]),'QUESTION':([5,8,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,67,68,69,83,85,103,105,107,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,125,126,128,129,132,140,149,152,159,163,165,167,168,169,188,190,191,192,194,196,197,200,202,203,204,205,206,207,208,209,210,211,212,213,216,222,232,236,238,244,],[53,-56,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,53,-54,-56,53,-54,53,53,-60,-54,-58,53,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-50,-51,53,-90,53,53,-55,53,53,-102,-82,53,-66,-86,53,53,53,-88,-125,53,53,53,53,-115,53,-36,53,-36,53,-36,53,-36,53,-36,53,-36,53,-68,-69,53,-54,53,]),'PLUS':([5,8,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,67,68,69,83,85,103,105,107,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,125,126,128,129,132,140,149,152,159,163,165,167,168,169,188,190,191,192,194,196,197,200,202,203,204,205,206,207,208,209,210,211,212,213,216,222,232,236,238,244,],[54,-56,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,54,-54,-56,54,-54,54,54,-60,-54,-58,54,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-50,-51,54,-90,54,54,-55,54,54,-102,-82,54,-66,-86,54,54,54,-88,-125,54,54,54,54,-115,54,-36,54,-36,54,-36,54,-36,54,-36,54,-36,54,-68,-69,54,-54,54,]),'MINUS':([5,8,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,67,68,69,83,85,103,105,107,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,125,126,128,129,132,140,149,152,159,163,165,167,168,169,188,190,191,192,194,196,197,200,202,203,204,205,206,207,208,209,210,211,212,213,216,222,232,236,238,244,],[55,-56,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,55,-54,-56,55,-54,55,55,-60,-54,-58,55,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-50,-51,55,-90,55,55,-55,55,55,-102,-82,55,-66,-86,55,55,55,-88,-125,55,55,55,55,-115,55,-36,55,-36,55,-36,55,-36,55,-36,55,-36,55,-68,-69,55,-54,55,]),'GT':([5,8,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,67,68,69,83,85,103,105,107,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,125,126,128,129,132,140,149,152,159,163,165,167,168,169,188,190,191,192,194,196,197,200,202,203,204,205,206,207,208,209,210,211,212,213,216,222,232,236,238,244,],[56,-56,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,56,-54,-56,56,-54,56,56,-60,-54,-58,56,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-50,-51,56,-90,56,56,-55,177,56,-102,-82,56,-66,-86,56,56,56,-88,-125,56,56,56,56,-115,56,-36,56,-36,56,-36,56,-36,56,-36,56,-36,56,-68,-69,56,-54,56,]),'LT':([5,8,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,67,68,69,83,85,103,105,107,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,125,126,128,129,132,140,149,152,159,163,165,167,168,169,188,190,191,192,194,196,197,200,202,203,204,205,206,207,208,209,210,211,212,213,216,222,232,236,238,244,],[57,-56,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,57,-54,-56,57,-54,57,57,-60,-54,-58,57,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-50,-51,57,-90,57,57,-55,178,57,-102,-82,57,-66,-86,57,57,57,-88,-125,57,57,57,57,-115,57,-36,57,-36,57,-36,57,-36,57,-36,57,-36,57,-68,-69,57,-54,57,]),'GE':([5,8,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,67,68,69,83,85,103,105,107,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,125,126,128,129,132,140,149,152,159,163,165,167,168,169,188,190,191,192,194,196,197,200,202,203,204,205,206,207,208,209,210,211,212,213,216,222,232,236,238,244,],[58,-56,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,58,-54,-56,58,-54,58,58,-60,-54,-58,58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-50,-51,58,-90,58,58,-55,179,58,-102,-82,58,-66,-86,58,58,58,-88,-125,58,58,58,58,-115,58,-36,58,-36,58,-36,58,-36,58,-36,58,-36,58,-68,-69,58,-54,58,]),'LE':([5,8,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,67,68,69,83,85,103,105,107,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,125,126,128,129,132,140,149,152,159,163,165,167,168,169,188,190,191,192,194,196,197,200,202,203,204,205,206,207,208,209,210,211,212,213,216,222,232,236,238,244,],[59,-56,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,59,-54,-56,59,-54,59,59,-60,-54,-58,59,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-50,-51,59,-90,59,59,-55,180,59,-102,-82,59,-66,-86,59,59,59,-88,-125,59,59,59,59,-115,59,-36,59,-36,59,-36,59,-36,59,-36,59,-36,59,-68,-69,59,-54,59,]),'EQUALS':([5,8,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,67,68,69,83,85,103,105,107,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,125,126,128,129,132,140,149,152,159,163,165,167,168,169,188,190,191,192,194,196,197,200,202,203,204,205,206,207,208,209,210,211,212,213,216,222,232,236,238,244,],[60,-56,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,60,-54,-56,60,-54,60,60,-60,-54,-58,60,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-50,-51,60,-90,60,60,-55,181,60,-102,-82,60,-66,-86,60,60,60,-88,-125,60,60,60,60,-115,60,-36,60,-36,60,-36,60,-36,60,-36,60,-36,60,-68,-69,60,-54,60,]),'NOTEQUALS':([5,8,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,67,68,69,83,85,103,105,107,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,125,126,128,129,132,140,149,152,159,163,165,167,168,169,188,190,191,192,194,196,197,200,202,203,204,205,206,207,208,209,210,211,212,213,216,222,232,236,238,244,],[61,-56,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,61,-54,-56,61,-54,61,61,-60,-54,-58,61,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-50,-51,61,-90,61,61,-55,182,61,-102,-82,61,-66,-86,61,61,61,-88,-125,61,61,61,61,-115,61,-36,61,-36,61,-36,61,-36,61,-36,61,-36,61,-68,-69,61,-54,61,]),'AND':([5,8,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,67,68,69,83,85,103,105,107,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,125,126,128,129,132,140,149,152,159,163,165,167,168,169,188,190,191,192,194,196,197,200,202,203,204,205,206,207,208,209,210,211,212,213,216,222,232,236,238,244,],[62,-56,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,62,-54,-56,62,-54,62,62,-60,-54,-58,62,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-50,-51,62,-90,62,62,-55,62,62,-102,-82,62,-66,-86,62,62,62,-88,-125,62,62,62,62,-115,62,-36,62,-36,62,-36,62,-36,62,-36,62,-36,62,-68,-69,62,-54,62,]),'OR':([5,8,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,67,68,69,83,85,103,105,107,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,125,126,128,129,132,140,149,152,159,163,165,167,168,169,188,190,191,192,194,196,197,200,202,203,204,205,206,207,208,209,210,211,212,213,216,222,232,236,238,244,],[63,-56,-36,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,63,-54,-56,63,-54,63,63,-60,-54,-58,63,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-50,-51,63,-90,63,63,-55,63,63,-102,-82,63,-66,-86,63,63,63,-88,-125,63,63,63,63,-115,63,-36,63,-36,63,-36,63,-36,63,-36,63,-36,63,-68,-69,63,-54,63,]),'TIMES':([8,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,68,69,85,107,108,109,111,112,113,114,115,116,117,118,119,120,122,123,126,132,152,159,165,167,190,191,194,197,200,203,205,207,209,211,213,222,232,238,],[-56,71,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,-54,-56,-54,-60,-54,-58,71,71,71,71,71,71,71,71,71,71,-50,-51,-90,-55,-102,-82,-66,-86,-88,-125,-35,-107,-115,71,71,71,71,71,71,-68,-69,-54,]),'DIVIDE':([8,19,20,21,23,26,38,41,42,43,44,46,47,48,49,50,68,69,85,107,108,109,111,112,113,114,115,116,117,118,119,120,122,123,126,132,152,159,165,167,190,191,194,197,200,203,205,207,209,211,213,222,232,238,],[-56,72,-47,-48,-54,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,-54,-56,-54,-60,-54,-58,72,72,72,72,72,72,72,72,72,72,-50,-51,-90,-55,-102,-82,-66,-86,-88,-125,-35,-107,-115,72,72,72,72,72,72,-68,-69,-54,]),'RPAREN':([19,20,21,26,27,38,41,42,43,44,46,47,48,49,50,68,69,77,83,84,85,87,107,108,109,111,112,113,114,115,116,117,118,119,120,122,123,125,126,127,128,132,135,136,137,138,140,142,149,150,152,159,164,165,167,171,172,173,190,191,193,194,195,196,197,200,202,203,204,205,206,207,208,209,210,211,212,213,220,221,222,226,232,234,235,236,237,238,],[-36,-47,-48,-67,-24,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,-54,-56,-70,132,133,-25,-24,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-50,-51,-34,-90,165,-71,-55,-24,174,-25,175,-75,183,185,186,-102,-82,-70,-66,-86,-26,198,199,-88,-125,-70,-35,222,-72,-107,-115,-76,-36,-77,-36,-78,-36,-79,-36,-80,-36,-81,-36,231,232,-68,-89,-69,247,-99,-100,-101,-54,]),'RBRACKET':([19,20,21,26,38,39,41,42,43,44,46,47,48,49,50,68,69,104,105,107,108,109,111,112,113,114,115,116,117,118,119,120,122,123,126,129,132,152,159,165,167,190,191,192,194,197,200,222,232,],[-36,-47,-48,-67,-49,-83,-52,-53,-57,-59,-61,-62,-63,-64,-65,-54,-56,159,-84,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-50,-51,-90,167,-55,-102,-82,-66,-86,-88,-125,-85,-35,-107,-115,-68,-69,]),'COMMA':([19,20,21,26,27,35,38,39,41,42,43,44,46,47,48,49,50,68,69,77,84,85,87,97,98,99,104,105,107,108,109,111,112,113,114,115,116,117,118,119,120,122,123,126,127,128,132,135,136,137,152,159,164,165,167,171,172,187,188,190,191,192,193,194,195,196,197,200,221,222,232,],[-36,-47,-48,-67,-24,-89,-49,-83,-52,-53,-57,-59,-61,-62,-63,-64,-65,-54,-56,-70,134,-25,-24,153,-103,-105,160,-84,-60,-54,-58,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-50,-51,-90,166,-71,-55,-24,134,-25,-102,-82,-70,-66,-86,-26,134,-104,-106,-88,-125,-85,-70,-35,166,-72,-107,-115,166,-68,-69,]),'COLON':([19,20,21,26,38,41,42,43,44,46,47,48,49,50,68,69,100,107,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,126,132,152,159,165,167,190,191,194,197,200,222,232,241,243,244,],[-36,-47,-48,-67,-49,-52,-53,-57,-59,-61,-62,-63,-64,-65,-54,-56,154,-60,-54,-58,162,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-50,-51,-90,-55,-102,-82,-66,-86,-88,-125,-35,-107,-115,-68,-69,249,250,251,]),'ASSIGN':([23,73,79,81,147,238,],[75,124,130,131,75,75,]),'DOT':([23,40,68,85,108,238,],[76,106,76,76,76,76,]),'CATCH':([101,190,191,],[155,-88,-125,]),'LOG':([106,],[161,]),'ARROW':([133,],[170,]),'ELSE':([190,191,201,],[-88,-125,225,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'statements':([0,99,246,247,248,],[2,153,251,252,253,]),'empty':([0,33,89,99,181,223,224,227,246,247,248,],[3,96,143,154,214,234,239,239,154,154,154,]),'statement':([0,2,99,153,246,247,248,251,252,253,],[4,49,4,49,4,4,4,49,49,49,]),'expression':([0,2,17,26,35,37,51,73,75,76,86,88,92,99,121,127,128,151,153,157,159,161,163,167,174,175,176,177,178,179,181,190,223,226,246,247,248,251,252,253,],[5,5,65,81,100,102,107,122,125,126,137,137,146,5,160,165,166,185,5,189,191,125,193,194,199,201,203,205,207,209,213,125,233,241,5,5,5,5,5,5,]),'declaration':([0,2,89,99,153,246,247,248,251,252,253,],[6,6,141,6,6,6,6,6,6,6,6,]),'assignment':([0,2,89,99,153,223,246,247,248,251,252,253,],[7,7,142,7,7,232,7,7,7,7,7,7,]),'method_call':([0,2,17,26,35,37,43,51,52,53,54,55,56,57,58,59,60,61,69,70,73,75,76,86,88,92,99,121,127,128,151,153,157,159,161,163,167,174,175,176,177,178,179,181,190,223,226,246,247,248,251,252,253,],[8,8,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,8,67,67,67,67,8,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,8,8,8,8,8,8,]),'function_declaration':([0,2,99,153,246,247,248,251,252,253,],[9,9,9,9,9,9,9,9,9,9,]),'if_statement':([0,2,99,153,246,247,248,251,252,253,],[10,10,10,10,10,10,10,10,10,10,]),'while_statement':([0,2,99,153,246,247,248,251,252,253,],[11,11,11,11,11,11,11,11,11,11,]),'for_statement':([0,2,99,153,246,247,248,251,252,253,],[12,12,12,12,12,12,12,12,12,12,]),'break_statement':([0,2,99,153,246,247,248,251,252,253,],[13,13,13,13,13,13,13,13,13,13,]),'switch_statement':([0,2,99,153,246,247,248,251,252,253,],[14,14,14,14,14,14,14,14,14,14,]),'try_catch_statement':([0,2,99,153,246,247,248,251,252,253,],[15,15,15,15,15,15,15,15,15,15,]),'throw_statement':([0,2,99,153,246,247,248,251,252,253,],[16,16,16,16,16,16,16,16,16,16,]),'term':([0,2,17,26,35,37,51,52,53,54,55,56,57,58,59,60,61,73,75,76,86,88,92,99,121,127,128,151,153,157,159,161,163,167,174,175,176,177,178,179,181,190,223,226,246,247,248,251,252,253,],[18,18,18,18,18,18,18,108,109,110,111,112,113,114,115,116,117,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,200,202,204,206,208,210,18,18,18,18,18,18,18,18,18,18,]),'array_literal':([0,2,17,26,35,37,51,73,75,76,86,88,92,99,121,127,128,151,153,157,159,161,163,167,174,175,176,177,178,179,181,190,223,226,246,247,248,251,252,253,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'array_access':([0,2,17,26,35,37,43,51,52,53,54,55,56,57,58,59,60,61,69,70,73,75,76,86,88,92,99,121,127,128,151,153,157,159,161,163,167,174,175,176,177,178,179,181,190,223,226,246,247,248,251,252,253,],[20,20,20,20,20,20,106,20,106,106,106,106,106,106,106,106,106,106,106,106,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'console_log':([0,2,17,26,35,37,43,51,52,53,54,55,56,57,58,59,60,61,69,70,73,75,76,86,88,92,99,121,127,128,151,153,157,159,161,163,167,174,175,176,177,178,179,181,190,223,226,246,247,248,251,252,253,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,]),'factor':([0,2,17,26,35,37,43,51,52,53,54,55,56,57,58,59,60,61,69,70,73,75,76,86,88,92,99,121,127,128,151,153,157,159,161,163,167,174,175,176,177,178,179,181,190,223,226,246,247,248,251,252,253,],[36,36,36,36,36,36,104,36,36,36,36,36,36,36,36,36,36,36,119,120,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,]),'function_call':([0,2,17,26,35,37,43,51,52,53,54,55,56,57,58,59,60,61,69,70,73,75,76,86,88,92,99,121,127,128,151,153,157,159,161,163,167,174,175,176,177,178,179,181,190,223,226,246,247,248,251,252,253,],[41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,]),'property_access':([0,2,17,26,35,37,43,51,52,53,54,55,56,57,58,59,60,61,69,70,73,75,76,86,88,92,99,121,127,128,151,153,157,159,161,163,167,174,175,176,177,178,179,181,190,223,226,246,247,248,251,252,253,],[42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,]),'object_literal':([0,2,17,26,35,37,43,51,52,53,54,55,56,57,58,59,60,61,69,70,73,75,76,86,88,92,99,121,127,128,151,153,157,159,161,163,167,174,175,176,177,178,179,181,190,223,226,246,247,248,251,252,253,],[44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'arrow_function':([0,2,17,26,35,37,43,51,52,53,54,55,56,57,58,59,60,61,69,70,73,75,76,86,88,92,99,121,127,128,151,153,157,159,161,163,167,174,175,176,177,178,179,181,190,223,226,246,247,248,251,252,253,],[45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'anonymous_function':([0,2,17,26,35,37,43,51,52,53,54,55,56,57,58,59,60,61,69,70,73,75,76,86,88,92,99,121,127,128,151,153,157,159,161,163,167,174,175,176,177,178,179,181,190,223,226,246,247,248,251,252,253,],[46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'parameter_list':([26,85,132,],[82,133,169,]),'object_properties':([33,],[94,]),'object_property':([33,150,],[95,184,]),'block':([34,87,90,93,136,171,172,180,195,196,222,228,244,],[98,138,145,148,173,197,198,211,220,221,230,243,250,]),'array_elements':([37,],[101,]),'arguments':([75,161,190,],[124,192,218,]),'condition':([86,88,],[135,139,]),'for_init':([89,],[140,]),'for_condition':([181,],[212,]),'case_blocks':([215,216,],[224,227,]),'case_block':([215,216,224,227,],[225,225,237,237,]),'for_update':([223,],[231,]),'default_block':([224,227,],[236,242,]),}
+_lr_goto_items = {'program':([0,],[1,]),'statements':([0,102,249,250,251,],[2,156,254,255,256,]),'empty':([0,35,91,102,184,226,227,230,249,250,251,],[3,99,146,157,217,237,242,242,157,157,157,]),'statement':([0,2,102,156,249,250,251,254,255,256,],[4,51,4,51,4,4,4,51,51,51,]),'expression':([0,2,18,27,37,39,53,75,77,78,88,90,95,102,124,130,131,154,156,160,162,164,166,170,177,178,179,180,181,182,184,193,226,229,249,250,251,254,255,256,],[5,5,67,83,103,105,110,125,128,129,140,140,149,5,163,168,169,188,5,192,194,128,196,197,202,204,206,208,210,212,216,128,236,244,5,5,5,5,5,5,]),'declaration':([0,2,91,102,156,249,250,251,254,255,256,],[6,6,144,6,6,6,6,6,6,6,6,]),'assignment':([0,2,91,102,156,226,249,250,251,254,255,256,],[7,7,145,7,7,235,7,7,7,7,7,7,]),'method_call':([0,2,18,27,37,39,45,53,54,55,56,57,58,59,60,61,62,63,71,72,75,77,78,88,90,95,102,124,130,131,154,156,160,162,164,166,170,177,178,179,180,181,182,184,193,226,229,249,250,251,254,255,256,],[8,8,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,8,69,69,69,69,8,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,8,8,8,8,8,8,]),'function_declaration':([0,2,102,156,249,250,251,254,255,256,],[9,9,9,9,9,9,9,9,9,9,]),'if_statement':([0,2,102,156,249,250,251,254,255,256,],[10,10,10,10,10,10,10,10,10,10,]),'while_statement':([0,2,102,156,249,250,251,254,255,256,],[11,11,11,11,11,11,11,11,11,11,]),'for_statement':([0,2,102,156,249,250,251,254,255,256,],[12,12,12,12,12,12,12,12,12,12,]),'break_statement':([0,2,102,156,249,250,251,254,255,256,],[13,13,13,13,13,13,13,13,13,13,]),'continue_statement':([0,2,102,156,249,250,251,254,255,256,],[14,14,14,14,14,14,14,14,14,14,]),'switch_statement':([0,2,102,156,249,250,251,254,255,256,],[15,15,15,15,15,15,15,15,15,15,]),'try_catch_statement':([0,2,102,156,249,250,251,254,255,256,],[16,16,16,16,16,16,16,16,16,16,]),'throw_statement':([0,2,102,156,249,250,251,254,255,256,],[17,17,17,17,17,17,17,17,17,17,]),'term':([0,2,18,27,37,39,53,54,55,56,57,58,59,60,61,62,63,75,77,78,88,90,95,102,124,130,131,154,156,160,162,164,166,170,177,178,179,180,181,182,184,193,226,229,249,250,251,254,255,256,],[19,19,19,19,19,19,19,111,112,113,114,115,116,117,118,119,120,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,203,205,207,209,211,213,19,19,19,19,19,19,19,19,19,19,]),'array_literal':([0,2,18,27,37,39,53,75,77,78,88,90,95,102,124,130,131,154,156,160,162,164,166,170,177,178,179,180,181,182,184,193,226,229,249,250,251,254,255,256,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'array_access':([0,2,18,27,37,39,45,53,54,55,56,57,58,59,60,61,62,63,71,72,75,77,78,88,90,95,102,124,130,131,154,156,160,162,164,166,170,177,178,179,180,181,182,184,193,226,229,249,250,251,254,255,256,],[21,21,21,21,21,21,109,21,109,109,109,109,109,109,109,109,109,109,109,109,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'console_log':([0,2,18,27,37,39,45,53,54,55,56,57,58,59,60,61,62,63,71,72,75,77,78,88,90,95,102,124,130,131,154,156,160,162,164,166,170,177,178,179,180,181,182,184,193,226,229,249,250,251,254,255,256,],[26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,]),'factor':([0,2,18,27,37,39,45,53,54,55,56,57,58,59,60,61,62,63,71,72,75,77,78,88,90,95,102,124,130,131,154,156,160,162,164,166,170,177,178,179,180,181,182,184,193,226,229,249,250,251,254,255,256,],[38,38,38,38,38,38,107,38,38,38,38,38,38,38,38,38,38,38,122,123,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,]),'function_call':([0,2,18,27,37,39,45,53,54,55,56,57,58,59,60,61,62,63,71,72,75,77,78,88,90,95,102,124,130,131,154,156,160,162,164,166,170,177,178,179,180,181,182,184,193,226,229,249,250,251,254,255,256,],[43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,]),'property_access':([0,2,18,27,37,39,45,53,54,55,56,57,58,59,60,61,62,63,71,72,75,77,78,88,90,95,102,124,130,131,154,156,160,162,164,166,170,177,178,179,180,181,182,184,193,226,229,249,250,251,254,255,256,],[44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'object_literal':([0,2,18,27,37,39,45,53,54,55,56,57,58,59,60,61,62,63,71,72,75,77,78,88,90,95,102,124,130,131,154,156,160,162,164,166,170,177,178,179,180,181,182,184,193,226,229,249,250,251,254,255,256,],[46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'arrow_function':([0,2,18,27,37,39,45,53,54,55,56,57,58,59,60,61,62,63,71,72,75,77,78,88,90,95,102,124,130,131,154,156,160,162,164,166,170,177,178,179,180,181,182,184,193,226,229,249,250,251,254,255,256,],[47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,]),'anonymous_function':([0,2,18,27,37,39,45,53,54,55,56,57,58,59,60,61,62,63,71,72,75,77,78,88,90,95,102,124,130,131,154,156,160,162,164,166,170,177,178,179,180,181,182,184,193,226,229,249,250,251,254,255,256,],[48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,]),'parameter_list':([27,87,135,],[84,136,172,]),'object_properties':([35,],[97,]),'object_property':([35,153,],[98,187,]),'block':([36,89,92,96,139,174,175,183,198,199,225,231,247,],[101,141,148,151,176,200,201,214,223,224,233,246,253,]),'array_elements':([39,],[104,]),'arguments':([77,164,193,],[127,195,221,]),'condition':([88,90,],[138,142,]),'for_init':([91,],[143,]),'for_condition':([184,],[215,]),'case_blocks':([218,219,],[227,230,]),'case_block':([218,219,227,230,],[228,228,240,240,]),'for_update':([226,],[234,]),'default_block':([227,230,],[239,245,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,130 +27,133 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> statements','program',1,'p_program','parser.py',22),
-  ('program -> empty','program',1,'p_program','parser.py',23),
-  ('statements -> statement','statements',1,'p_statements','parser.py',30),
-  ('statements -> statements statement','statements',2,'p_statements','parser.py',31),
-  ('statements -> empty','statements',1,'p_statements','parser.py',32),
-  ('statement -> expression','statement',1,'p_statement_missing_semicolon','parser.py',45),
-  ('statement -> declaration','statement',1,'p_statement_missing_semicolon','parser.py',46),
-  ('statement -> assignment','statement',1,'p_statement_missing_semicolon','parser.py',47),
-  ('statement -> method_call','statement',1,'p_statement_missing_semicolon','parser.py',48),
-  ('statement -> expression SEMICOLON','statement',2,'p_statement','parser.py',52),
-  ('statement -> declaration SEMICOLON','statement',2,'p_statement','parser.py',53),
-  ('statement -> assignment SEMICOLON','statement',2,'p_statement','parser.py',54),
-  ('statement -> method_call SEMICOLON','statement',2,'p_statement','parser.py',55),
-  ('statement -> function_declaration','statement',1,'p_statement','parser.py',56),
-  ('statement -> if_statement','statement',1,'p_statement','parser.py',57),
-  ('statement -> while_statement','statement',1,'p_statement','parser.py',58),
-  ('statement -> for_statement','statement',1,'p_statement','parser.py',59),
-  ('statement -> break_statement','statement',1,'p_statement','parser.py',60),
-  ('statement -> switch_statement','statement',1,'p_statement','parser.py',61),
-  ('statement -> try_catch_statement','statement',1,'p_statement','parser.py',62),
-  ('statement -> throw_statement','statement',1,'p_statement','parser.py',63),
-  ('function_declaration -> FUNCTION ID LPAREN parameter_list RPAREN block','function_declaration',6,'p_function_declaration','parser.py',67),
-  ('parameter_list -> <empty>','parameter_list',0,'p_parameter_list','parser.py',75),
-  ('parameter_list -> ID','parameter_list',1,'p_parameter_list','parser.py',76),
-  ('parameter_list -> parameter_list COMMA ID','parameter_list',3,'p_parameter_list','parser.py',77),
-  ('statement -> RETURN expression SEMICOLON','statement',3,'p_statement_return','parser.py',87),
-  ('declaration -> VAR ID','declaration',2,'p_declaration','parser.py',91),
-  ('declaration -> LET ID','declaration',2,'p_declaration','parser.py',92),
-  ('declaration -> CONST ID','declaration',2,'p_declaration','parser.py',93),
-  ('declaration -> VAR ID ASSIGN expression','declaration',4,'p_declaration','parser.py',94),
-  ('declaration -> LET ID ASSIGN expression','declaration',4,'p_declaration','parser.py',95),
-  ('declaration -> CONST ID ASSIGN expression','declaration',4,'p_declaration','parser.py',96),
-  ('assignment -> ID ASSIGN expression','assignment',3,'p_assignment','parser.py',103),
-  ('expression -> expression QUESTION expression COLON expression','expression',5,'p_expression','parser.py',107),
-  ('expression -> term','expression',1,'p_expression','parser.py',108),
-  ('expression -> expression PLUS term','expression',3,'p_expression','parser.py',109),
-  ('expression -> expression MINUS term','expression',3,'p_expression','parser.py',110),
-  ('expression -> expression GT term','expression',3,'p_expression','parser.py',111),
-  ('expression -> expression LT term','expression',3,'p_expression','parser.py',112),
-  ('expression -> expression GE term','expression',3,'p_expression','parser.py',113),
-  ('expression -> expression LE term','expression',3,'p_expression','parser.py',114),
-  ('expression -> expression EQUALS term','expression',3,'p_expression','parser.py',115),
-  ('expression -> expression NOTEQUALS term','expression',3,'p_expression','parser.py',116),
-  ('expression -> expression AND term','expression',3,'p_expression','parser.py',117),
-  ('expression -> expression OR term','expression',3,'p_expression','parser.py',118),
-  ('expression -> array_literal','expression',1,'p_expression','parser.py',119),
-  ('expression -> array_access','expression',1,'p_expression','parser.py',120),
-  ('term -> factor','term',1,'p_term','parser.py',129),
-  ('term -> term TIMES factor','term',3,'p_term','parser.py',130),
-  ('term -> term DIVIDE factor','term',3,'p_term','parser.py',131),
-  ('factor -> NUMBER','factor',1,'p_factor','parser.py',138),
-  ('factor -> STRING','factor',1,'p_factor','parser.py',139),
-  ('factor -> ID','factor',1,'p_factor','parser.py',140),
-  ('factor -> LPAREN expression RPAREN','factor',3,'p_factor','parser.py',141),
-  ('factor -> method_call','factor',1,'p_factor','parser.py',142),
-  ('factor -> function_call','factor',1,'p_factor','parser.py',143),
-  ('factor -> array_access','factor',1,'p_factor','parser.py',144),
-  ('factor -> property_access','factor',1,'p_factor','parser.py',145),
-  ('factor -> NOT factor','factor',2,'p_factor','parser.py',146),
-  ('factor -> object_literal','factor',1,'p_factor','parser.py',147),
-  ('factor -> arrow_function','factor',1,'p_factor','parser.py',148),
-  ('factor -> anonymous_function','factor',1,'p_factor','parser.py',149),
-  ('factor -> TRUE','factor',1,'p_factor','parser.py',150),
-  ('factor -> FALSE','factor',1,'p_factor','parser.py',151),
-  ('function_call -> ID LPAREN arguments RPAREN','function_call',4,'p_function_call','parser.py',174),
-  ('method_call -> console_log','method_call',1,'p_method_call','parser.py',178),
-  ('method_call -> ID DOT ID LPAREN arguments RPAREN','method_call',6,'p_method_call','parser.py',179),
-  ('console_log -> CONSOLE DOT LOG LPAREN arguments RPAREN','console_log',6,'p_console_log','parser.py',188),
-  ('arguments -> <empty>','arguments',0,'p_arguments','parser.py',192),
-  ('arguments -> expression','arguments',1,'p_arguments','parser.py',193),
-  ('arguments -> arguments COMMA expression','arguments',3,'p_arguments','parser.py',194),
-  ('if_statement -> IF LPAREN condition RPAREN block','if_statement',5,'p_if_statement','parser.py',204),
-  ('if_statement -> IF LPAREN condition RPAREN block ELSE block','if_statement',7,'p_if_statement','parser.py',205),
-  ('condition -> expression','condition',1,'p_condition','parser.py',212),
-  ('condition -> expression GT expression','condition',3,'p_condition','parser.py',213),
-  ('condition -> expression LT expression','condition',3,'p_condition','parser.py',214),
-  ('condition -> expression GE expression','condition',3,'p_condition','parser.py',215),
-  ('condition -> expression LE expression','condition',3,'p_condition','parser.py',216),
-  ('condition -> expression EQUALS expression','condition',3,'p_condition','parser.py',217),
-  ('condition -> expression NOTEQUALS expression','condition',3,'p_condition','parser.py',218),
-  ('array_literal -> LBRACKET array_elements RBRACKET','array_literal',3,'p_array_literal','parser.py',225),
-  ('array_elements -> <empty>','array_elements',0,'p_array_elements','parser.py',229),
-  ('array_elements -> expression','array_elements',1,'p_array_elements','parser.py',230),
-  ('array_elements -> array_elements COMMA expression','array_elements',3,'p_array_elements','parser.py',231),
-  ('array_access -> ID LBRACKET expression RBRACKET','array_access',4,'p_array_access','parser.py',241),
-  ('while_statement -> WHILE LPAREN condition RPAREN block','while_statement',5,'p_while_statement','parser.py',245),
-  ('block -> LBRACE statements RBRACE','block',3,'p_block','parser.py',249),
-  ('empty -> <empty>','empty',0,'p_empty','parser.py',253),
-  ('property_access -> ID DOT ID','property_access',3,'p_property_access','parser.py',257),
-  ('break_statement -> BREAK SEMICOLON','break_statement',2,'p_break_statement','parser.py',261),
-  ('for_statement -> FOR LPAREN for_init SEMICOLON for_condition SEMICOLON for_update RPAREN block','for_statement',9,'p_for_statement','parser.py',265),
-  ('for_init -> declaration','for_init',1,'p_for_init','parser.py',269),
-  ('for_init -> assignment','for_init',1,'p_for_init','parser.py',270),
-  ('for_init -> empty','for_init',1,'p_for_init','parser.py',271),
-  ('for_condition -> expression','for_condition',1,'p_for_condition','parser.py',275),
-  ('for_condition -> empty','for_condition',1,'p_for_condition','parser.py',276),
-  ('for_update -> assignment','for_update',1,'p_for_update','parser.py',280),
-  ('for_update -> expression','for_update',1,'p_for_update','parser.py',281),
-  ('for_update -> empty','for_update',1,'p_for_update','parser.py',282),
-  ('object_literal -> LBRACE object_properties RBRACE','object_literal',3,'p_object_literal','parser.py',302),
-  ('object_properties -> object_property','object_properties',1,'p_object_properties','parser.py',306),
-  ('object_properties -> object_properties COMMA object_property','object_properties',3,'p_object_properties','parser.py',307),
-  ('object_properties -> empty','object_properties',1,'p_object_properties','parser.py',308),
-  ('object_property -> ID COLON expression','object_property',3,'p_object_property','parser.py',318),
-  ('arrow_function -> LPAREN parameter_list RPAREN ARROW expression','arrow_function',5,'p_arrow_function','parser.py',322),
-  ('switch_statement -> SWITCH LPAREN expression RPAREN LBRACE case_blocks default_block RBRACE','switch_statement',8,'p_switch_statement','parser.py',326),
-  ('case_blocks -> case_blocks case_block','case_blocks',2,'p_case_blocks','parser.py',330),
-  ('case_blocks -> case_block','case_blocks',1,'p_case_blocks','parser.py',331),
-  ('case_block -> CASE error COLON','case_block',3,'p_case_block_error','parser.py',339),
-  ('case_block -> CASE expression COLON statements','case_block',4,'p_case_block','parser.py',344),
-  ('default_block -> DEFAULT COLON statements','default_block',3,'p_default_block','parser.py',348),
-  ('default_block -> empty','default_block',1,'p_default_block','parser.py',349),
-  ('anonymous_function -> FUNCTION LPAREN parameter_list RPAREN block','anonymous_function',5,'p_anonymous_function','parser.py',356),
-  ('try_catch_statement -> TRY block CATCH LPAREN ID RPAREN block','try_catch_statement',7,'p_try_catch_statement','parser.py',360),
-  ('throw_statement -> THROW expression SEMICOLON','throw_statement',3,'p_throw_statement','parser.py',364),
-  ('if_statement -> IF error block','if_statement',3,'p_if_statement_error','parser.py',370),
-  ('declaration -> VAR error','declaration',2,'p_declaration_error_id','parser.py',375),
-  ('declaration -> LET error','declaration',2,'p_declaration_error_id','parser.py',376),
-  ('declaration -> CONST error','declaration',2,'p_declaration_error_id','parser.py',377),
-  ('switch_statement -> SWITCH error block','switch_statement',3,'p_switch_statement_error','parser.py',382),
-  ('for_statement -> FOR error block','for_statement',3,'p_for_statement_error','parser.py',387),
-  ('if_statement -> IF LPAREN error block','if_statement',4,'p_if_statement_error_paren','parser.py',394),
-  ('block -> LBRACE statements error','block',3,'p_block_missing_rbrace','parser.py',398),
-  ('function_declaration -> FUNCTION ID LPAREN error RPAREN block','function_declaration',6,'p_function_declaration_error_params','parser.py',402),
-  ('case_block -> CASE error COLON statements','case_block',4,'p_case_block_error_colon','parser.py',406),
-  ('switch_statement -> SWITCH LPAREN error RPAREN LBRACE case_blocks default_block RBRACE','switch_statement',8,'p_switch_statement_error_paren','parser.py',410),
+  ('program -> statements','program',1,'p_program','parser.py',52),
+  ('program -> empty','program',1,'p_program','parser.py',53),
+  ('statements -> statement','statements',1,'p_statements','parser.py',60),
+  ('statements -> statements statement','statements',2,'p_statements','parser.py',61),
+  ('statements -> empty','statements',1,'p_statements','parser.py',62),
+  ('statement -> expression','statement',1,'p_statement_missing_semicolon','parser.py',75),
+  ('statement -> declaration','statement',1,'p_statement_missing_semicolon','parser.py',76),
+  ('statement -> assignment','statement',1,'p_statement_missing_semicolon','parser.py',77),
+  ('statement -> method_call','statement',1,'p_statement_missing_semicolon','parser.py',78),
+  ('statement -> expression SEMICOLON','statement',2,'p_statement','parser.py',82),
+  ('statement -> declaration SEMICOLON','statement',2,'p_statement','parser.py',83),
+  ('statement -> assignment SEMICOLON','statement',2,'p_statement','parser.py',84),
+  ('statement -> method_call SEMICOLON','statement',2,'p_statement','parser.py',85),
+  ('statement -> function_declaration','statement',1,'p_statement','parser.py',86),
+  ('statement -> if_statement','statement',1,'p_statement','parser.py',87),
+  ('statement -> while_statement','statement',1,'p_statement','parser.py',88),
+  ('statement -> for_statement','statement',1,'p_statement','parser.py',89),
+  ('statement -> break_statement','statement',1,'p_statement','parser.py',90),
+  ('statement -> continue_statement','statement',1,'p_statement','parser.py',91),
+  ('statement -> switch_statement','statement',1,'p_statement','parser.py',92),
+  ('statement -> try_catch_statement','statement',1,'p_statement','parser.py',93),
+  ('statement -> throw_statement','statement',1,'p_statement','parser.py',94),
+  ('function_declaration -> FUNCTION ID LPAREN parameter_list RPAREN block','function_declaration',6,'p_function_declaration','parser.py',98),
+  ('parameter_list -> <empty>','parameter_list',0,'p_parameter_list','parser.py',106),
+  ('parameter_list -> ID','parameter_list',1,'p_parameter_list','parser.py',107),
+  ('parameter_list -> parameter_list COMMA ID','parameter_list',3,'p_parameter_list','parser.py',108),
+  ('statement -> RETURN expression SEMICOLON','statement',3,'p_statement_return','parser.py',118),
+  ('declaration -> VAR ID','declaration',2,'p_declaration','parser.py',122),
+  ('declaration -> LET ID','declaration',2,'p_declaration','parser.py',123),
+  ('declaration -> CONST ID','declaration',2,'p_declaration','parser.py',124),
+  ('declaration -> VAR ID ASSIGN expression','declaration',4,'p_declaration','parser.py',125),
+  ('declaration -> LET ID ASSIGN expression','declaration',4,'p_declaration','parser.py',126),
+  ('declaration -> CONST ID ASSIGN expression','declaration',4,'p_declaration','parser.py',127),
+  ('assignment -> ID ASSIGN expression','assignment',3,'p_assignment','parser.py',134),
+  ('expression -> expression QUESTION expression COLON expression','expression',5,'p_expression','parser.py',138),
+  ('expression -> term','expression',1,'p_expression','parser.py',139),
+  ('expression -> expression PLUS term','expression',3,'p_expression','parser.py',140),
+  ('expression -> expression MINUS term','expression',3,'p_expression','parser.py',141),
+  ('expression -> expression GT term','expression',3,'p_expression','parser.py',142),
+  ('expression -> expression LT term','expression',3,'p_expression','parser.py',143),
+  ('expression -> expression GE term','expression',3,'p_expression','parser.py',144),
+  ('expression -> expression LE term','expression',3,'p_expression','parser.py',145),
+  ('expression -> expression EQUALS term','expression',3,'p_expression','parser.py',146),
+  ('expression -> expression NOTEQUALS term','expression',3,'p_expression','parser.py',147),
+  ('expression -> expression AND term','expression',3,'p_expression','parser.py',148),
+  ('expression -> expression OR term','expression',3,'p_expression','parser.py',149),
+  ('expression -> array_literal','expression',1,'p_expression','parser.py',150),
+  ('expression -> array_access','expression',1,'p_expression','parser.py',151),
+  ('term -> factor','term',1,'p_term','parser.py',160),
+  ('term -> term TIMES factor','term',3,'p_term','parser.py',161),
+  ('term -> term DIVIDE factor','term',3,'p_term','parser.py',162),
+  ('factor -> NUMBER','factor',1,'p_factor','parser.py',169),
+  ('factor -> STRING','factor',1,'p_factor','parser.py',170),
+  ('factor -> ID','factor',1,'p_factor','parser.py',171),
+  ('factor -> LPAREN expression RPAREN','factor',3,'p_factor','parser.py',172),
+  ('factor -> method_call','factor',1,'p_factor','parser.py',173),
+  ('factor -> function_call','factor',1,'p_factor','parser.py',174),
+  ('factor -> array_access','factor',1,'p_factor','parser.py',175),
+  ('factor -> property_access','factor',1,'p_factor','parser.py',176),
+  ('factor -> NOT factor','factor',2,'p_factor','parser.py',177),
+  ('factor -> object_literal','factor',1,'p_factor','parser.py',178),
+  ('factor -> arrow_function','factor',1,'p_factor','parser.py',179),
+  ('factor -> anonymous_function','factor',1,'p_factor','parser.py',180),
+  ('factor -> TRUE','factor',1,'p_factor','parser.py',181),
+  ('factor -> FALSE','factor',1,'p_factor','parser.py',182),
+  ('function_call -> ID LPAREN arguments RPAREN','function_call',4,'p_function_call','parser.py',205),
+  ('method_call -> console_log','method_call',1,'p_method_call','parser.py',209),
+  ('method_call -> ID DOT ID LPAREN arguments RPAREN','method_call',6,'p_method_call','parser.py',210),
+  ('console_log -> CONSOLE DOT LOG LPAREN arguments RPAREN','console_log',6,'p_console_log','parser.py',219),
+  ('arguments -> <empty>','arguments',0,'p_arguments','parser.py',223),
+  ('arguments -> expression','arguments',1,'p_arguments','parser.py',224),
+  ('arguments -> arguments COMMA expression','arguments',3,'p_arguments','parser.py',225),
+  ('if_statement -> IF LPAREN condition RPAREN block','if_statement',5,'p_if_statement','parser.py',235),
+  ('if_statement -> IF LPAREN condition RPAREN block ELSE block','if_statement',7,'p_if_statement','parser.py',236),
+  ('condition -> expression','condition',1,'p_condition','parser.py',243),
+  ('condition -> expression GT expression','condition',3,'p_condition','parser.py',244),
+  ('condition -> expression LT expression','condition',3,'p_condition','parser.py',245),
+  ('condition -> expression GE expression','condition',3,'p_condition','parser.py',246),
+  ('condition -> expression LE expression','condition',3,'p_condition','parser.py',247),
+  ('condition -> expression EQUALS expression','condition',3,'p_condition','parser.py',248),
+  ('condition -> expression NOTEQUALS expression','condition',3,'p_condition','parser.py',249),
+  ('array_literal -> LBRACKET array_elements RBRACKET','array_literal',3,'p_array_literal','parser.py',256),
+  ('array_elements -> <empty>','array_elements',0,'p_array_elements','parser.py',260),
+  ('array_elements -> expression','array_elements',1,'p_array_elements','parser.py',261),
+  ('array_elements -> array_elements COMMA expression','array_elements',3,'p_array_elements','parser.py',262),
+  ('array_access -> ID LBRACKET expression RBRACKET','array_access',4,'p_array_access','parser.py',272),
+  ('while_statement -> WHILE LPAREN condition RPAREN block','while_statement',5,'p_while_statement','parser.py',276),
+  ('block -> LBRACE statements RBRACE','block',3,'p_block','parser.py',280),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',284),
+  ('property_access -> ID DOT ID','property_access',3,'p_property_access','parser.py',288),
+  ('break_statement -> BREAK SEMICOLON','break_statement',2,'p_break_statement','parser.py',293),
+  ('continue_statement -> CONTINUE SEMICOLON','continue_statement',2,'p_continue_statement','parser.py',297),
+  ('for_statement -> FOR LPAREN for_init SEMICOLON for_condition SEMICOLON for_update RPAREN block','for_statement',9,'p_for_statement','parser.py',301),
+  ('for_init -> declaration','for_init',1,'p_for_init','parser.py',305),
+  ('for_init -> assignment','for_init',1,'p_for_init','parser.py',306),
+  ('for_init -> empty','for_init',1,'p_for_init','parser.py',307),
+  ('for_condition -> expression','for_condition',1,'p_for_condition','parser.py',311),
+  ('for_condition -> empty','for_condition',1,'p_for_condition','parser.py',312),
+  ('for_update -> assignment','for_update',1,'p_for_update','parser.py',316),
+  ('for_update -> expression','for_update',1,'p_for_update','parser.py',317),
+  ('for_update -> empty','for_update',1,'p_for_update','parser.py',318),
+  ('object_literal -> LBRACE object_properties RBRACE','object_literal',3,'p_object_literal','parser.py',352),
+  ('object_properties -> object_property','object_properties',1,'p_object_properties','parser.py',356),
+  ('object_properties -> object_properties COMMA object_property','object_properties',3,'p_object_properties','parser.py',357),
+  ('object_properties -> empty','object_properties',1,'p_object_properties','parser.py',358),
+  ('object_property -> ID COLON expression','object_property',3,'p_object_property','parser.py',368),
+  ('arrow_function -> LPAREN parameter_list RPAREN ARROW expression','arrow_function',5,'p_arrow_function','parser.py',372),
+  ('switch_statement -> SWITCH LPAREN expression RPAREN LBRACE case_blocks default_block RBRACE','switch_statement',8,'p_switch_statement','parser.py',376),
+  ('case_blocks -> case_blocks case_block','case_blocks',2,'p_case_blocks','parser.py',380),
+  ('case_blocks -> case_block','case_blocks',1,'p_case_blocks','parser.py',381),
+  ('case_block -> CASE error COLON','case_block',3,'p_case_block_error','parser.py',389),
+  ('case_block -> CASE expression COLON statements','case_block',4,'p_case_block','parser.py',394),
+  ('default_block -> DEFAULT COLON statements','default_block',3,'p_default_block','parser.py',398),
+  ('default_block -> empty','default_block',1,'p_default_block','parser.py',399),
+  ('anonymous_function -> FUNCTION LPAREN parameter_list RPAREN block','anonymous_function',5,'p_anonymous_function','parser.py',406),
+  ('try_catch_statement -> TRY block CATCH LPAREN ID RPAREN block','try_catch_statement',7,'p_try_catch_statement','parser.py',410),
+  ('throw_statement -> THROW expression SEMICOLON','throw_statement',3,'p_throw_statement','parser.py',414),
+  ('if_statement -> IF error block','if_statement',3,'p_if_statement_error','parser.py',420),
+  ('declaration -> VAR error','declaration',2,'p_declaration_error_id','parser.py',425),
+  ('declaration -> LET error','declaration',2,'p_declaration_error_id','parser.py',426),
+  ('declaration -> CONST error','declaration',2,'p_declaration_error_id','parser.py',427),
+  ('switch_statement -> SWITCH error block','switch_statement',3,'p_switch_statement_error','parser.py',432),
+  ('for_statement -> FOR error block','for_statement',3,'p_for_statement_error','parser.py',437),
+  ('if_statement -> IF LPAREN error block','if_statement',4,'p_if_statement_error_paren','parser.py',444),
+  ('block -> LBRACE statements error','block',3,'p_block_missing_rbrace','parser.py',448),
+  ('function_declaration -> FUNCTION ID LPAREN error RPAREN block','function_declaration',6,'p_function_declaration_error_params','parser.py',452),
+  ('case_block -> CASE error COLON statements','case_block',4,'p_case_block_error_colon','parser.py',456),
+  ('switch_statement -> SWITCH LPAREN error RPAREN LBRACE case_blocks default_block RBRACE','switch_statement',8,'p_switch_statement_error_paren','parser.py',460),
 ]
+_source_hash = '03d72297'
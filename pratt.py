@@ -0,0 +1,369 @@
+import functools
+from lexer import Token, Scanner, TokenStream, iter_tokens, lexer as default_lexer
+from syntax_tree import Node, copy_position
+
+# Operadores binarios: los de expression y, más fuertes, los de term
+BINARY_PRECEDENCE = {
+    'PLUS': 1, 'MINUS': 1, 'GT': 1, 'LT': 1, 'GE': 1, 'LE': 1,
+    'EQUALS': 1, 'NOTEQUALS': 1, 'AND': 1, 'OR': 1,
+    'TIMES': 2, 'DIVIDE': 2,
+}
+COMPARISON_TOKENS = frozenset(('GT', 'LT', 'GE', 'LE', 'EQUALS', 'NOTEQUALS'))
+TERM_TOKENS = frozenset(('TIMES', 'DIVIDE'))
+DECLARATION_TOKENS = frozenset(('VAR', 'LET', 'CONST'))
+PROGRAM_END = frozenset(('$end',))
+BLOCK_END = frozenset(('RBRACE',))
+CASE_END = frozenset(('CASE', 'DEFAULT', 'RBRACE'))
+
+# Fin del código, como el $end de las tablas LALR
+END = Token('$end', None, None, None, None)
+
+# Parser descendente recursivo con precedence climbing para las expresiones.
+# Reconoce la gramática de las reglas p_* y arma los mismos nodos, con las
+# mismas posiciones, sin la pila de estados ni una llamada a una regla por
+# reducción. También reproduce lo que las tablas resuelven a su manera: el
+# Condition de if/while separa la primera comparación del resto, "(a)" sin
+# flecha es un error, un array al comienzo de una expresión no admite * ni /
+# a continuación y los paréntesis quedan como UnaryOp '('. Ante cualquier
+# error (léxico, de sintaxis o un programa demasiado anidado) vuelve a
+# analizar el código con el parser LALR: los mensajes y la recuperación de
+# errores son siempre los de PLY. fallbacks cuenta esos casos. Está fuera de
+# parser.py para que cambiarlo no invalide las tablas de PLY, que llevan el
+# hash de ese archivo.
+class PrattParser:
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self.fallbacks = 0
+        self.next_token = None
+        self.tok = END
+        self.ahead = None
+
+    def parse(self, data, lexer=None, **options):
+        try:
+            return self.parse_strict(data, lexer)
+        except (SyntaxError, RecursionError):
+            self.fallbacks += 1
+            return self.fallback.parse(data, lexer=lexer, **options)
+
+    def parse_strict(self, data, lexer=None):
+        # Sin recurrir a las tablas: SyntaxError si el programa no se reconoce
+        source = lexer if lexer is not None else default_lexer
+        if isinstance(source, Scanner):
+            source.input(data)
+            self.next_token = functools.partial(next, iter(source), None)
+        elif isinstance(source, TokenStream):
+            # token() guarda los tokens que se van pidiendo
+            source.input(data)
+            self.next_token = source.token
+        else:
+            # Los tokens del lexer de PLY no traen la columna
+            self.next_token = functools.partial(next, iter_tokens(data, source), None)
+        self.ahead = None
+        try:
+            self.tok = self.next_token() or END
+            return self.program()
+        finally:
+            self.next_token = None
+            self.tok = END
+            self.ahead = None
+
+    def advance(self):
+        tok = self.tok
+        if self.ahead is not None:
+            self.tok = self.ahead
+            self.ahead = None
+        else:
+            self.tok = self.next_token() or END
+        return tok
+
+    def peek(self):
+        if self.ahead is None:
+            self.ahead = self.next_token() or END
+        return self.ahead
+
+    def expect(self, type):
+        tok = self.tok
+        if tok.type != type:
+            raise SyntaxError(f"Se esperaba {type} y llegó {tok.type}")
+        self.advance()
+        return tok
+
+    def statement_list(self, end):
+        items = []
+        while self.tok.type not in end:
+            items.append(self.statement())
+        return items
+
+    def statements(self, end):
+        items = self.statement_list(end)
+        if not items:
+            return Node('Statements', [])
+        return copy_position(Node('Statements', items), items[0])
+
+    def program(self):
+        items = self.statement_list(PROGRAM_END)
+        if not items:
+            return Node('Program', [])
+        statements = copy_position(Node('Statements', items), items[0])
+        return copy_position(Node('Program', [statements]), statements)
+
+    def block(self):
+        self.expect('LBRACE')
+        body = self.statements(BLOCK_END)
+        self.expect('RBRACE')
+        return body
+
+    def statement(self):
+        tok = self.tok
+        kind = tok.type
+        if kind == 'ID' and self.peek().type == 'ASSIGN':
+            node = self.assignment()
+            self.expect('SEMICOLON')
+        elif kind in DECLARATION_TOKENS:
+            node = self.declaration()
+            self.expect('SEMICOLON')
+        elif kind == 'IF':
+            self.advance()
+            self.expect('LPAREN')
+            condition = self.expression(True)
+            self.expect('RPAREN')
+            children = [condition, self.block()]
+            if self.tok.type == 'ELSE':
+                self.advance()
+                children.append(self.block())
+            node = copy_position(Node('IfStatement', children), tok)
+        elif kind == 'WHILE':
+            self.advance()
+            self.expect('LPAREN')
+            condition = self.expression(True)
+            self.expect('RPAREN')
+            node = copy_position(Node('WhileStatement', [condition, self.block()]), tok)
+        elif kind == 'FOR':
+            node = self.for_statement()
+        elif kind == 'RETURN':
+            # Sin el Statement que envuelve a las demás sentencias
+            self.advance()
+            value = self.expression()
+            self.expect('SEMICOLON')
+            return copy_position(Node('Return', [value]), tok)
+        elif kind == 'FUNCTION' and self.peek().type == 'ID':
+            self.advance()
+            name = self.advance()
+            self.expect('LPAREN')
+            parameters = self.parameters()
+            self.expect('RPAREN')
+            node = copy_position(Node('FunctionDeclaration', [
+                copy_position(Node('Identifier', value=name.value), name), parameters, self.block()]), tok)
+        elif kind == 'BREAK' or kind == 'CONTINUE':
+            self.advance()
+            self.expect('SEMICOLON')
+            node = copy_position(Node('Break' if kind == 'BREAK' else 'Continue'), tok)
+        elif kind == 'SWITCH':
+            node = self.switch_statement()
+        elif kind == 'TRY':
+            self.advance()
+            body = self.block()
+            self.expect('CATCH')
+            self.expect('LPAREN')
+            name = self.expect('ID')
+            self.expect('RPAREN')
+            node = copy_position(Node('TryCatch', [body, name.value, self.block()]), tok)
+        elif kind == 'THROW':
+            self.advance()
+            value = self.expression()
+            self.expect('SEMICOLON')
+            node = copy_position(Node('Throw', [value]), tok)
+        else:
+            node = self.expression()
+            self.expect('SEMICOLON')
+        return copy_position(Node('Statement', [node]), node)
+
+    def declaration(self):
+        keyword = self.advance()
+        name = self.expect('ID')
+        children = [copy_position(Node('Identifier', value=name.value), name)]
+        if self.tok.type == 'ASSIGN':
+            self.advance()
+            children.append(self.expression())
+        return copy_position(Node('Declaration', children, value=keyword.value), keyword)
+
+    def assignment(self):
+        name = self.advance()
+        self.expect('ASSIGN')
+        target = copy_position(Node('Identifier', value=name.value), name)
+        return copy_position(Node('Assignment', [target, self.expression()]), name)
+
+    def for_statement(self):
+        tok = self.advance()
+        self.expect('LPAREN')
+        kind = self.tok.type
+        if kind in DECLARATION_TOKENS:
+            init = self.declaration()
+        elif kind == 'ID' and self.peek().type == 'ASSIGN':
+            init = self.assignment()
+        elif kind == 'SEMICOLON':
+            init = None
+        else:
+            raise SyntaxError(f"Inicialización del for inesperada: {kind}")
+        self.expect('SEMICOLON')
+        condition = None if self.tok.type == 'SEMICOLON' else self.expression()
+        self.expect('SEMICOLON')
+        kind = self.tok.type
+        if kind == 'RPAREN':
+            update = None
+        elif kind == 'ID' and self.peek().type == 'ASSIGN':
+            update = self.assignment()
+        else:
+            update = self.expression()
+        self.expect('RPAREN')
+        return copy_position(Node('ForStatement', [init, condition, update, self.block()]), tok)
+
+    def switch_statement(self):
+        tok = self.advance()
+        self.expect('LPAREN')
+        discriminant = self.expression()
+        self.expect('RPAREN')
+        self.expect('LBRACE')
+        cases = []
+        while self.tok.type == 'CASE':
+            self.advance()
+            value = self.expression()
+            self.expect('COLON')
+            cases.append((value, self.statements(CASE_END)))
+        if not cases:
+            raise SyntaxError("Switch sin casos")
+        default = None
+        if self.tok.type == 'DEFAULT':
+            self.advance()
+            self.expect('COLON')
+            default = self.statements(CASE_END)
+        self.expect('RBRACE')
+        return copy_position(Node('SwitchStatement', [discriminant, cases, default]), tok)
+
+    def parameters(self):
+        # Hasta el paréntesis que cierra, sin consumirlo
+        if self.tok.type != 'ID':
+            return Node('Parameters', [])
+        names = []
+        while True:
+            name = self.expect('ID')
+            names.append(copy_position(Node('Parameter', value=name.value), name))
+            if self.tok.type != 'COMMA':
+                return copy_position(Node('Parameters', names), names[0])
+            self.advance()
+
+    def arguments(self, kind, close):
+        # Lista entre paréntesis o corchetes: Arguments o ArrayElements
+        self.advance()
+        if self.tok.type == close:
+            self.advance()
+            return Node(kind, [])
+        items = [self.expression()]
+        while self.tok.type == 'COMMA':
+            self.advance()
+            items.append(self.expression())
+        self.expect(close)
+        return copy_position(Node(kind, items), items[0])
+
+    def expression(self, condition=False):
+        # En la condición de if/while la primera comparación no forma un
+        # BinaryOp: separa los dos lados de un Condition
+        tok = self.tok
+        if tok.type == 'LBRACKET':
+            left = copy_position(Node('ArrayLiteral', [self.arguments('ArrayElements', 'RBRACKET')]), tok)
+        else:
+            left = self.factor()
+        if (left.type == 'ArrayLiteral' or left.type == 'ArrayAccess') and self.tok.type in TERM_TOKENS:
+            # Las tablas reducen el array a expression, no a term
+            raise SyntaxError(f"{left.type} seguido de {self.tok.type}")
+        left = self.binary(left, 1, condition)
+        kind = self.tok.type
+        if kind == 'QUESTION':
+            self.advance()
+            consequent = self.expression()
+            self.expect('COLON')
+            return copy_position(Node('TernaryOp', [left, consequent, self.expression()]), left)
+        if condition and kind in COMPARISON_TOKENS:
+            op = self.advance()
+            return copy_position(Node('Condition', [left, self.expression()], value=op.value), left)
+        return left
+
+    def binary(self, left, min_precedence, condition):
+        while True:
+            op = self.tok
+            precedence = BINARY_PRECEDENCE.get(op.type, 0)
+            if precedence < min_precedence or (condition and op.type in COMPARISON_TOKENS):
+                return left
+            self.advance()
+            right = self.factor()
+            while BINARY_PRECEDENCE.get(self.tok.type, 0) > precedence:
+                right = self.binary(right, precedence + 1, False)
+            left = copy_position(Node('BinaryOp', [left, right], value=op.value), left)
+
+    def factor(self):
+        tok = self.advance()
+        kind = tok.type
+        if kind == 'ID':
+            following = self.tok.type
+            if following == 'LPAREN':
+                name = copy_position(Node('Identifier', value=tok.value), tok)
+                return copy_position(Node('FunctionCall', [name, self.arguments('Arguments', 'RPAREN')]), tok)
+            if following == 'DOT':
+                self.advance()
+                member = self.expect('ID')
+                target = copy_position(Node('Identifier', value=tok.value), tok)
+                member_node = copy_position(Node('Identifier', value=member.value), member)
+                if self.tok.type == 'LPAREN':
+                    return copy_position(Node('MethodCall', [target, member_node,
+                                                             self.arguments('Arguments', 'RPAREN')]), tok)
+                return copy_position(Node('PropertyAccess', [target, member_node]), tok)
+            if following == 'LBRACKET':
+                self.advance()
+                index = self.expression()
+                self.expect('RBRACKET')
+                target = copy_position(Node('Identifier', value=tok.value), tok)
+                return copy_position(Node('ArrayAccess', [target, index]), tok)
+            return copy_position(Node('Identifier', value=tok.value), tok)
+        if kind == 'NUMBER':
+            return copy_position(Node('Number', value=tok.value), tok)
+        if kind == 'STRING':
+            return copy_position(Node('String', value=tok.value), tok)
+        if kind == 'TRUE' or kind == 'FALSE':
+            return copy_position(Node('Boolean', value=kind == 'TRUE'), tok)
+        if kind == 'LPAREN':
+            following = self.tok.type
+            if following == 'RPAREN' or (following == 'ID' and self.peek().type in ('RPAREN', 'COMMA')):
+                # Con "(a" seguido de ")" o "," las tablas ya esperan una arrow function
+                parameters = self.parameters()
+                self.expect('RPAREN')
+                self.expect('ARROW')
+                return copy_position(Node('ArrowFunction', [parameters, self.expression()]), tok)
+            inner = self.expression()
+            self.expect('RPAREN')
+            return copy_position(Node('UnaryOp', [inner], value=tok.value), tok)
+        if kind == 'NOT':
+            return copy_position(Node('UnaryOp', [self.factor()], value=tok.value), tok)
+        if kind == 'CONSOLE':
+            self.expect('DOT')
+            self.expect('LOG')
+            if self.tok.type != 'LPAREN':
+                raise SyntaxError("Se esperaba LPAREN después de console.log")
+            return copy_position(Node('ConsoleLog', [self.arguments('Arguments', 'RPAREN')]), tok)
+        if kind == 'LBRACE':
+            properties = []
+            if self.tok.type == 'ID':
+                while True:
+                    key = self.expect('ID')
+                    self.expect('COLON')
+                    properties.append((key.value, self.expression()))
+                    if self.tok.type != 'COMMA':
+                        break
+                    self.advance()
+            self.expect('RBRACE')
+            return copy_position(Node('ObjectLiteral', [properties]), tok)
+        if kind == 'FUNCTION':
+            self.expect('LPAREN')
+            parameters = self.parameters()
+            self.expect('RPAREN')
+            return copy_position(Node('AnonymousFunction', [parameters, self.block()]), tok)
+        raise SyntaxError(f"Token inesperado: {kind}")
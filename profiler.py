@@ -0,0 +1,325 @@
+import argparse
+import sys
+import threading
+import time
+from interpreter import Interpreter, resolve_program
+from bytecode_vm import BytecodeInterpreter
+from python_codegen import FUNCTION_PREFIX
+
+# Raíz de todos los stacks: el código fuera de las funciones
+PROGRAM_NAME = '<programa>'
+
+# Segundos entre dos muestras del modo por muestreo
+SAMPLE_INTERVAL = 0.001
+
+def loop_bodies(node):
+    # Cuerpos que se ejecutan una vez por iteración de un ciclo
+    if node.type == 'WhileStatement':
+        return [node.children[1]]
+    if node.type == 'ForStatement':
+        return [node.children[3]]
+    if node.type == 'CountedLoop':
+        body = node.value[-1]
+        # El ciclo fusionado ejecuta directamente la única sentencia de su bloque
+        if body is not None and body.type == 'Statements' and len(body.children) == 1:
+            return [body.children[0]]
+        return [body]
+    return []
+
+def collect_loop_bodies(ast):
+    bodies = {}
+    pending = [ast]
+    while pending:
+        item = pending.pop()
+        if isinstance(item, (list, tuple)):
+            pending.extend(item)
+        elif hasattr(item, 'children'):
+            for body in loop_bodies(item):
+                if body is not None:
+                    bodies[body] = item.type
+            pending.extend(item.children)
+    return bodies
+
+def format_table(title, headers, rows):
+    widths = [max(len(str(row[i])) for row in [headers] + rows) for i in range(len(headers))]
+    lines = [title]
+    for row in [headers] + rows:
+        lines.append("  ".join(str(cell).ljust(width) if i == 0 else str(cell).rjust(width)
+                               for i, (cell, width) in enumerate(zip(row, widths))))
+    return "\n".join(lines)
+
+def write_collapsed(stacks, path):
+    # Formato de stacks colapsados: "a;b;c cantidad", uno por línea, el que
+    # leen flamegraph.pl, speedscope e inferno
+    with open(path, 'w', encoding='utf-8') as f:
+        for stack, count in sorted(stacks.items()):
+            if count > 0:
+                f.write(f"{';'.join(stack)} {count}\n")
+
+# Perfilador determinista sobre el intérprete de árbol. Mide cada llamada a
+# interpret y a call_function: por función de JavaScript y por tipo de nodo
+# guarda la cantidad, el tiempo inclusivo (una sola vez por recursión) y el
+# exclusivo (sin los hijos), y cuenta las iteraciones de los ciclos. El
+# tiempo exclusivo de cada stack de funciones sirve para un flame graph.
+class ProfilingInterpreter(Interpreter):
+
+    def __init__(self):
+        super().__init__()
+        self.function_stats = {}  # nombre -> [llamadas, inclusivo, exclusivo, iteraciones]
+        self.node_stats = {}      # tipo -> [ejecuciones, inclusivo, exclusivo, iteraciones]
+        self.stack_times = {}     # stack de funciones -> tiempo exclusivo
+        self.call_stack = [PROGRAM_NAME]
+        self.loop_bodies = {}
+        self.node_children = [0.0]  # Tiempo de los hijos de cada nodo abierto
+        self.call_children = [0.0]  # Tiempo de las funciones llamadas desde cada función abierta
+        self.active_types = {}
+        self.total = 0.0
+
+    def interpret_Program(self, node):
+        self.loop_bodies = collect_loop_bodies(node)
+        start = time.perf_counter()
+        try:
+            return super().interpret_Program(node)
+        finally:
+            self.total = time.perf_counter() - start
+            stack = (PROGRAM_NAME,)
+            self.stack_times[stack] = self.stack_times.get(stack, 0.0) + self.total - self.call_children[0]
+
+    def interpret(self, node):
+        if node is None:
+            return None
+        node_type = node.type
+        loop_type = self.loop_bodies.get(node)
+        if loop_type is not None:
+            self.count_iteration(loop_type)
+        active = self.active_types.get(node_type, 0)
+        self.active_types[node_type] = active + 1
+        children = self.node_children
+        children.append(0.0)
+        start = time.perf_counter()
+        try:
+            return super().interpret(node)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.active_types[node_type] = active
+            own = elapsed - children.pop()
+            children[-1] += elapsed
+            stats = self.node_stats.get(node_type)
+            if stats is None:
+                stats = self.node_stats[node_type] = [0, 0.0, 0.0, 0]
+            stats[0] += 1
+            if not active:
+                stats[1] += elapsed
+            stats[2] += own
+
+    def count_iteration(self, loop_type):
+        stats = self.node_stats.get(loop_type)
+        if stats is None:
+            stats = self.node_stats[loop_type] = [0, 0.0, 0.0, 0]
+        stats[3] += 1
+        self.stats_for(self.call_stack[-1])[3] += 1
+
+    def stats_for(self, name):
+        stats = self.function_stats.get(name)
+        if stats is None:
+            stats = self.function_stats[name] = [0, 0.0, 0.0, 0]
+        return stats
+
+    def call_function(self, func, args):
+        name = func.name
+        recursive = name in self.call_stack
+        self.call_stack.append(name)
+        children = self.call_children
+        children.append(0.0)
+        start = time.perf_counter()
+        try:
+            return super().call_function(func, args)
+        finally:
+            elapsed = time.perf_counter() - start
+            own = elapsed - children.pop()
+            children[-1] += elapsed
+            stats = self.stats_for(name)
+            stats[0] += 1
+            if not recursive:
+                stats[1] += elapsed
+            stats[2] += own
+            stack = tuple(self.call_stack)
+            self.stack_times[stack] = self.stack_times.get(stack, 0.0) + own
+            self.call_stack.pop()
+
+    def run_function(self, func, env):
+        # Sin pasar a la máquina virtual: cada llamada tiene que pasar por
+        # call_function para medirla
+        return self.interpret(func.body)
+
+    def report(self):
+        program = self.stats_for(PROGRAM_NAME)
+        program[0] = 1
+        program[1] = self.total
+        program[2] = self.stack_times.get((PROGRAM_NAME,), 0.0)
+        headers = ["Función", "Llamadas", "Inclusivo ms", "Exclusivo ms", "Iteraciones"]
+        rows = [[name, calls, f"{inclusive * 1000:.2f}", f"{exclusive * 1000:.2f}", iterations]
+                for name, (calls, inclusive, exclusive, iterations)
+                in sorted(self.function_stats.items(), key=lambda item: -item[1][2])]
+        functions = format_table("=== Funciones ===", headers, rows)
+        headers = ["Nodo", "Ejecuciones", "Inclusivo ms", "Exclusivo ms", "Iteraciones"]
+        rows = [[node_type, count, f"{inclusive * 1000:.2f}", f"{exclusive * 1000:.2f}", iterations]
+                for node_type, (count, inclusive, exclusive, iterations)
+                in sorted(self.node_stats.items(), key=lambda item: -item[1][2])]
+        nodes = format_table("=== Tipos de nodo ===", headers, rows)
+        return f"Tiempo total: {self.total * 1000:.2f} ms\n\n{functions}\n\n{nodes}"
+
+    def collapsed(self):
+        # Microsegundos exclusivos por stack
+        return {stack: round(seconds * 1_000_000) for stack, seconds in self.stack_times.items()}
+
+# Perfilador por muestreo: un hilo aparte toma cada SAMPLE_INTERVAL segundos
+# el stack de Python del hilo que ejecuta y lo traduce al stack de funciones
+# de JavaScript. El programa corre sin instrumentar, con cualquier backend:
+# el de árbol, el de closures y el por niveles pasan por call_function, la
+# VM guarda sus frames en execute y el backend python genera funciones fn_.
+class Sampler:
+    CALL_FUNCTION_CODE = Interpreter.call_function.__code__
+    EXECUTE_CODE = BytecodeInterpreter.execute.__code__
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        self.interval = interval
+        self.samples = {}
+        self.total = 0
+        self.running = False
+        self.thread = None
+        self.target = None
+        self.switch_interval = None
+
+    def __enter__(self):
+        self.target = threading.get_ident()
+        self.running = True
+        # El hilo de muestreo necesita el GIL al menos una vez por intervalo
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self.switch_interval, self.interval))
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.running = False
+        self.thread.join()
+        sys.setswitchinterval(self.switch_interval)
+        return False
+
+    def run(self):
+        while self.running:
+            time.sleep(self.interval)
+            frame = sys._current_frames().get(self.target)
+            if frame is None:
+                continue
+            stack = self.js_stack(frame)
+            self.samples[stack] = self.samples.get(stack, 0) + 1
+            self.total += 1
+
+    def js_stack(self, frame):
+        names = []
+        node_type = None
+        while frame is not None:
+            code = frame.f_code
+            if code is self.CALL_FUNCTION_CODE:
+                func = frame.f_locals.get('func')
+                if func is not None:
+                    names.append(func.name)
+            elif code is self.EXECUTE_CODE:
+                # El primer frame de la VM es el programa o la función que
+                # ya se anotó en su call_function
+                local_vars = frame.f_locals
+                vm_frames = local_vars.get('frames', []) + [local_vars.get('frame')]
+                names.extend(vm_frame.code.name for vm_frame in reversed(vm_frames[1:]) if vm_frame is not None)
+            elif code.co_name.startswith(FUNCTION_PREFIX):
+                names.append(code.co_name[len(FUNCTION_PREFIX):])
+            elif code.co_name.startswith('_anonymous'):
+                names.append('anónima')
+            elif code.co_name == '<lambda>' and code.co_filename == '<javascript>':
+                names.append('=>')
+            elif node_type is None and not names:
+                node_type = self.node_type(code)
+            frame = frame.f_back
+        names.append(PROGRAM_NAME)
+        names.reverse()
+        if node_type is not None:
+            names.append(f"[{node_type}]")
+        return tuple(names)
+
+    def node_type(self, code):
+        # Nodo que se estaba evaluando: interpret_X en el árbol, compile_X.<locals>.run
+        # en closures. Los ayudantes como compile_store no son tipos de nodo.
+        if code.co_name.startswith('interpret_'):
+            node_type = code.co_name[len('interpret_'):]
+        elif '.compile_' in code.co_qualname and '<locals>' in code.co_qualname:
+            node_type = code.co_qualname.split('.compile_')[1].split('.')[0]
+        else:
+            return None
+        if node_type == 'Program' or not node_type[:1].isupper():
+            return None
+        return node_type
+
+    def report(self):
+        inclusive = {}
+        exclusive = {}
+        for stack, count in self.samples.items():
+            functions = [name for name in stack if not name.startswith('[')]
+            for name in set(functions):
+                inclusive[name] = inclusive.get(name, 0) + count
+            exclusive[functions[-1]] = exclusive.get(functions[-1], 0) + count
+        total = self.total or 1
+        headers = ["Función", "Muestras", "Inclusivo %", "Exclusivo %"]
+        rows = [[name, inclusive[name], f"{inclusive[name] * 100 / total:.1f}",
+                 f"{exclusive.get(name, 0) * 100 / total:.1f}"]
+                for name in sorted(inclusive, key=lambda name: -exclusive.get(name, 0))]
+        return (f"Muestras: {self.total} (cada {self.interval * 1000:g} ms)\n\n"
+                + format_table("=== Funciones ===", headers, rows))
+
+    def collapsed(self):
+        return dict(self.samples)
+
+def profile(ast, mode='deterministic', backend='tree', interval=SAMPLE_INTERVAL):
+    # Ejecuta el programa y devuelve el perfilador con los resultados
+    if mode == 'deterministic':
+        profiler = ProfilingInterpreter()
+        profiler.interpret(ast)
+        return profiler
+    from backends import create_interpreter
+    interpreter = create_interpreter(backend)
+    with Sampler(interval) as sampler:
+        interpreter.interpret(ast)
+    return sampler
+
+def main():
+    from parser import parser
+    from backends import BACKENDS, DEFAULT_BACKEND
+    from optimizer import Optimizer
+    from fusion import Fuser
+
+    arg_parser = argparse.ArgumentParser(description="Perfila un programa de JavaScript")
+    arg_parser.add_argument('file', help="Archivo JavaScript a perfilar")
+    arg_parser.add_argument('--mode', choices=['deterministic', 'sampling'], default='deterministic',
+                            help="Medición de cada nodo o muestreo periódico del stack")
+    arg_parser.add_argument('--backend', choices=list(BACKENDS), default=DEFAULT_BACKEND,
+                            help="Backend a usar en el modo por muestreo")
+    arg_parser.add_argument('--interval', type=float, default=SAMPLE_INTERVAL * 1000,
+                            help="Milisegundos entre muestras")
+    arg_parser.add_argument('-o', '--output', help="Archivo de stacks colapsados para un flame graph")
+    arg_parser.add_argument('--no-optimize', action='store_true', help="Perfilar el AST sin optimizar")
+    args = arg_parser.parse_args()
+
+    with open(args.file, encoding='utf-8') as f:
+        ast = parser.parse(f.read())
+    if ast is None:
+        raise SystemExit("No se pudo generar el AST")
+    if not args.no_optimize:
+        resolve_program(ast)
+        ast = Fuser().fuse(Optimizer().optimize(ast))
+    profiler = profile(ast, args.mode, args.backend, args.interval / 1000)
+    print(profiler.report(), file=sys.stderr)
+    if args.output:
+        write_collapsed(profiler.collapsed(), args.output)
+
+if __name__ == "__main__":
+    main()
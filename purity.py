@@ -0,0 +1,96 @@
+from syntax_tree import Node
+
+# Nodos que leen o modifican estado fuera de los parámetros de la función,
+# o que crean closures que podrían hacerlo
+IMPURE_NODES = {'ConsoleLog', 'ArrayLiteral', 'ArrayAccess', 'ObjectLiteral', 'PropertyAccess',
+                'MethodCall', 'ArrowFunction', 'AnonymousFunction', 'FunctionDeclaration'}
+
+def walk(tree):
+    # Recorre todos los nodos con una pila explícita, incluidos los casos de
+    # un switch y las propiedades de un objeto
+    pending = [tree]
+    while pending:
+        item = pending.pop()
+        if isinstance(item, Node):
+            yield item
+            pending.extend(item.children)
+        elif isinstance(item, (list, tuple)):
+            pending.extend(item)
+
+# Análisis que marca como puras las funciones declaradas que solo leen sus
+# parámetros y variables locales, y que solo llaman a otras funciones puras
+# (incluida ella misma). El resultado de una función pura depende únicamente
+# de sus argumentos, así el intérprete puede guardarlo en su MemoCache. Corre
+# después del análisis semántico porque usa las direcciones: una variable de
+# profundidad 0 es local a la función. Las llamadas se resuelven por nombre,
+# por eso solo cuentan los nombres declarados una sola vez y nunca reasignados.
+class PurityAnalyzer:
+    def __init__(self):
+        self.pure = 0
+
+    def analyze(self, ast):
+        declarations = {}
+        bindings = {}
+        assigned = set()
+        for node in walk(ast):
+            if node.type == 'FunctionDeclaration':
+                declarations[node.children[0].value] = node
+                names = [node.children[0].value] + [param.value for param in node.children[1].children]
+            elif node.type == 'Declaration':
+                names = [node.children[0].value]
+            elif node.type == 'TryCatch':
+                names = [node.children[1]]
+            else:
+                if node.type == 'Assignment':
+                    assigned.add(node.children[0].value)
+                continue
+            for name in names:
+                bindings[name] = bindings.get(name, 0) + 1
+
+        candidates = {}
+        for name, node in declarations.items():
+            if bindings[name] != 1 or name in assigned:
+                continue
+            callees = self.local_calls(node.children[2])
+            if callees is not None:
+                candidates[name] = (node, callees)
+
+        # Punto fijo: se descartan las funciones que llaman a una que no es pura
+        changed = True
+        while changed:
+            changed = False
+            for name, (node, callees) in list(candidates.items()):
+                if not callees <= candidates.keys():
+                    del candidates[name]
+                    changed = True
+
+        for node, _ in candidates.values():
+            node.children[2].pure = True
+        self.pure += len(candidates)
+        return ast
+
+    def local_calls(self, body):
+        # Nombres de las funciones que llama el cuerpo, o None si tiene efectos
+        callees = set()
+        pending = [body]
+        while pending:
+            item = pending.pop()
+            if isinstance(item, (list, tuple)):
+                pending.extend(item)
+                continue
+            if not isinstance(item, Node):
+                continue
+            if item.type in IMPURE_NODES or not self.is_local(item):
+                return None
+            if item.type == 'FunctionCall':
+                # El nombre de la función no es una lectura de variable
+                callees.add(item.children[0].value)
+                pending.append(item.children[1])
+                continue
+            pending.extend(item.children)
+        return callees
+
+    def is_local(self, node):
+        if node.type not in ('Identifier', 'Declaration', 'Assignment'):
+            return True
+        return node.address is not None and node.address[0] == 0
@@ -0,0 +1,567 @@
+import argparse
+import itertools
+import re
+import weakref
+from interpreter import (Interpreter, JSArray, JSObject, InlineCache, ExecutionBudget, OutputSink, resolve_program, shape_for,
+                         get_element, load_property, load_method, call_method,
+                         INTEGER_OPERATORS, MIN_SAFE_INTEGER, MAX_SAFE_INTEGER, FUSED_NODES, normalize_result,
+                         format_output, switch_table, error_message, times)
+
+# Prefijos para que los nombres de JavaScript no choquen con los de Python
+VARIABLE_PREFIX = 'v_'
+FUNCTION_PREFIX = 'fn_'
+
+PYTHON_OPERATORS = {
+    '+': '+', '-': '-', '*': '*', '/': '/',
+    '>': '>', '<': '<', '>=': '>=', '<=': '<=',
+    '==': '==', '!=': '!=',
+    '&&': 'and', '||': 'or',
+}
+
+# +, - y * revisan el resultado en línea: un entero fuera del rango exacto
+# o un string largo pasan por _normalize_result, como en el intérprete
+INTEGER_CHECK = (f"(_number if (_number := {{}}).__class__ is int"
+                 f" and {MIN_SAFE_INTEGER} <= _number <= {MAX_SAFE_INTEGER} or _number.__class__ is float"
+                 f" else _normalize_result(_number))")
+
+# --- Funciones de soporte usadas por el código generado ---
+
+_array = JSArray
+_JSObject = JSObject
+_shape_for = shape_for
+_InlineCache = InlineCache
+_get_element = get_element
+_get_property = load_property
+_normalize_result = normalize_result
+_times = times
+
+def _call_method(obj, cache, args):
+    if type(obj) is JSObject:
+        func = load_method(obj, cache)
+        if not callable(func):
+            raise Exception(f"Método '{cache.name}' no soportado")
+        return func(*args)
+    return call_method(obj, cache.name, args)
+
+def _discard(*values):
+    return None
+
+def _log(*values):
+    # Un módulo ejecutado con --run no tiene intérprete ni destino activo
+    sink = OutputSink.active
+    if sink is None:
+        print(*values)
+    else:
+        sink.write(format_output(values))
+
+def _step():
+    # Solo lo llama el código generado con presupuesto de ejecución
+    ExecutionBudget.active.step()
+
+def _error_message(error):
+    # Traduce los NameError y RecursionError de Python a los mensajes del intérprete
+    if isinstance(error, NameError):
+        match = re.search(r"'([^']+)'", str(error))
+        if match:
+            name = match.group(1)
+            if name.startswith(VARIABLE_PREFIX):
+                name = re.sub(r'_\d+_\d+$', '', name[len(VARIABLE_PREFIX):])
+                return f"Variable '{name}' no definida"
+            if name.startswith(FUNCTION_PREFIX):
+                return f"Función '{name[len(FUNCTION_PREFIX):]}' no definida"
+    return error_message(error)
+
+RUNTIME_NAMES = ['_array', '_JSObject', '_shape_for', '_InlineCache', '_get_element', '_get_property', '_call_method',
+                 '_normalize_result', '_times', '_discard', '_log', '_step', '_error_message']
+
+HEADER = [
+    "# Módulo generado por python_codegen a partir de código JavaScript",
+    f"from python_codegen import {', '.join(RUNTIME_NAMES)}",
+    "",
+]
+
+FOOTER = [
+    "",
+    "if __name__ == '__main__':",
+    "    _program()",
+]
+
+# Nodos que se traducen como sentencias de Python
+STATEMENT_NODES = {
+    'Program', 'Statements', 'Statement', 'Declaration', 'Assignment',
+    'FunctionDeclaration', 'IfStatement', 'WhileStatement', 'ForStatement',
+    'Break', 'Continue', 'Return', 'SwitchStatement', 'TryCatch', 'Throw',
+}
+
+# Sentencias después de las cuales un caso de switch no sigue en el siguiente
+TERMINATOR_NODES = {'Break', 'Return', 'Continue', 'Throw'}
+
+def falls_through(case_stmts):
+    statements = case_stmts.children if case_stmts.type == 'Statements' else [case_stmts]
+    while statements and statements[-1].type == 'Statement':
+        statements = statements[-1].children
+    return not statements or statements[-1].type not in TERMINATOR_NODES
+
+# Switch abierto durante la generación. Su bloque es un while de una vuelta
+# para que break salga del switch; un continue marca flag, sale del while y
+# lo repite el ciclo que contiene al switch
+class SwitchBlock:
+    def __init__(self, flag):
+        self.flag = flag
+        self.continues = False
+
+# Traduce un árbol de Node a código fuente de Python. El programa completo
+# queda dentro de una función _program, así las variables de JavaScript son
+# variables locales de Python y los ciclos son ciclos nativos. Cada variable
+# toma el nombre de su frame y slot, para respetar el scope de bloque. Con
+# metered, cada iteración y cada llamada descuentan un paso del presupuesto.
+class PythonCodeGenerator:
+    def __init__(self, metered=False):
+        self.metered = metered
+        self.lines = []
+        self.indent = 0
+        self.level = 0  # Nivel de anidamiento de funciones (0 es _program)
+        self.loops = []  # Actualización de cada ciclo abierto, la repite continue, o su SwitchBlock
+        self.nonlocals = set()
+        self.pending = []  # Definiciones que deben emitirse antes de la sentencia actual
+        self.constants = []  # Valores a nivel de módulo, como las cachés en línea
+        self.counter = itertools.count()
+
+    def generate(self, node):
+        self.lines = list(HEADER)
+        self.line("def _program():")
+        self.indent += 1
+        self.block(node)
+        self.indent -= 1
+        self.lines.extend(FOOTER)
+        # Las formas y las cachés en línea se crean una vez, al cargar el módulo
+        if self.constants:
+            self.lines[len(HEADER):len(HEADER)] = self.constants + [""]
+        return "\n".join(self.lines) + "\n"
+
+    def constant(self, prefix, value):
+        name = self.unique_name(prefix)
+        self.constants.append(f"{name} = {value}")
+        return name
+
+    def line(self, text):
+        # Las funciones anónimas usadas en la expresión se definen antes
+        pending, self.pending = self.pending, []
+        for indent, pending_text in pending:
+            self.lines.append("    " * (self.indent + indent) + pending_text)
+        self.lines.append("    " * self.indent + text)
+
+    def unique_name(self, prefix):
+        return f"{prefix}{next(self.counter)}"
+
+    def block(self, node):
+        start = len(self.lines)
+        self.statement(node)
+        if len(self.lines) == start:
+            self.line("pass")
+
+    def variable(self, name, address, store=False):
+        if address is None:
+            return f"{VARIABLE_PREFIX}{name}"
+        depth, slot = address
+        python_name = f"{VARIABLE_PREFIX}{name}_{self.level - depth}_{slot}"
+        if store and depth > 0:
+            self.nonlocals.add(python_name)
+        return python_name
+
+    def function_definition(self, name, params, body):
+        # Genera la definición con un scope de ciclos y de variables propio
+        saved = self.loops, self.nonlocals
+        self.loops, self.nonlocals = [], set()
+        self.level += 1
+        self.line(f"def {name}({self.signature(params)}):")
+        self.indent += 1
+        if self.metered:
+            self.line("_step()")
+        start = len(self.lines)
+        self.block(body)
+        if self.nonlocals:
+            self.lines.insert(start, "    " * self.indent + f"nonlocal {', '.join(sorted(self.nonlocals))}")
+        self.indent -= 1
+        self.level -= 1
+        self.loops, self.nonlocals = saved
+
+    def signature(self, params):
+        names = []
+        for i, param in enumerate(params.children):
+            # Con parámetros repetidos, como en JavaScript, gana el último
+            if any(other.value == param.value for other in params.children[i + 1:]):
+                names.append(f"_ignored{i}=None")
+            else:
+                names.append(f"{self.variable(param.value, param.address)}=None")
+        names.append("*_extra")
+        return ", ".join(names)
+
+    # --- Sentencias ---
+
+    def statement(self, node):
+        if node is None:
+            return
+        if node.type in FUSED_NODES:
+            # Los nodos fusionados se generan a partir del original
+            node = node.children[0]
+        if node.type in STATEMENT_NODES:
+            getattr(self, f'statement_{node.type}')(node)
+        else:
+            self.line(self.expression(node))
+
+    def statement_Program(self, node):
+        for child in node.children:
+            self.statement(child)
+
+    statement_Statements = statement_Program
+    statement_Statement = statement_Program
+
+    def statement_Declaration(self, node):
+        if len(node.children) > 1:
+            value = self.expression(node.children[1])
+        else:
+            value = "None"
+        self.line(f"{self.variable(node.children[0].value, node.address, store=True)} = {value}")
+
+    def statement_Assignment(self, node):
+        value = self.expression(node.children[1])
+        self.line(f"{self.variable(node.children[0].value, node.address, store=True)} = {value}")
+
+    def statement_FunctionDeclaration(self, node):
+        func_name = node.children[0].value
+        python_name = f"{FUNCTION_PREFIX}{func_name}"
+        self.function_definition(python_name, node.children[1], node.children[2])
+        # La función también es un valor guardado en su variable
+        self.line(f"{self.variable(func_name, node.address, store=True)} = {python_name}")
+
+    def statement_IfStatement(self, node):
+        self.line(f"if {self.expression(node.children[0])}:")
+        self.indent += 1
+        self.block(node.children[1])
+        self.indent -= 1
+        if len(node.children) > 2:
+            self.line("else:")
+            self.indent += 1
+            self.block(node.children[2])
+            self.indent -= 1
+
+    def loop(self, condition, body, update=None):
+        if condition is not None:
+            self.line(f"while {self.expression(condition)}:")
+        else:
+            self.line("while True:")
+        self.indent += 1
+        if self.metered:
+            self.line("_step()")
+        self.loops.append(update)
+        self.block(body)
+        self.statement(update)
+        self.loops.pop()
+        self.indent -= 1
+
+    def statement_WhileStatement(self, node):
+        self.loop(node.children[0], node.children[1])
+
+    def statement_ForStatement(self, node):
+        self.statement(node.children[0])
+        self.loop(node.children[1], node.children[3], node.children[2])
+
+    def statement_Break(self, node):
+        if self.loops:
+            self.line("break")
+        else:
+            # Fuera de un ciclo termina la función, como en el intérprete de árbol
+            self.line("return None")
+
+    def statement_Continue(self, node):
+        if not self.loops:
+            self.line("return None")
+        elif isinstance(self.loops[-1], SwitchBlock):
+            switch = self.loops[-1]
+            switch.continues = True
+            self.line(f"{switch.flag} = True")
+            self.line("break")
+        else:
+            # El continue de un for ejecuta antes la actualización
+            self.statement(self.loops[-1])
+            self.line("continue")
+
+    def statement_Return(self, node):
+        self.line(f"return {self.expression(node.children[0])}")
+
+    def statement_SwitchStatement(self, node):
+        # start es el índice del caso que coincide. Los casos se agrupan en
+        # tramos: un caso sin break (o return, continue, throw) al final sigue
+        # en el siguiente, como en JavaScript. El tramo de start se busca con
+        # comparaciones en árbol y dentro del tramo cada caso se ejecuta si
+        # start es su índice o uno anterior
+        cases = node.children[1]
+        table = switch_table(cases)
+        subject = self.expression(node.children[0])
+        start = self.unique_name('_case')
+        if table is not None:
+            # Con etiquetas literales el caso se busca en un diccionario del módulo
+            table_name = self.constant('_switch_table', repr(table))
+            self.line(f"{start} = {table_name}.get({subject}, {len(cases)})")
+        else:
+            value = self.unique_name('_switch')
+            self.line(f"{value} = {subject}")
+            self.line(f"{start} = {len(cases)}")
+            keyword = "if"
+            for index, (case_expr, _) in enumerate(cases):
+                self.line(f"{keyword} {self.expression(case_expr)} == {value}:")
+                self.indent += 1
+                self.line(f"{start} = {index}")
+                self.indent -= 1
+                keyword = "elif"
+
+        switch = SwitchBlock(self.unique_name('_continue'))
+        flag_line = len(self.lines)
+        self.loops.append(switch)
+        self.line("while True:")
+        self.indent += 1
+        runs = []
+        for index, (_, case_stmts) in enumerate(cases):
+            if not runs or not falls_through(cases[index - 1][1]):
+                runs.append([])
+            runs[-1].append(index)
+        if cases:
+            # Sin caso que coincida start es len(cases) y se pasa al default
+            self.line(f"if {start} < {len(cases)}:")
+            self.indent += 1
+            self.switch_runs(start, cases, runs)
+            self.indent -= 1
+        self.statement(node.children[2])
+        self.line("break")
+        self.indent -= 1
+        self.loops.pop()
+        if switch.continues:
+            self.lines.insert(flag_line, "    " * self.indent + f"{switch.flag} = False")
+            self.line(f"if {switch.flag}:")
+            self.indent += 1
+            self.statement_Continue(node)
+            self.indent -= 1
+
+    def switch_runs(self, start, cases, runs):
+        if len(runs) > 1:
+            middle = len(runs) // 2
+            self.line(f"if {start} < {runs[middle][0]}:")
+            self.indent += 1
+            self.switch_runs(start, cases, runs[:middle])
+            self.indent -= 1
+            self.line("else:")
+            self.indent += 1
+            self.switch_runs(start, cases, runs[middle:])
+            self.indent -= 1
+            return
+        run = runs[0]
+        if len(run) == 1:
+            self.block(cases[run[0]][1])
+            return
+        for index in run:
+            self.line(f"if {start} <= {index}:")
+            self.indent += 1
+            self.block(cases[index][1])
+            self.indent -= 1
+
+    def statement_TryCatch(self, node):
+        error = self.unique_name('_error')
+        self.line("try:")
+        self.indent += 1
+        self.block(node.children[0])
+        self.indent -= 1
+        self.line(f"except Exception as {error}:")
+        self.indent += 1
+        self.line(f"{self.variable(node.children[1], node.address, store=True)} = _error_message({error})")
+        self.block(node.children[2])
+        self.indent -= 1
+
+    def statement_Throw(self, node):
+        self.line(f"raise Exception({self.expression(node.children[0])})")
+
+    # --- Expresiones ---
+
+    def expression(self, node):
+        if node is None:
+            return "None"
+        if node.type in FUSED_NODES:
+            node = node.children[0]
+        method = getattr(self, f'expression_{node.type}', self.generic_expression)
+        return method(node)
+
+    def generic_expression(self, node):
+        # Igual que generic_interpret: evalúa los hijos y devuelve None
+        children = [self.expression(child) for child in node.children if hasattr(child, 'type')]
+        if not children:
+            return "None"
+        return f"_discard({', '.join(children)})"
+
+    def expression_Number(self, node):
+        return repr(node.value)
+
+    expression_String = expression_Number
+    expression_Boolean = expression_Number
+
+    def expression_Identifier(self, node):
+        return self.variable(node.value, node.address)
+
+    def expression_Assignment(self, node):
+        target = self.variable(node.children[0].value, node.address, store=True)
+        return f"({target} := {self.expression(node.children[1])})"
+
+    def expression_BinaryOp(self, node):
+        left = self.expression(node.children[0])
+        right = self.expression(node.children[1])
+        if node.value == '*':
+            # "x" * n se revisa antes de construir el string; con dos números
+            # se multiplica en línea. | evalúa siempre los dos operandos
+            a, b = self.unique_name('_a'), self.unique_name('_b')
+            return INTEGER_CHECK.format(f"(_times({a}, {b}) if (({a} := {left}).__class__ is str)"
+                                        f" | (({b} := {right}).__class__ is str) else {a} * {b})")
+        if node.value in INTEGER_OPERATORS:
+            return INTEGER_CHECK.format(f"({left} {PYTHON_OPERATORS[node.value]} {right})")
+        return f"({left} {PYTHON_OPERATORS[node.value]} {right})"
+
+    expression_Condition = expression_BinaryOp
+
+    def expression_UnaryOp(self, node):
+        operand = self.expression(node.children[0])
+        if node.value == '!':
+            return f"(not {operand})"
+        return f"_discard({operand})"
+
+    def expression_TernaryOp(self, node):
+        condition, then_expr, else_expr = (self.expression(child) for child in node.children)
+        return f"({then_expr} if {condition} else {else_expr})"
+
+    def expression_ConsoleLog(self, node):
+        args = ", ".join(self.expression(arg) for arg in node.children[0].children)
+        return f"_log({args})"
+
+    def expression_FunctionCall(self, node):
+        callee = node.children[0]
+        args = ", ".join(self.expression(arg) for arg in node.children[1].children)
+        if callee.address is None:
+            # Función no resuelta en el scope léxico: se busca por nombre
+            return f"{FUNCTION_PREFIX}{callee.value}({args})"
+        return f"{self.variable(callee.value, callee.address)}({args})"
+
+    def expression_ArrayLiteral(self, node):
+        elements = ", ".join(self.expression(child) for child in node.children[0].children)
+        return f"_array([{elements}])"
+
+    def expression_ArrayAccess(self, node):
+        array_node = node.children[0]
+        index = self.expression(node.children[1])
+        array = self.variable(array_node.value, array_node.address)
+        return f"_get_element({array}, {array_node.value!r}, {index})"
+
+    def expression_PropertyAccess(self, node):
+        obj = self.expression(node.children[0])
+        cache = self.constant('_cache', f"_InlineCache({node.children[1].value!r})")
+        return f"_get_property({obj}, {cache})"
+
+    def expression_ObjectLiteral(self, node):
+        keys = tuple(key for key, _ in node.children[0])
+        shape = self.constant('_shape', f"_shape_for({keys!r})")
+        values = ", ".join(self.expression(value_node) for _, value_node in node.children[0])
+        if len(set(keys)) == len(keys):
+            return f"_JSObject({shape}, [{values}])"
+        return f"{shape}.build([{values}])"
+
+    def expression_MethodCall(self, node):
+        obj = self.expression(node.children[0])
+        cache = self.constant('_cache', f"_InlineCache({node.children[1].value!r})")
+        args = ", ".join(self.expression(arg) for arg in node.children[2].children)
+        return f"_call_method({obj}, {cache}, [{args}])"
+
+    def expression_ArrowFunction(self, node):
+        self.level += 1
+        body = self.expression(node.children[1])
+        if self.metered:
+            # _step() devuelve None, así el or deja el valor del cuerpo
+            body = f"_step() or {body}"
+        code = f"(lambda {self.signature(node.children[0])}: {body})"
+        self.level -= 1
+        return code
+
+    def expression_AnonymousFunction(self, node):
+        name = self.unique_name('_anonymous')
+        saved_lines, saved_indent, saved_pending = self.lines, self.indent, self.pending
+        self.lines, self.indent, self.pending = [], 0, []
+        self.function_definition(name, node.children[0], node.children[1])
+        definition = self.lines
+        self.lines, self.indent, self.pending = saved_lines, saved_indent, saved_pending
+        # Se conserva la indentación relativa de cada línea de la definición
+        for text in definition:
+            stripped = text.lstrip(' ')
+            self.pending.append(((len(text) - len(stripped)) // 4, stripped))
+        return name
+
+def generate_source(node, metered=False):
+    resolve_program(node)
+    return PythonCodeGenerator(metered).generate(node)
+
+def compile_source(source, filename='<javascript>'):
+    namespace = {'__name__': 'javascript_program'}
+    exec(compile(source, filename, 'exec'), namespace)
+    return namespace['_program']
+
+def run_program(program):
+    try:
+        program()
+    except (NameError, RecursionError) as e:
+        raise Exception(_error_message(e)) from None
+
+# Programas ya compilados, indexados por la raíz de su AST
+_program_cache = weakref.WeakKeyDictionary()
+_metered_program_cache = weakref.WeakKeyDictionary()
+
+def compile_program(node, metered=False):
+    cache = _metered_program_cache if metered else _program_cache
+    program = cache.get(node)
+    if program is None:
+        program = cache[node] = compile_source(generate_source(node, metered))
+    return program
+
+def write_module(node, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(generate_source(node))
+
+def load_module(path):
+    with open(path, encoding='utf-8') as f:
+        return compile_source(f.read(), path)
+
+# Backend que ejecuta el código de Python generado a partir del AST
+class PythonInterpreter(Interpreter):
+
+    def interpret_Program(self, node):
+        with self.metered():
+            run_program(compile_program(node, self.budget is not None))
+
+def main():
+    from parser import parser
+
+    arg_parser = argparse.ArgumentParser(description="Traduce JavaScript a un módulo de Python")
+    arg_parser.add_argument('file', help="Archivo JavaScript, o módulo generado con --run")
+    arg_parser.add_argument('-o', '--output', help="Ruta del módulo de Python a generar")
+    arg_parser.add_argument('--run', action='store_true',
+                            help="Ejecutar un módulo ya generado sin volver a analizar el código")
+    args = arg_parser.parse_args()
+
+    if args.run:
+        run_program(load_module(args.file))
+        return
+
+    with open(args.file, encoding='utf-8') as f:
+        ast = parser.parse(f.read())
+    if ast is None:
+        raise SystemExit("No se pudo generar el AST")
+    if args.output:
+        write_module(ast, args.output)
+    else:
+        print(generate_source(ast), end='')
+
+if __name__ == "__main__":
+    main()
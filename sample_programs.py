@@ -0,0 +1,150 @@
+from parser import parse
+from backends import BACKENDS
+from interpreter import CaptureSink
+from syntax_tree import Node
+
+# Programas de prueba compartidos por los test_*.py de los backends. Los ciclos y las funciones llamadas muchas veces pasan
+# los umbrales de tiered, así también se prueba el código que compila
+PROGRAMS = {
+    'aritmetica': '''
+let a = 7;
+let b = 2;
+console.log(a + b, a - b, a * b, a / b, 1 / 3, 0.1 + 0.2);
+console.log(9007199254740993, 9007199254740992 + 1, 2.5 * 4, 10 / 2);
+console.log(a > b, a < b, a >= 7, b <= 1, a == 7, a != 7, !a);
+console.log(1 + 2 * 3 - 4 / 2, a > 5 ? "grande" : "chico", b > 5 ? "grande" : "chico");
+console.log(0 && "x", 1 && "y", 0 || "z", "" || false);
+''',
+    'strings': '''
+let s = "";
+for (let i = 0; i < 300; i = i + 1) {
+    s = s + "ab";
+}
+console.log(s, "uno" + "dos");
+let doble = "x";
+let k = 0;
+while (k < 10) { doble = doble + doble; k = k + 1; }
+console.log(doble, s == doble, doble == doble);
+''',
+    'arrays_objetos': '''
+let lista = [1, 2, 3];
+lista.push(4);
+lista.push(2.5);
+console.log(lista, lista.length, lista.pop(), lista[0] + lista[3]);
+let mezcla = [1, "dos", true];
+console.log(mezcla, mezcla.length);
+let punto = {x: 1, y: 2};
+let otro = {y: 5, x: 6};
+let total = 0;
+for (let i = 0; i < 100; i = i + 1) {
+    let p = {x: i, y: i * 2};
+    total = total + p.x + p.y + punto.x + otro.y;
+}
+console.log(total, punto, otro.x);
+let calc = {cuadrado: (n) => n * n, suma: function (a, b) { return a + b; }};
+console.log(calc.cuadrado(4), calc.suma(2, 3));
+''',
+    'funciones': '''
+function fib(n) {
+    if (n < 2) { return n; }
+    return fib(n - 1) + fib(n - 2);
+}
+console.log(fib(15));
+function fact(n) { if (n < 2) { return 1; } return n * fact(n - 1); }
+console.log(fact(20), fact(25));
+let base = 100;
+function sumaBase(x) { return x + base; }
+let suma = 0;
+for (let i = 0; i < 50; i = i + 1) { suma = suma + sumaBase(i); }
+base = 1;
+console.log(suma, sumaBase(1));
+let doble = (v) => v * 2;
+let incremento = function (v) { return v + 1; };
+console.log(doble(21), incremento(41));
+function sinRetorno() { let z = 3; }
+console.log(sinRetorno());
+''',
+    'control': '''
+let s = 0;
+for (let i = 0; i < 200; i = i + 1) {
+    if (i == 3) { continue; }
+    if (i == 150) { break; }
+    s = s + i;
+}
+console.log(s);
+let n = 0;
+let pasos = 0;
+while (n < 1000) { n = n + 7; pasos = pasos + 1; }
+console.log(n, pasos);
+function nombre(x) {
+    switch (x) {
+        case 1: return "uno";
+        case 2: return "dos";
+        default: return "otro";
+    }
+}
+console.log(nombre(1), nombre(2), nombre(9));
+for (let j = 0; j < 4; j = j + 1) {
+    switch (j) {
+        case 0: console.log("cero");
+        case 1: console.log("cero o uno"); break;
+        default: console.log("más", j);
+    }
+}
+''',
+    'excepciones': '''
+function division(a, b) {
+    if (b == 0) { throw "división por cero"; }
+    return a / b;
+}
+try { console.log(division(1, 2)); division(1, 0); } catch (e) { console.log("error:", e); }
+let atrapados = 0;
+for (let i = 0; i < 100; i = i + 1) {
+    try {
+        if (i > 90) { throw i; }
+    } catch (e) {
+        atrapados = atrapados + 1;
+        console.log("atrapado", e);
+    }
+}
+console.log(atrapados);
+function profundo(n) { if (n == 0) { throw "fondo"; } return profundo(n - 1) + 1; }
+try { profundo(50); } catch (e) { console.log("atrapado", e); }
+let lista = [1];
+try { console.log(lista[5]); } catch (e) { console.log("error:", e); }
+''',
+    'error_sin_atrapar': '''
+console.log("antes");
+let o = {a: 1};
+o.b();
+console.log("después");
+''',
+}
+
+def run_program(backend, code, transform=None):
+    # Salida de console.log y error del programa. Cada ejecución usa un AST
+    # nuevo: los backends guardan en los nodos sus evaluadores y cachés.
+    # transform recibe el AST analizado y devuelve el que se ejecuta
+    ast = parse(code)
+    if not isinstance(ast, Node):
+        raise AssertionError(f"El programa no se pudo analizar: {ast}")
+    if transform is not None:
+        ast = transform(ast)
+    interpreter = BACKENDS[backend]()
+    interpreter.output = CaptureSink()
+    try:
+        interpreter.interpret(ast)
+        error = None
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    return interpreter.output.getvalue(), error
+
+def check_programs(test, backend, transform=None):
+    # Cada programa tiene que dar la misma salida y el mismo error en backend
+    # que en el intérprete de árbol sin transformar
+    for program, code in PROGRAMS.items():
+        with test.subTest(program=program, backend=backend):
+            expected = run_program('tree', code)
+            if program != 'error_sin_atrapar':
+                test.assertIsNone(expected[1])
+            test.assertEqual(run_program(backend, code, transform), expected)
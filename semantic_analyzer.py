@@ -18,120 +18,187 @@ class SemanticAnalyzer:
         self.scopes = [{}]  # Lista de diccionarios para manejar scopes
         self.current_scope = 0
         self.errors = []
+        # Cada función (y el programa) tiene un frame con slots de tamaño fijo.
+        # frames guarda cuántos slots usa cada frame abierto y scope_frames
+        # a qué frame pertenece cada scope de la pila.
+        self.frames = [0]
+        self.scope_frames = [0]
 
     def enter_scope(self):
         self.scopes.append({})
+        self.scope_frames.append(len(self.frames) - 1)
         self.current_scope += 1
 
     def exit_scope(self):
         if self.current_scope > 0:
             self.scopes.pop()
+            self.scope_frames.pop()
             self.current_scope -= 1
 
+    def enter_function(self):
+        self.frames.append(0)
+        self.enter_scope()
+
+    def exit_function(self):
+        self.exit_scope()
+        return self.frames.pop()
+
+    def allocate_slot(self, scope_index, name):
+        frame = self.scope_frames[scope_index]
+        slot = self.frames[frame]
+        self.frames[frame] += 1
+        self.scopes[scope_index][name] = (frame, slot)
+
     def declare_variable(self, name, node):
         if name in self.scopes[self.current_scope]:
             self.errors.append(f"Error semántico: La variable '{name}' ya fue declarada en este scope.")
             return False
-        self.scopes[self.current_scope][name] = node
+        self.allocate_slot(self.current_scope, name)
         return True
 
+    def resolve(self, name):
+        # Dirección (profundidad, slot) de la variable, relativa al frame actual
+        for index in range(self.current_scope, -1, -1):
+            if name in self.scopes[index]:
+                frame, slot = self.scopes[index][name]
+                return (len(self.frames) - 1 - frame, slot)
+        return None
+
     def check_variable(self, name):
-        for scope in reversed(self.scopes):
-            if name in scope:
-                return True
+        if self.resolve(name) is not None:
+            return True
         self.errors.append(f"Error semántico: La variable '{name}' no está declarada.")
         return False
 
+    def declare_parameters(self, params):
+        for param in params.children:
+            self.declare_variable(param.value, param)
+            param.address = self.resolve(param.value)
+
     def analyze(self, ast):
-        if ast is None:
-            return
-        
+        # Recorrido con una pila explícita en lugar de recursión, para que los
+        # programas muy anidados no agoten la pila de Python. La pila guarda
+        # nodos por analizar y acciones (entrar o salir de un scope, declarar)
+        # que deben ejecutarse entre ellos.
+        pending = [ast]
+        while pending:
+            item = pending.pop()
+            if callable(item):
+                item()
+            elif item is not None:
+                work = self.visit(item)
+                if work:
+                    pending.extend(reversed(work))
+
+    def visit(self, ast):
+        # Analiza un nodo y devuelve, en orden, lo que queda por hacer con sus hijos
         if ast.type == 'Program':
-            for child in ast.children:
-                self.analyze(child)
-            return
+            def finish():
+                ast.frame_size = self.frames[0]
+            return ast.children + [finish]
         
         elif ast.type == 'Statements':
-            for child in ast.children:
-                self.analyze(child)
-            return
+            return ast.children
         
         elif ast.type == 'Declaration':
             if len(ast.children) > 0:
-                var_name = ast.children[0].value
-                self.declare_variable(var_name, ast)
-            return
+                def declare():
+                    var_name = ast.children[0].value
+                    self.declare_variable(var_name, ast)
+                    ast.address = ast.children[0].address = self.resolve(var_name)
+                return ast.children[1:2] + [declare]
+            return None
         
         elif ast.type == 'Assignment':
             if len(ast.children) > 0:
-                var_name = ast.children[0].value
-                if not self.check_variable(var_name):
-                    self.errors.append(f"Error semántico: No se puede asignar a '{var_name}' porque no está declarada.")
-            return
+                def assign():
+                    var_name = ast.children[0].value
+                    if not self.check_variable(var_name):
+                        self.errors.append(f"Error semántico: No se puede asignar a '{var_name}' porque no está declarada.")
+                        # Igual que en JavaScript, la asignación crea la variable en el scope de la función
+                        base_scope = self.scope_frames.index(len(self.frames) - 1)
+                        self.allocate_slot(base_scope, var_name)
+                    ast.address = ast.children[0].address = self.resolve(var_name)
+                return [ast.children[1], assign]
+            return None
         
         elif ast.type == 'Identifier':
             if hasattr(ast, 'value') and ast.value is not None:
                 if not self.check_variable(ast.value):
                     self.errors.append(f"Error semántico: La variable '{ast.value}' no está declarada.")
-            return
+                ast.address = self.resolve(ast.value)
+            return None
         
         elif ast.type == 'FunctionDeclaration':
             # Registrar el nombre de la función en el scope actual
             func_name = ast.children[0].value
             self.declare_variable(func_name, ast)
-            self.enter_scope()
-            if len(ast.children) > 2:
-                for param in ast.children[1].children:
-                    self.declare_variable(param.value, param)
-                self.analyze(ast.children[2])
-            self.exit_scope()
-            return
+            ast.address = ast.children[0].address = self.resolve(func_name)
+            return self.function_work(ast, ast.children[1], ast.children[2] if len(ast.children) > 2 else None)
+        
+        elif ast.type in ['ArrowFunction', 'AnonymousFunction']:
+            return self.function_work(ast, ast.children[0], ast.children[1])
         
         elif ast.type == 'IfStatement':
             if len(ast.children) > 1:
-                self.analyze(ast.children[0])
-                self.enter_scope()
-                self.analyze(ast.children[1])
-                self.exit_scope()
+                work = [ast.children[0], self.enter_scope, ast.children[1], self.exit_scope]
                 if len(ast.children) > 2:
-                    self.enter_scope()
-                    self.analyze(ast.children[2])
-                    self.exit_scope()
-            return
+                    work += [self.enter_scope, ast.children[2], self.exit_scope]
+                return work
+            return None
         
         elif ast.type == 'WhileStatement':
             if len(ast.children) > 1:
-                self.analyze(ast.children[0])
-                self.enter_scope()
-                self.analyze(ast.children[1])
-                self.exit_scope()
-            return
+                return [ast.children[0], self.enter_scope, ast.children[1], self.exit_scope]
+            return None
         
         elif ast.type == 'ForStatement':
             if len(ast.children) > 3:
-                self.enter_scope()
-                self.analyze(ast.children[0])
-                self.analyze(ast.children[1])
-                self.analyze(ast.children[2])
-                self.analyze(ast.children[3])
-                self.exit_scope()
-            return
+                return [self.enter_scope] + ast.children[:4] + [self.exit_scope]
+            return None
         
         elif ast.type == 'SwitchStatement':
             if len(ast.children) > 1:
-                self.analyze(ast.children[0])
+                work = [ast.children[0], self.enter_scope]
+                for case_expr, case_stmts in ast.children[1]:
+                    work += [case_expr, case_stmts]
+                return work + [ast.children[2], self.exit_scope]
+            return None
+        
+        elif ast.type == 'TryCatch':
+            # La variable del catch solo existe dentro de su bloque
+            def declare_error():
                 self.enter_scope()
-                for case in ast.children[1].children:
-                    self.analyze(case)
-                self.exit_scope()
-            return
+                self.declare_variable(ast.children[1], ast)
+                ast.address = self.resolve(ast.children[1])
+            return [self.enter_scope, ast.children[0], self.exit_scope,
+                    declare_error, ast.children[2], self.exit_scope]
+        
+        elif ast.type == 'PropertyAccess':
+            # El nombre de la propiedad no es una variable
+            return [ast.children[0]]
+        
+        elif ast.type == 'MethodCall':
+            return [ast.children[0], ast.children[2]]
+        
+        elif ast.type == 'ObjectLiteral':
+            return [value_node for key, value_node in ast.children[0]]
         
         elif ast.type in ['String', 'Number', 'Boolean']:
-            return
+            return None
         
-        # Analizar hijos recursivamente
-        for child in ast.children:
-            self.analyze(child)
+        # Analizar los hijos
+        return ast.children
+
+    def function_work(self, ast, params, body):
+        def enter():
+            self.enter_function()
+            if body is not None:
+                self.declare_parameters(params)
+
+        def leave():
+            ast.frame_size = self.exit_function()
+        return [enter, body, leave]
 
     def get_errors(self):
         return self.errors 
\ No newline at end of file
@@ -0,0 +1,46 @@
+# Nodos del AST que arman los dos parsers y recorren las pasadas y los backends.
+# Sin __dict__ por instancia: un programa grande tiene millones de nodos.
+# __weakref__ porque los backends compilados guardan su código por nodo en
+# diccionarios débiles.
+class Node:
+    __slots__ = ('type', 'children', 'value', 'address', 'operator', 'cache', 'pure', 'lineno', 'column',
+                 'frame_size', '__weakref__')
+
+    def __init__(self, type, children=None, value=None):
+        self.type = type
+        self.children = children if children else []
+        self.value = value
+        self.address = None  # (profundidad, slot) asignado por el SemanticAnalyzer
+        self.operator = None  # Evaluador de BinaryOp y Condition, lo resuelve el intérprete
+        self.cache = None  # Caché en línea de PropertyAccess y MethodCall, forma de ObjectLiteral,
+                           # tabla de saltos de SwitchStatement
+        self.pure = False  # Cuerpo de una función sin efectos, lo marca el PurityAnalyzer
+        self.lineno = None  # Línea y columna (desde 1) del primer token del nodo
+        self.column = None
+        self.frame_size = None  # Tamaño del frame de Program y de las funciones, del SemanticAnalyzer
+
+    def __str__(self, level=0):
+        # Recorrido con pila explícita: un árbol muy profundo no agota la pila de Python.
+        # Los casos de un switch y las propiedades de un objeto son tuplas; el
+        # nombre de la variable de un catch es un string.
+        lines = []
+        pending = [(self, level)]
+        while pending:
+            item, depth = pending.pop()
+            if isinstance(item, Node):
+                line = "  " * depth + f"Type: {item.type}"
+                if item.value is not None:
+                    line += f", Value: {item.value}"
+                lines.append(line)
+                pending.extend((child, depth + 1) for child in reversed(item.children))
+            elif isinstance(item, (list, tuple)):
+                pending.extend((child, depth) for child in reversed(item))
+            elif item is not None:
+                lines.append("  " * depth + f"Value: {item}")
+        return "\n".join(lines) + "\n"
+
+def copy_position(node, source):
+    # El nodo que reemplaza a otro en una pasada conserva su posición
+    node.lineno = source.lineno
+    node.column = source.column
+    return node
@@ -0,0 +1,55 @@
+import unittest
+from backends import BACKENDS
+from interpreter import ExecutionBudget, ExecutionLimitExceeded, CaptureSink
+from optimizer import Optimizer
+from parser import parse
+from test_optimizer import node_types
+
+def run_with_budget(backend, code, optimize=False, **limits):
+    ast = parse(code)
+    if optimize:
+        ast = Optimizer().optimize(ast)
+    interpreter = BACKENDS[backend]()
+    interpreter.output = CaptureSink()
+    interpreter.budget = ExecutionBudget(**limits)
+    interpreter.interpret(ast)
+    return interpreter
+
+# Los límites de ejecución valen en todos los backends y un catch del programa
+# no los detiene. Los strings se descuentan del presupuesto antes de armarlos
+class ExecutionBudgetTest(unittest.TestCase):
+    def assert_limit(self, code, **limits):
+        for backend in BACKENDS:
+            for optimize in (False, True):
+                with self.subTest(backend=backend, optimize=optimize):
+                    with self.assertRaises(ExecutionLimitExceeded):
+                        run_with_budget(backend, code, optimize, **limits)
+
+    def test_step_limit(self):
+        self.assert_limit('let i = 0;\ntry { while (true) { i = i + 1; } } catch (e) { console.log(e); }',
+                          max_steps=10000)
+        # Antes de agotar la pila de Python de los backends que la usan
+        self.assert_limit('function f(n) { return f(n + 1); }\ntry { f(0); } catch (e) { console.log(e); }',
+                          max_steps=100)
+
+    def test_string_repeat_is_charged_before_it_is_built(self):
+        # El optimizador no arma el string al plegar constantes
+        types = node_types(Optimizer().optimize(parse('let s = "x" * 400000000;')))
+        self.assertIn(('BinaryOp', '*'), types)
+        self.assert_limit('let s = "x" * 400000000;\nconsole.log(1);', max_allocations=10 ** 6)
+        self.assert_limit('let i = 0;\nwhile (i < 100) { let s = "ab" * 100000; i = i + 1; }',
+                          max_allocations=10 ** 6)
+
+    def test_rope_is_charged(self):
+        self.assert_limit('let s = "x";\nwhile (true) { s = s + s; }', max_allocations=10 ** 6)
+
+    def test_string_length_cap(self):
+        code = ('let n = 1000000000;\ntry { let s = "xy" * n; } catch (e) { console.log(e); }\n'
+                'console.log("ab" * 3, 3 * "c", 6 * 7);')
+        for backend in BACKENDS:
+            with self.subTest(backend=backend):
+                interpreter = run_with_budget(backend, code)
+                self.assertEqual(interpreter.output.getvalue(), "Longitud de string inválida\nababab ccc 42\n")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from sample_programs import run_program, check_programs
+from bytecode_vm import MAX_CALL_DEPTH
+from interpreter import STACK_OVERFLOW_MESSAGE
+
+# La máquina virtual tiene que dar la misma salida y los mismos errores que el
+# intérprete de árbol, también en un catch, y lleva su propia pila de llamadas
+class BytecodeVMTest(unittest.TestCase):
+    def test_programs(self):
+        check_programs(self, 'bytecode')
+
+    def test_caught_runtime_error(self):
+        code = '''
+try { let o = {a: 1}; o.b(); } catch (e) { console.log("error:", e); }
+try { let lista = [1]; console.log(lista[5]); } catch (e) { console.log("error:", e); }
+function falla(o) { return o.c(); }
+try { falla({a: 1}); } catch (e) { console.log("error:", e); }
+let anidado = [];
+for (let i = 0; i < 5000; i = i + 1) { anidado = [anidado]; }
+try { console.log(anidado); } catch (e) { console.log("error:", e); }
+'''
+        self.assertEqual(run_program('bytecode', code), run_program('tree', code))
+
+    def test_tail_calls_reuse_the_frame(self):
+        code = f'''
+function cuenta(n, total) {{
+    if (n == 0) {{ return total; }}
+    return cuenta(n - 1, total + 1);
+}}
+console.log(cuenta({MAX_CALL_DEPTH * 2}, 0));
+'''
+        self.assertEqual(run_program('bytecode', code), (f"{MAX_CALL_DEPTH * 2}\n", None))
+
+    def test_stack_overflow(self):
+        code = '''
+function infinita(n) { return infinita(n + 1) + 1; }
+try { infinita(0); } catch (e) { console.log(e); }
+'''
+        self.assertEqual(run_program('bytecode', code), (STACK_OVERFLOW_MESSAGE + "\n", None))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,19 @@
+import unittest
+from sample_programs import PROGRAMS, run_program, check_programs
+
+# El backend de closures tiene que dar la misma salida y los mismos errores que
+# el intérprete de árbol
+class ClosureCompilerTest(unittest.TestCase):
+    def test_programs(self):
+        check_programs(self, 'closure')
+
+    def test_uncaught_error(self):
+        # La salida anterior al error se conserva
+        for backend in ('tree', 'closure'):
+            with self.subTest(backend=backend):
+                output, error = run_program(backend, PROGRAMS['error_sin_atrapar'])
+                self.assertEqual(output, "antes\n")
+                self.assertEqual(error, "Exception: Método 'b' no soportado")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+from sample_programs import check_programs
+from backends import BACKENDS
+from optimizer import Optimizer
+from fusion import Fuser
+from parser import parse
+from test_optimizer import node_types
+
+def optimize_and_fuse(ast):
+    return Fuser().fuse(Optimizer().optimize(ast))
+
+# Con los patrones fusionados, como los ejecuta main.py, todos los backends
+# tienen que dar lo mismo que el AST original en el intérprete de árbol
+class FusionTest(unittest.TestCase):
+    def test_programs(self):
+        for backend in BACKENDS:
+            check_programs(self, backend, optimize_and_fuse)
+
+    def test_loop_patterns(self):
+        code = '''
+let datos = [1, 2, 3];
+let total = 0;
+for (let i = 0; i < 3; i = i + 1) {
+    total = total + datos[i];
+}
+let n = 0;
+while (n < 10) { n = n + 1; }
+console.log(total, n);
+'''
+        types = [node_type for node_type, _ in node_types(optimize_and_fuse(parse(code)))]
+        for fused in ('CountedLoop', 'AccumulateElement', 'LocalCompare', 'LocalUpdate'):
+            self.assertIn(fused, types)
+
+if __name__ == "__main__":
+    unittest.main()
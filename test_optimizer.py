@@ -0,0 +1,44 @@
+import unittest
+from sample_programs import check_programs
+from backends import BACKENDS
+from optimizer import Optimizer, count_nodes
+from parser import parse
+
+def optimize(ast):
+    return Optimizer().optimize(ast)
+
+def node_types(ast):
+    types = []
+    pending = [ast]
+    while pending:
+        node = pending.pop()
+        if node is not None and hasattr(node, 'children'):
+            types.append((node.type, node.value))
+            pending.extend(child for child in node.children if hasattr(child, 'type'))
+    return types
+
+# El AST optimizado tiene que dar en todos los backends lo mismo que el
+# original en el intérprete de árbol
+class OptimizerTest(unittest.TestCase):
+    def test_programs(self):
+        for backend in BACKENDS:
+            check_programs(self, backend, optimize)
+
+    def test_constant_folding(self):
+        ast = optimize(parse('let x = 1 + 2 * 3;\nconsole.log(x, "a" + "b");'))
+        types = node_types(ast)
+        self.assertIn(('Number', 7), types)
+        self.assertIn(('String', 'ab'), types)
+        self.assertNotIn('BinaryOp', [node_type for node_type, _ in types])
+
+    def test_dead_branches(self):
+        code = 'let x = 1;\nif (false) { console.log("nunca"); x = 2; } else { x = 3; }\nconsole.log(x);'
+        ast = parse(code)
+        before = count_nodes(ast)
+        types = node_types(optimize(ast))
+        self.assertLess(count_nodes(ast), before)
+        self.assertNotIn('IfStatement', [node_type for node_type, _ in types])
+        self.assertNotIn(('String', 'nunca'), types)
+
+if __name__ == "__main__":
+    unittest.main()
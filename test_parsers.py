@@ -0,0 +1,250 @@
+import random
+import unittest
+from lexer import ply_lexer
+from parser import lalr_parser, pratt_parser
+from syntax_tree import Node
+
+# Programas al azar por prueba: cada uno también se prueba mutado
+SAMPLES = 500
+
+# Programa con todas las construcciones de la gramática
+FEATURES_PROGRAM = '''
+var total = 0;
+let datos = [1, 2.5, "tres", true, false];
+const punto = {x: 1, y: 2};
+function suma(a, b) {
+    return a + b * 2 - a / b;
+}
+let doble = (n) => n * 2;
+let anonima = function (n) { return !n; };
+for (let i = 0; i < 10; i = i + 1) {
+    if (i >= 5 && i != 7 || i == 2) {
+        continue;
+    } else {
+        total = total + datos[i];
+    }
+}
+while (total > 100) { total = total - 1; break; }
+switch (total) {
+    case 1: console.log("uno");
+    case 2: console.log("dos"); break;
+    default: console.log(punto.x, datos.length);
+}
+try { throw "error"; } catch (e) { console.log(e ? suma(1, 2) : doble(3)); }
+// comentario al final
+'''
+
+def ast_signature(ast):
+    # Recorrido plano del árbol con tipo, valor y posición de cada nodo
+    signature = []
+    pending = [(ast, 0)]
+    while pending:
+        item, depth = pending.pop()
+        if isinstance(item, Node):
+            signature.append((depth, item.type, repr(item.value), item.lineno, item.column))
+            pending.extend((child, depth + 1) for child in reversed(item.children))
+        elif isinstance(item, (list, tuple)):
+            signature.append((depth, type(item).__name__, len(item)))
+            pending.extend((child, depth + 1) for child in reversed(item))
+        else:
+            signature.append((depth, repr(item)))
+    return signature
+
+# Generador de programas al azar a partir de la gramática, con espacios,
+# saltos de línea y comentarios al azar para que cambien las posiciones
+class ProgramGenerator:
+    NAMES = ['a', 'b', 'c', 'arr', 'obj', 'f', 'x']
+    BINARY = ['+', '-', '*', '/', '>', '<', '>=', '<=', '==', '!=', '&&', '||']
+    COMPARISONS = ['>', '<', '>=', '<=', '==', '!=']
+
+    def __init__(self, rng):
+        self.rng = rng
+
+    def space(self):
+        return self.rng.choice([' ', ' ', ' ', '\n', '\n    ', ' // nota\n', '  '])
+
+    def join(self, *parts):
+        return self.space().join(parts)
+
+    def name(self):
+        return self.rng.choice(self.NAMES)
+
+    def listing(self, item, depth, most=3):
+        items = [item(depth) for _ in range(self.rng.randint(0, most))]
+        return (self.space() + ',' + self.space()).join(items)
+
+    def factor(self, depth):
+        rng = self.rng
+        choice = rng.randrange(16 if depth > 0 else 5)
+        if choice == 0:
+            return str(rng.choice([0, 1, 42, 2.5, 9007199254740993]))
+        if choice == 1:
+            return rng.choice(['"hola"', '"x"', '""'])
+        if choice == 2:
+            return self.name()
+        if choice == 3:
+            return rng.choice(['true', 'false'])
+        if choice == 4:
+            return self.join(self.name(), '.', self.name())
+        depth -= 1
+        if choice == 5:
+            return self.join('(', self.expression(depth), ')')
+        if choice == 6:
+            return self.join(self.name(), '(', self.listing(self.expression, depth), ')')
+        if choice == 7:
+            return self.join(self.name(), '.', self.name(), '(', self.listing(self.expression, depth), ')')
+        if choice == 8:
+            return self.join('console', '.', 'log', '(', self.listing(self.expression, depth), ')')
+        if choice == 9:
+            return self.join(self.name(), '[', self.expression(depth), ']')
+        if choice == 10:
+            return self.join('!', self.factor(depth))
+        if choice == 11:
+            return self.join('{', self.listing(lambda d: self.join(self.name(), ':', self.expression(d)), depth), '}')
+        if choice == 12:
+            return self.join('(', self.listing(lambda d: self.name(), depth), ')', '=>', self.expression(depth))
+        if choice == 13:
+            return self.join('function', '(', self.listing(lambda d: self.name(), depth), ')', self.block(depth))
+        if choice == 14 and rng.random() < 0.2:
+            # Un array no es un factor: las tablas lo rechazan
+            return self.join('[', self.listing(self.expression, depth), ']')
+        return self.join(self.factor(depth), rng.choice(self.BINARY), self.factor(depth))
+
+    def expression(self, depth):
+        rng = self.rng
+        parts = [self.factor(depth)]
+        for _ in range(rng.choice([0, 0, 1, 2, 3])):
+            parts += [rng.choice(self.BINARY), self.factor(depth)]
+        if depth > 0 and rng.random() < 0.15:
+            parts += ['?', self.expression(depth - 1), ':', self.expression(depth - 1)]
+        return self.join(*parts)
+
+    def condition(self, depth):
+        if self.rng.random() < 0.5:
+            return self.join(self.expression(depth), self.rng.choice(self.COMPARISONS), self.expression(depth))
+        return self.expression(depth)
+
+    def block(self, depth):
+        return self.join('{', self.statements(depth - 1, self.rng.randint(0, 3)), '}')
+
+    def declaration(self, depth):
+        keyword = self.rng.choice(['var', 'let', 'const'])
+        if self.rng.random() < 0.3:
+            return self.join(keyword, self.name())
+        return self.join(keyword, self.name(), '=', self.expression(depth))
+
+    def assignment(self, depth):
+        return self.join(self.name(), '=', self.expression(depth))
+
+    def statement(self, depth):
+        rng = self.rng
+        choice = rng.randrange(14 if depth > 0 else 4)
+        if choice >= 12 and rng.random() < 0.75:
+            # Los arrays al comienzo de una sentencia seguidos de * o / tampoco
+            # se aceptan: de vez en cuando
+            choice = 2
+        if choice == 0:
+            return self.join(self.declaration(depth), ';')
+        if choice == 1:
+            return self.join(self.assignment(depth), ';')
+        if choice == 2:
+            return self.join(self.expression(depth), ';')
+        if choice == 3:
+            return self.join(rng.choice(['break', 'continue']), ';')
+        if choice == 4:
+            return self.join('return', self.expression(depth), ';')
+        if choice == 5:
+            return self.join('throw', self.expression(depth), ';')
+        if choice == 6:
+            parts = ['if', '(', self.condition(depth), ')', self.block(depth)]
+            if rng.random() < 0.5:
+                parts += ['else', self.block(depth)]
+            return self.join(*parts)
+        if choice == 7:
+            return self.join('while', '(', self.condition(depth), ')', self.block(depth))
+        if choice == 8:
+            init = rng.choice([self.declaration, self.assignment, lambda d: ''])(depth)
+            condition = rng.choice([self.expression, lambda d: ''])(depth)
+            update = rng.choice([self.assignment, self.expression, lambda d: ''])(depth)
+            return self.join('for', '(', init, ';', condition, ';', update, ')', self.block(depth))
+        if choice == 9:
+            return self.join('function', self.name(), '(', self.listing(lambda d: self.name(), depth), ')',
+                             self.block(depth))
+        if choice == 10:
+            cases = [self.join('case', self.expression(depth), ':', self.statements(depth - 1, rng.randint(0, 2)))
+                     for _ in range(rng.randint(1, 3))]
+            if rng.random() < 0.5:
+                cases.append(self.join('default', ':', self.statements(depth - 1, rng.randint(0, 2))))
+            return self.join('switch', '(', self.expression(depth), ')', '{', *cases, '}')
+        if choice == 11:
+            return self.join('try', self.block(depth), 'catch', '(', self.name(), ')', self.block(depth))
+        if choice == 12:
+            return self.join(self.name(), '[', self.expression(depth), ']', rng.choice(['*', '+']),
+                             self.factor(depth), ';')
+        return self.join('[', self.listing(self.expression, depth), ']', rng.choice(self.BINARY),
+                         self.factor(depth), ';')
+
+    def statements(self, depth, count):
+        return self.join(*(self.statement(depth) for _ in range(count)))
+
+    def program(self):
+        return self.statements(3, self.rng.randint(0, 6))
+
+    def mutate(self, code):
+        # Borra, duplica o cambia un trozo: sobre todo programas con errores
+        rng = self.rng
+        if not code:
+            return rng.choice(['{', ';', '('])
+        start = rng.randrange(len(code))
+        end = min(len(code), start + rng.randint(1, 4))
+        choice = rng.randrange(3)
+        if choice == 0:
+            return code[:start] + code[end:]
+        if choice == 1:
+            return code[:end] + code[start:]
+        return code[:start] + rng.choice(['(', ')', '{', '}', ';', ',', '=>', ' x ', '[', '@']) + code[end:]
+
+# El parser descendente tiene que dar el mismo AST, con las mismas posiciones,
+# que las tablas LALR en todo programa que acepta. Los que rechaza los analiza
+# parse() con las mismas tablas, así que no hace falta compararlos (y la
+# recuperación de errores de PLY no termina con algunos programas al azar).
+class ParserEquivalenceTest(unittest.TestCase):
+    def assert_same_ast(self, code, lexer=None):
+        try:
+            ast = pratt_parser.parse_strict(code, lexer)
+        except (SyntaxError, RecursionError):
+            return False
+        expected = lalr_parser.parse(code, lexer=lexer)
+        self.assertEqual(ast_signature(ast), ast_signature(expected), code)
+        return True
+
+    def test_features_program(self):
+        self.assertTrue(self.assert_same_ast(FEATURES_PROGRAM))
+
+    def test_ply_lexer_positions(self):
+        # Los tokens de PLY no traen la columna: cada parser la calcula a su manera
+        self.assertTrue(self.assert_same_ast(FEATURES_PROGRAM, ply_lexer()))
+
+    def test_generated_programs(self):
+        generator = ProgramGenerator(random.Random(0))
+        accepted = sum(self.assert_same_ast(generator.program()) for _ in range(SAMPLES))
+        # Cerca de la mitad de los programas generados no son válidos
+        self.assertGreater(accepted, SAMPLES // 4)
+
+    def test_mutated_programs(self):
+        generator = ProgramGenerator(random.Random(1))
+        for _ in range(SAMPLES):
+            self.assert_same_ast(generator.mutate(generator.program()))
+
+    def test_errors_fall_back_to_lalr(self):
+        for code in ('let x = ;', 'if (a { }', 'let a = 1 +;'):
+            with self.assertRaises(SyntaxError) as expected:
+                lalr_parser.parse(code)
+            fallbacks = pratt_parser.fallbacks
+            with self.assertRaises(SyntaxError) as error:
+                pratt_parser.parse(code)
+            self.assertEqual(str(error.exception), str(expected.exception))
+            self.assertEqual(pratt_parser.fallbacks, fallbacks + 1)
+
+if __name__ == "__main__":
+    unittest.main()
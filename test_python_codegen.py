@@ -0,0 +1,30 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from sample_programs import PROGRAMS, run_program, check_programs
+from parser import parse
+from python_codegen import write_module, load_module, run_program as run_module
+
+# El código de Python generado tiene que dar la misma salida y los mismos
+# errores que el intérprete de árbol, también como módulo escrito en disco
+class PythonCodegenTest(unittest.TestCase):
+    def test_programs(self):
+        check_programs(self, 'python')
+
+    def test_written_module(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for program, code in PROGRAMS.items():
+                if program == 'error_sin_atrapar':
+                    continue
+                with self.subTest(program=program):
+                    path = os.path.join(directory, f"{program}.py")
+                    write_module(parse(code), path)
+                    output = io.StringIO()
+                    with contextlib.redirect_stdout(output):
+                        run_module(load_module(path))
+                    self.assertEqual(output.getvalue(), run_program('tree', code)[0])
+
+if __name__ == "__main__":
+    unittest.main()
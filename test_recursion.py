@@ -0,0 +1,56 @@
+import unittest
+from sample_programs import run_program
+from backends import DEFAULT_BACKEND, create_interpreter
+from interpreter import (TREE_CALL_DEPTH, STACK_OVERFLOW_MESSAGE, CaptureSink, ExecutionBudget,
+                         ExecutionLimitExceeded)
+from parser import parse
+
+DEPTH = 5000
+
+# Recursión mucho más profunda que el límite de Python. Las llamadas de más
+# adentro escriben en la misma salida y lanzan un error que se atrapa afuera
+DEEP_PROGRAM = f'''
+function profundidad(n) {{
+    if (n == 0) {{ return 0; }}
+    return profundidad(n - 1) + 1;
+}}
+console.log(profundidad({DEPTH}));
+function cuenta(n) {{
+    if (n == 0) {{ throw "fondo"; }}
+    if (n == {DEPTH // 2}) {{ console.log("mitad", n); }}
+    return cuenta(n - 1);
+}}
+try {{ cuenta({DEPTH}); }} catch (e) {{ console.log("atrapado", e); }}
+function infinita(n) {{ return infinita(n + 1) + 1; }}
+try {{ infinita(0); }} catch (e) {{ console.log(e); }}
+console.log(profundidad(10));
+'''
+
+# El intérprete de árbol, el backend por defecto, sigue las llamadas más
+# profundas en la máquina virtual y llega tan hondo como ella
+class DeepRecursionTest(unittest.TestCase):
+    def test_default_backend(self):
+        self.assertEqual(DEFAULT_BACKEND, 'tree')
+        output, error = run_program(DEFAULT_BACKEND, DEEP_PROGRAM)
+        self.assertIsNone(error)
+        self.assertEqual(output, f"{DEPTH}\nmitad {DEPTH // 2}\natrapado fondo\n{STACK_OVERFLOW_MESSAGE}\n10\n")
+        self.assertEqual(run_program('bytecode', DEEP_PROGRAM), (output, error))
+
+    def test_shallow_calls_stay_on_the_tree(self):
+        interpreter = create_interpreter('tree')
+        interpreter.output = CaptureSink()
+        interpreter.interpret(parse(f'function f(n) {{ if (n == 0) {{ return 0; }} return f(n - 1); }}\n'
+                                    f'console.log(f({TREE_CALL_DEPTH - 1}));'))
+        self.assertIsNone(interpreter.deep_calls)
+        self.assertEqual(interpreter.call_depth, 0)
+
+    def test_budget_counts_deep_calls(self):
+        interpreter = create_interpreter('tree')
+        interpreter.output = CaptureSink()
+        interpreter.budget = ExecutionBudget(max_steps=DEPTH)
+        with self.assertRaises(ExecutionLimitExceeded):
+            interpreter.interpret(parse(f'function f(n) {{ if (n == 0) {{ return 0; }} return f(n - 1) + 1; }}\n'
+                                        f'console.log(f({DEPTH * 2}));'))
+
+if __name__ == "__main__":
+    unittest.main()
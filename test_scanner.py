@@ -0,0 +1,47 @@
+import random
+import unittest
+from lexer import Scanner, ply_lexer, tokenize
+from parser import lalr_parser
+from sample_programs import PROGRAMS
+
+# Trozos para los códigos al azar: caracteres ilegales, strings y números a
+# medias, comentarios y saltos de línea en cualquier lugar
+ALPHABET = list('abcxyzÁé_019. \t\n"\\/=!<>&|+-*(){}[];,:?#$\r') + [
+    'if', 'let', 'true', '//', '==', '=>', '1.5', '.5', '"a b"']
+
+def token_list(code, lexer):
+    # Tipo, valor, tipo del valor y posición de cada token, o el error léxico
+    try:
+        return [(token.type, token.value, type(token.value).__name__, token.lineno, token.column, token.lexpos)
+                for token in tokenize(code, lexer)]
+    except SyntaxError as e:
+        return ('error', str(e))
+
+# El Scanner tiene que producir los mismos tokens, con las mismas posiciones,
+# y los mismos errores que el lexer de PLY.
+class LexerEquivalenceTest(unittest.TestCase):
+    def test_programs(self):
+        for program, code in PROGRAMS.items():
+            with self.subTest(program=program):
+                self.assertEqual(token_list(code, Scanner()), token_list(code, ply_lexer()))
+
+    def test_random_code(self):
+        rng = random.Random(0)
+        scanner = Scanner()
+        ply = ply_lexer()
+        for _ in range(5000):
+            code = ''.join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 40)))
+            self.assertEqual(token_list(code, scanner), token_list(code, ply), code)
+
+    def test_syntax_error_position(self):
+        # Los dos lexers empiezan cada código en la línea 1, aunque el parser
+        # los use sin pasar por tokenize()
+        for lexer in (Scanner(), ply_lexer()):
+            for code, line in (('let a = 1;\n\nlet x = ;', 3), ('let x = ;', 1), ('let a = 1 +;', 1)):
+                with self.subTest(lexer=type(lexer).__name__, code=code):
+                    with self.assertRaises(SyntaxError) as error:
+                        lalr_parser.parse(code, lexer=lexer)
+                    self.assertIn(f"en la línea {line}:", str(error.exception))
+
+if __name__ == "__main__":
+    unittest.main()
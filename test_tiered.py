@@ -0,0 +1,40 @@
+import unittest
+from sample_programs import PROGRAMS, check_programs
+from interpreter import CaptureSink
+from tiered import TieredInterpreter, CALL_THRESHOLD, LOOP_THRESHOLD
+from parser import parse
+
+def run_tiered(code):
+    interpreter = TieredInterpreter()
+    interpreter.output = CaptureSink()
+    interpreter.interpret(parse(code))
+    return interpreter
+
+# El backend por niveles tiene que dar lo mismo que el intérprete de árbol,
+# antes y después de compilar el código caliente
+class TieredTest(unittest.TestCase):
+    def test_programs(self):
+        check_programs(self, 'tiered')
+
+    def test_cold_code_is_not_compiled(self):
+        code = ("function suma(a, b) { return a + b; }\nlet total = 0;\n"
+                + "total = suma(total, 1);\n" * (CALL_THRESHOLD - 1)
+                + f"for (let i = 0; i < {LOOP_THRESHOLD - 1}; i = i + 1) {{ total = total + i; }}\n")
+        self.assertEqual(run_tiered(code).promoted, 0)
+
+    def test_hot_code_is_compiled(self):
+        interpreter = run_tiered(PROGRAMS['funciones'])
+        self.assertGreater(interpreter.promoted, 0)
+        code = f'''
+let total = 0;
+let i = 0;
+while (i < {LOOP_THRESHOLD * 3}) {{ total = total + i; i = i + 1; }}
+console.log(total);
+'''
+        interpreter = run_tiered(code)
+        self.assertEqual(interpreter.promoted, 1)
+        n = LOOP_THRESHOLD * 3
+        self.assertEqual(interpreter.output.getvalue(), f"{n * (n - 1) // 2}\n")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+from lexer import TokenStream, Scanner, ply_lexer, iter_tokens, tokenize
+from parser import lalr_parser
+from sample_programs import PROGRAMS
+from test_parsers import ast_signature
+
+# El parser pide los tokens de a uno. TokenStream solo los guarda con keep=True,
+# y entonces son los mismos que da tokenize()
+class TokenStreamTest(unittest.TestCase):
+    def test_keep(self):
+        for lexer in (Scanner(), ply_lexer()):
+            for program, code in PROGRAMS.items():
+                with self.subTest(lexer=type(lexer).__name__, program=program):
+                    expected = [(token.type, token.value, token.lineno, token.column)
+                                for token in tokenize(code, lexer)]
+                    stream = TokenStream(lexer, keep=True)
+                    ast = lalr_parser.parse(code, lexer=stream)
+                    self.assertEqual([(token.type, token.value, token.lineno, token.column)
+                                      for token in stream.tokens], expected)
+                    self.assertEqual(ast_signature(ast), ast_signature(lalr_parser.parse(code, lexer=lexer)))
+                    stream = TokenStream(lexer)
+                    lalr_parser.parse(code, lexer=stream)
+                    self.assertEqual(stream.tokens, [])
+
+    def test_lexical_error(self):
+        stream = TokenStream(keep=True)
+        with self.assertRaises(SyntaxError):
+            lalr_parser.parse('let a = 1;\nlet b = #;', lexer=stream)
+        self.assertIsNotNone(stream.error)
+        self.assertEqual([token.value for token in stream.tokens], ['let', 'a', '=', 1, ';', 'let', 'b', '='])
+
+    def test_tokens_are_generated_on_demand(self):
+        tokens = iter_tokens('let a = 1;' * 100000)
+        self.assertEqual(next(tokens).type, 'LET')
+
+if __name__ == "__main__":
+    unittest.main()
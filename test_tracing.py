@@ -0,0 +1,47 @@
+import contextlib
+import io
+import unittest
+from parser import parse
+from interpreter import Interpreter
+from tracing import LineTracer, executable_lines, trace
+
+CODE = '''function fib(n) {
+    if (n < 2) { return n; }
+    return fib(n - 1) + fib(n - 2);
+}
+let a = 1; let b = 2;
+for (let i = 0; i < 3; i = i + 1) { a = a + i; }
+if (a > 100) {
+    console.log("nunca");
+}
+console.log(fib(10), a, b);
+'''
+
+def run_traced(code):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return trace(parse(code), code)
+
+# Cada línea se cuenta una vez por ejecución, aunque tenga varias sentencias o
+# un bloque en la misma línea
+class LineTracerTest(unittest.TestCase):
+    def test_line_hits(self):
+        tracer = run_traced(CODE)
+        # fib(10) hace 177 llamadas y 88 llegan a la línea 3. El cuerpo del for
+        # está en la línea del for: no se cuenta aparte
+        self.assertEqual(tracer.hits, {1: 1, 2: 177, 3: 88, 5: 1, 6: 1, 7: 1, 10: 1})
+
+    def test_coverage(self):
+        tracer = run_traced(CODE)
+        executable = executable_lines(parse(CODE))
+        self.assertEqual(tracer.missing(executable), [8])
+        self.assertTrue(tracer.report(executable).startswith("Cobertura: 7/8 líneas"))
+
+    def test_disabled_tracer_restores_evaluators(self):
+        tracer = LineTracer(CODE)
+        interpreter = Interpreter()
+        interpreter.set_tracer(tracer)
+        interpreter.set_tracer(None)
+        self.assertNotIn('interpret_Statements', interpreter.__dict__)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import weakref
+from syntax_tree import Node, copy_position
+from interpreter import Interpreter, BREAK, RETURN
+from closure_compiler import ClosureInterpreter
+
+# Llamadas a una función antes de compilar su cuerpo
+CALL_THRESHOLD = 8
+
+# Iteraciones de un ciclo (sumando todas sus ejecuciones) antes de compilarlo
+LOOP_THRESHOLD = 64
+
+# Ejecución por niveles: todo empieza en el intérprete de árbol, que no tiene
+# costo de compilación, y se cuentan las llamadas a cada función y las
+# iteraciones de cada ciclo. Al pasar el umbral el cuerpo se compila a
+# closures y las siguientes ejecuciones usan el código compilado. Un ciclo que
+# se vuelve caliente a mitad de camino continúa compilado desde la iteración
+# siguiente. Así un script que corre una sola vez arranca rápido y uno de
+# larga duración pasa al nivel optimizado.
+class TieredInterpreter(ClosureInterpreter):
+
+    def __init__(self):
+        super().__init__()
+        self.call_counts = weakref.WeakKeyDictionary()
+        self.loop_counts = weakref.WeakKeyDictionary()
+        self.compiled_loops = weakref.WeakKeyDictionary()
+        self.promoted = 0
+
+    def interpret_Program(self, node):
+        return Interpreter.interpret_Program(self, node)
+
+    def run_function(self, func, env):
+        code = func.code
+        if code is None:
+            body = func.body
+            code = self.compiled_bodies.get(body)
+            if code is None:
+                calls = self.call_counts[body] = self.call_counts.get(body, 0) + 1
+                if calls < CALL_THRESHOLD:
+                    return self.interpret(body)
+                code = self.compiled_bodies[body] = self.compile(body)
+                self.promoted += 1
+            func.code = code
+        return code(env)
+
+    def promote_loop(self, node, continuation):
+        # El código compilado retoma el ciclo desde la evaluación de la condición
+        code = self.compiled_loops[node] = self.compile(continuation)
+        self.promoted += 1
+        return code
+
+    def interpret_WhileStatement(self, node):
+        code = self.compiled_loops.get(node)
+        if code is not None:
+            return code(self.environment)
+        condition, body = node.children
+        budget = self.budget
+        iterations = self.loop_counts.get(node, 0)
+        while self.interpret(condition):
+            if budget is not None:
+                budget.step()
+            signal = self.interpret(body)
+            if signal is BREAK:
+                break
+            if signal is RETURN:
+                self.loop_counts[node] = iterations
+                return RETURN
+            iterations += 1
+            if iterations >= LOOP_THRESHOLD:
+                return self.promote_loop(node, node)(self.environment)
+        self.loop_counts[node] = iterations
+
+    def interpret_ForStatement(self, node):
+        init, condition, update, body = node.children
+        self.interpret(init)
+        code = self.compiled_loops.get(node)
+        if code is not None:
+            return code(self.environment)
+        budget = self.budget
+        iterations = self.loop_counts.get(node, 0)
+        while True:
+            if condition is not None and not self.interpret(condition):
+                break
+            if budget is not None:
+                budget.step()
+            signal = self.interpret(body)
+            if signal is BREAK:
+                break
+            if signal is RETURN:
+                self.loop_counts[node] = iterations
+                return RETURN
+            self.interpret(update)
+            iterations += 1
+            if iterations >= LOOP_THRESHOLD:
+                # La continuación es el mismo for sin la inicialización
+                continuation = copy_position(Node('ForStatement', [None, condition, update, body]), node)
+                return self.promote_loop(node, continuation)(self.environment)
+        self.loop_counts[node] = iterations
+
+    def interpret_CountedLoop(self, node):
+        # El for fusionado se cuenta como el for original
+        return self.interpret_ForStatement(node.children[0])
@@ -0,0 +1,140 @@
+import argparse
+import contextlib
+import io
+import sys
+from interpreter import Interpreter, ExecutionLimitExceeded
+from profiler import format_table
+
+def executable_lines(ast):
+    # Líneas con al menos una sentencia: las que puede registrar el tracer.
+    # Conviene calcularlas antes de optimizar, así el código que el optimizador
+    # elimina cuenta como no cubierto
+    lines = set()
+    pending = [ast]
+    while pending:
+        item = pending.pop()
+        if isinstance(item, (list, tuple)):
+            pending.extend(item)
+        elif hasattr(item, 'children'):
+            if item.type in ('Program', 'Statements'):
+                lines.update(child.lineno for child in item.children
+                             if child.type != 'Statements' and child.lineno is not None)
+            pending.extend(item.children)
+    return lines
+
+# Tracer de líneas para Interpreter.set_tracer. Cuenta las veces que se
+# ejecuta cada línea (cobertura) y, con un stream, escribe cada línea al
+# ejecutarla. Solo el intérprete de árbol pasa por los evaluadores trazados:
+# los backends compilados no registran nada. line es la línea de la sentencia
+# en ejecución, para no contar dos veces las que comparten línea.
+class LineTracer:
+    def __init__(self, source='', stream=None):
+        self.hits = {}
+        self.line = None
+        self.source_lines = source.splitlines()
+        self.stream = stream
+
+    def line_hit(self, node):
+        line = node.lineno
+        self.hits[line] = self.hits.get(line, 0) + 1
+        if self.stream is not None:
+            self.stream.write(f"{line:>5}: {self.source_line(line).strip()}\n")
+
+    def source_line(self, line):
+        if line is not None and 1 <= line <= len(self.source_lines):
+            return self.source_lines[line - 1]
+        return ''
+
+    def missing(self, executable):
+        return sorted(executable - self.hits.keys())
+
+    def report(self, executable):
+        covered = len(executable & self.hits.keys())
+        total = len(executable)
+        percent = 100.0 * covered / total if total else 100.0
+        lines = [f"Cobertura: {covered}/{total} líneas ({percent:.1f}%)"]
+        missing = self.missing(executable)
+        if missing:
+            lines.append("Líneas sin ejecutar: " + ", ".join(str(line) for line in missing))
+        return "\n".join(lines)
+
+    def annotate(self, executable):
+        # Código fuente con las veces que se ejecutó cada línea; ">>>>>" marca
+        # las líneas ejecutables que no se alcanzaron
+        lines = []
+        for number, text in enumerate(self.source_lines, 1):
+            if number in self.hits:
+                mark = str(self.hits[number])
+            elif number in executable:
+                mark = '>>>>>'
+            else:
+                mark = ''
+            lines.append(f"{mark:>8} {number:>5}  {text}")
+        return "\n".join(lines)
+
+def trace(ast, source='', stream=None):
+    # Ejecuta el AST en el intérprete de árbol con un LineTracer
+    tracer = LineTracer(source, stream)
+    interpreter = Interpreter()
+    interpreter.set_tracer(tracer)
+    interpreter.interpret(ast)
+    return tracer
+
+def main():
+    from parser import parser
+    from semantic_analyzer import SemanticAnalyzer
+    from optimizer import Optimizer
+    from fusion import Fuser
+
+    arg_parser = argparse.ArgumentParser(description="Cobertura de líneas de programas de JavaScript")
+    arg_parser.add_argument('files', nargs='+', help="Archivos JavaScript a ejecutar")
+    arg_parser.add_argument('--trace', action='store_true',
+                            help="Escribir en stderr cada línea al ejecutarla")
+    arg_parser.add_argument('--annotate', action='store_true',
+                            help="Mostrar el código con las veces que se ejecutó cada línea")
+    arg_parser.add_argument('--no-optimize', action='store_true', help="Ejecutar el AST sin optimizar")
+    args = arg_parser.parse_args()
+
+    rows = []
+    covered_total = executable_total = 0
+    for path in args.files:
+        with open(path, encoding='utf-8') as f:
+            source = f.read()
+        ast = parser.parse(source)
+        if ast is None:
+            raise SystemExit(f"No se pudo generar el AST de {path}")
+        analyzer = SemanticAnalyzer()
+        analyzer.analyze(ast)
+        if analyzer.get_errors():
+            # Como en main.py, un programa con errores semánticos no se ejecuta
+            rows.append([path, '-', '-', '-', f"{len(analyzer.get_errors())} errores semánticos"])
+            continue
+        executable = executable_lines(ast)
+        if not args.no_optimize:
+            ast = Fuser().fuse(Optimizer().optimize(ast))
+        tracer = LineTracer(source, sys.stderr if args.trace else None)
+        interpreter = Interpreter()
+        interpreter.set_tracer(tracer)
+        status = 'ok'
+        # La salida del programa se descarta para que el reporte sea legible
+        with contextlib.redirect_stdout(io.StringIO()):
+            try:
+                interpreter.interpret(ast)
+            except (Exception, ExecutionLimitExceeded) as e:
+                status = f"error: {e}"
+        covered = len(executable & tracer.hits.keys())
+        covered_total += covered
+        executable_total += len(executable)
+        percent = 100.0 * covered / len(executable) if executable else 100.0
+        rows.append([path, covered, len(executable), f"{percent:.1f}%", status])
+        if args.annotate:
+            print(f"=== {path} ===")
+            print(tracer.annotate(executable))
+            print()
+
+    percent = 100.0 * covered_total / executable_total if executable_total else 100.0
+    rows.append(['total', covered_total, executable_total, f"{percent:.1f}%", ''])
+    print(format_table("Cobertura de líneas", ['archivo', 'cubiertas', 'líneas', '%', 'estado'], rows))
+
+if __name__ == "__main__":
+    main()